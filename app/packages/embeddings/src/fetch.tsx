@@ -25,14 +25,77 @@ export async function fetchPlot({
   labelField,
   slices,
 }) {
-  const res = await getFetchFunction()("POST", "/embeddings/plot", {
-    datasetName,
-    brainKey,
-    view,
-    labelField,
-    slices,
-  });
-  return handleErrors(res);
+  const buffer = await getFetchFunction()(
+    "POST",
+    "/embeddings/plot",
+    {
+      datasetName,
+      brainKey,
+      view,
+      labelField,
+      slices,
+      format: "binary",
+    },
+    "arrayBuffer"
+  );
+  return handleErrors(decodePlot(buffer));
+}
+
+const ID_BYTES = 12;
+
+function decodeIds(bytes: Uint8Array, offset: number, count: number) {
+  const ids = new Array<string>(count);
+  for (let i = 0; i < count; i++) {
+    let id = "";
+    const start = offset + i * ID_BYTES;
+    for (let j = start; j < start + ID_BYTES; j++) {
+      id += bytes[j].toString(16).padStart(2, "0");
+    }
+    ids[i] = id;
+  }
+  return ids;
+}
+
+// Decodes the binary plot payload written by `encode_plot()` in
+// `fiftyone/server/routes/embeddings.py` into JSON traces
+export function decodePlot(buffer: ArrayBuffer) {
+  const headerLength = new DataView(buffer).getUint32(0, true);
+  const header = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength))
+  );
+  const { traces: traceInfos, has_sample_ids, ...plot } = header;
+  if (plot.error) {
+    return plot;
+  }
+
+  const total = traceInfos.reduce((sum, { count }) => sum + count, 0);
+  let offset = 4 + headerLength;
+  const points = new Float32Array(buffer, offset, 2 * total);
+  offset += 8 * total;
+  const bytes = new Uint8Array(buffer);
+  const ids = decodeIds(bytes, offset, total);
+  offset += ID_BYTES * total;
+  const sampleIds = has_sample_ids ? decodeIds(bytes, offset, total) : ids;
+
+  const traces = {};
+  let start = 0;
+  for (const { key, count, label, labels } of traceInfos) {
+    const trace = new Array(count);
+    for (let i = 0; i < count; i++) {
+      const idx = start + i;
+      trace[i] = {
+        points: [points[2 * idx], points[2 * idx + 1]],
+        id: ids[idx],
+        sample_id: sampleIds[idx],
+        label: labels ? labels[i] : label ?? null,
+        selected: true,
+      };
+    }
+    traces[key] = trace;
+    start += count;
+  }
+
+  return { ...plot, traces };
 }
 
 function handleErrors(res) {
@@ -8,6 +8,7 @@ See https://voxel51.com/fiftyone for more information.
 |
 """
 from pkgutil import extend_path as _extend_path
+import importlib as _importlib
 import os as _os
 
 #
@@ -23,13 +24,66 @@ import fiftyone.constants as _foc
 __version__ = _foc.VERSION
 
 from fiftyone.__public__ import *
+import fiftyone.__public__ as _fop
 
 import fiftyone.core.uid as _fou
 import fiftyone.core.logging as _fol
-import fiftyone.migrations as _fom
 
 _fol.init_logging()
 
+#
+# The database connection is established, and the database is migrated if
+# necessary, the first time that the database is used
+#
 if _os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
-    _fom.migrate_database_if_necessary()
     _fou.log_import_if_allowed()
+
+
+#
+# Subpackages that are available as attributes of this package, eg
+# `fo.types.FiftyOneDataset`, but that are only imported on first access
+#
+_LAZY_SUBPACKAGES = (
+    "brain",
+    "operators",
+    "plugins",
+    "server",
+    "types",
+    "utils",
+    "zoo",
+)
+
+#
+# Lightweight subpackages that are imported by `from fiftyone import *`
+#
+_STAR_SUBPACKAGES = ("types", "utils", "zoo")
+
+__all__ = sorted(
+    set(n for n in globals() if not n.startswith("_"))
+    | set(_fop._LAZY_ATTRS)
+    | set(_STAR_SUBPACKAGES)
+)
+
+
+def __getattr__(name):
+    # Expensive public attributes are imported lazily on first access
+    if name in _fop._LAZY_ATTRS:
+        value = getattr(_fop, name)
+        globals()[name] = value
+        return value
+
+    if name in _LAZY_SUBPACKAGES:
+        try:
+            return _importlib.import_module(__name__ + "." + name)
+        except ModuleNotFoundError as e:
+            # Optional subpackages such as `fiftyone.brain` may not exist
+            if e.name != __name__ + "." + name:
+                raise
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | set(_fop._LAZY_ATTRS) | set(_LAZY_SUBPACKAGES)
+    )
@@ -5,15 +5,14 @@ FiftyOne's public interface.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import importlib as _importlib
+
 import fiftyone.core.config as _foc
-import fiftyone.core.odm as _foo
 
 config = _foc.load_config()
 annotation_config = _foc.load_annotation_config()
 app_config = _foc.load_app_config()
 
-_foo.establish_db_conn(config)
-
 from .core.aggregations import (
     Aggregation,
     Bounds,
@@ -114,18 +113,6 @@ from .core.metadata import (
     ImageMetadata,
     VideoMetadata,
 )
-from .core.models import (
-    apply_model,
-    compute_embeddings,
-    compute_patch_embeddings,
-    load_model,
-    Model,
-    ModelConfig,
-    EmbeddingsMixin,
-    TorchModelMixin,
-    ModelManagerConfig,
-    ModelManager,
-)
 from .core.odm import (
     ColorScheme,
     DatasetAppConfig,
@@ -134,22 +121,6 @@ from .core.odm import (
     KeypointSkeleton,
     SidebarGroupDocument,
 )
-from .core.plots import (
-    plot_confusion_matrix,
-    plot_pr_curve,
-    plot_pr_curves,
-    plot_roc_curve,
-    lines,
-    scatterplot,
-    location_scatterplot,
-    Plot,
-    ResponsivePlot,
-    InteractivePlot,
-    ViewPlot,
-    ViewGrid,
-    CategoricalHistogram,
-    NumericalHistogram,
-)
 from .core.sample import Sample
 from .core.spaces import (
     Space,
@@ -198,11 +169,6 @@ from .core.stages import (
     ToTrajectories,
     ToFrames,
 )
-from .core.session import (
-    close_app,
-    launch_app,
-    Session,
-)
 from .core.utils import (
     disable_progress_bars,
     pprint,
@@ -210,17 +176,61 @@ from .core.utils import (
     ProgressBar,
 )
 from .core.view import DatasetView
-from .utils.eval.classification import (
-    evaluate_classifications,
-    ClassificationResults,
-    BinaryClassificationResults,
-)
-from .utils.eval.detection import (
-    evaluate_detections,
-    DetectionResults,
-)
-from .utils.eval.segmentation import (
-    evaluate_segmentations,
-    SegmentationResults,
-)
-from .utils.quickstart import quickstart
+
+#
+# The following attributes are imported lazily on first access, since the
+# modules that provide them are expensive to import
+#
+_LAZY_ATTRS = {
+    "apply_model": "fiftyone.core.models",
+    "compute_embeddings": "fiftyone.core.models",
+    "compute_patch_embeddings": "fiftyone.core.models",
+    "load_model": "fiftyone.core.models",
+    "Model": "fiftyone.core.models",
+    "ModelConfig": "fiftyone.core.models",
+    "EmbeddingsMixin": "fiftyone.core.models",
+    "TorchModelMixin": "fiftyone.core.models",
+    "ModelManagerConfig": "fiftyone.core.models",
+    "ModelManager": "fiftyone.core.models",
+    "plot_confusion_matrix": "fiftyone.core.plots",
+    "plot_pr_curve": "fiftyone.core.plots",
+    "plot_pr_curves": "fiftyone.core.plots",
+    "plot_roc_curve": "fiftyone.core.plots",
+    "lines": "fiftyone.core.plots",
+    "scatterplot": "fiftyone.core.plots",
+    "location_scatterplot": "fiftyone.core.plots",
+    "Plot": "fiftyone.core.plots",
+    "ResponsivePlot": "fiftyone.core.plots",
+    "InteractivePlot": "fiftyone.core.plots",
+    "ViewPlot": "fiftyone.core.plots",
+    "ViewGrid": "fiftyone.core.plots",
+    "CategoricalHistogram": "fiftyone.core.plots",
+    "NumericalHistogram": "fiftyone.core.plots",
+    "close_app": "fiftyone.core.session",
+    "launch_app": "fiftyone.core.session",
+    "Session": "fiftyone.core.session",
+    "evaluate_classifications": "fiftyone.utils.eval.classification",
+    "ClassificationResults": "fiftyone.utils.eval.classification",
+    "BinaryClassificationResults": "fiftyone.utils.eval.classification",
+    "evaluate_detections": "fiftyone.utils.eval.detection",
+    "DetectionResults": "fiftyone.utils.eval.detection",
+    "evaluate_segmentations": "fiftyone.utils.eval.segmentation",
+    "SegmentationResults": "fiftyone.utils.eval.segmentation",
+    "quickstart": "fiftyone.utils.quickstart",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name, None)
+    if module is None:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -129,6 +129,14 @@ class Aggregation(object):
         """
         return False
 
+    @property
+    def _streams_big_result(self):
+        """Whether the aggregation has big results and its
+        :meth:`parse_result` method can consume the result documents directly
+        from a database cursor, rather than a fully materialized list.
+        """
+        return False
+
     def to_mongo(self, sample_collection, context=None):
         """Returns the MongoDB aggregation pipeline for this aggregation.
 
@@ -2541,6 +2549,18 @@ class Values(Aggregation):
         unwind (False): whether to automatically unwind all recognized list
             fields (True) or unwind all list fields except the top-level sample
             field (-1)
+        as_array (False): whether to return the values as a numpy array whose
+            first dimension indexes the samples. Only applicable to numeric,
+            :class:`fiftyone.core.fields.VectorField`, and
+            :class:`fiftyone.core.fields.ArrayField` fields whose values all
+            have the same shape, and which are not nested in list fields. If
+            any values are missing and no ``missing_value`` is provided, a
+            ``numpy.ma.MaskedArray`` whose mask indicates the missing rows is
+            returned
+        mmap_path (None): an optional path to a ``.npy`` file to which to
+            write the array via ``numpy.lib.format.open_memmap()`` rather
+            than storing it in memory. Only applicable when ``as_array`` is
+            True
     """
 
     def __init__(
@@ -2549,6 +2569,8 @@ class Values(Aggregation):
         expr=None,
         missing_value=None,
         unwind=False,
+        as_array=False,
+        mmap_path=None,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -2557,6 +2579,8 @@ class Values(Aggregation):
         super().__init__(field_or_expr, expr=expr)
         self._missing_value = missing_value
         self._unwind = unwind
+        self._as_array = as_array
+        self._mmap_path = mmap_path
         self._allow_missing = _allow_missing
         self._big_result = _big_result
         self._raw = _raw
@@ -2565,6 +2589,7 @@ class Values(Aggregation):
         self._big_field = None
         self._manual_field = _field
         self._num_list_fields = None
+        self._num_rows = None
 
     def _kwargs(self):
         return [
@@ -2572,6 +2597,8 @@ class Values(Aggregation):
             ["expr", self._expr],
             ["missing_value", self._missing_value],
             ["unwind", self._unwind],
+            ["as_array", self._as_array],
+            ["mmap_path", self._mmap_path],
             ["_allow_missing", self._allow_missing],
             ["_big_result", self._big_result],
             ["_raw", self._raw],
@@ -2585,18 +2612,26 @@ class Values(Aggregation):
     def _is_big_batchable(self):
         return (
             self._big_result
+            and not self._as_array
             and not self._unwind
             and self._expr is None
             and self._field_name is not None
             and "[]" not in self._field_name
         )
 
+    @property
+    def _streams_big_result(self):
+        return self._big_result and self._as_array
+
     def default_result(self):
         """Returns the default result for this aggregation.
 
         Returns:
-            ``[]``
+            ``[]``, or an empty array when ``as_array`` is True
         """
+        if self._as_array:
+            return self._parse_array([])
+
         return []
 
     def parse_result(self, d):
@@ -2608,6 +2643,14 @@ class Values(Aggregation):
         Returns:
             the list of field values
         """
+        if self._as_array:
+            if self._big_result:
+                values = (di[self._big_field] for di in d)
+            else:
+                values = d["values"]
+
+            return self._parse_array(values)
+
         if self._big_result:
             values = [di[self._big_field] for di in d]
         else:
@@ -2644,12 +2687,28 @@ class Values(Aggregation):
         self._big_field = big_field
         self._num_list_fields = len(list_fields)
 
+        if self._as_array:
+            if list_fields:
+                raise ValueError(
+                    "Cannot extract values of field '%s' as an array because "
+                    "it is nested in list field(s) %s"
+                    % (self._field_name, list_fields)
+                )
+
+            # Missing values are populated when parsing the array
+            missing_value = None
+
+            # Used to preallocate the output array
+            self._num_rows = len(sample_collection)
+        else:
+            missing_value = self._missing_value
+
         pipeline.extend(
             _make_extract_values_pipeline(
                 path,
                 list_fields,
                 id_to_str,
-                self._missing_value,
+                missing_value,
                 self._big_result,
                 big_field,
             )
@@ -2657,6 +2716,105 @@ class Values(Aggregation):
 
         return pipeline
 
+    def _parse_array(self, values):
+        if self._field is not None and not self._raw:
+            fcn = self._field.to_python
+        else:
+            fcn = None
+
+        num_rows = self._num_rows or 0
+        array = None
+        missing = []
+        num = 0
+
+        for idx, value in enumerate(values):
+            num = idx + 1
+
+            if value is None:
+                missing.append(idx)
+                continue
+
+            if fcn is not None:
+                value = fcn(value)
+
+            if array is None:
+                value = np.asarray(value)
+                if value.dtype.kind not in ("b", "i", "u", "f"):
+                    raise ValueError(
+                        "Cannot extract values of field '%s' as an array "
+                        "because it contains non-numeric values of type %s"
+                        % (self._field_name, value.dtype)
+                    )
+
+                shape = (max(num_rows, idx + 1),) + value.shape
+                array = self._allocate_array(shape, value.dtype)
+            elif idx >= len(array):
+                array = self._grow_array(array, idx + 1)
+
+            try:
+                array[idx] = value
+            except ValueError as e:
+                raise ValueError(
+                    "Cannot extract values of field '%s' as an array because "
+                    "its values do not all have the same shape: %s"
+                    % (self._field_name, e)
+                )
+
+        if array is None:
+            # All values are missing, so there is no dtype/shape to infer
+            if self._missing_value is not None:
+                value = np.asarray(self._missing_value)
+            else:
+                value = np.asarray(np.nan)
+
+            array = self._allocate_array((num,) + value.shape, value.dtype)
+        elif num < len(array):
+            array = self._shrink_array(array, num)
+
+        if missing and self._missing_value is not None:
+            array[missing] = self._missing_value
+            missing = []
+
+        if self._mmap_path is not None:
+            array.flush()
+
+        if not missing:
+            return array
+
+        mask = np.zeros(array.shape, dtype=bool)
+        mask[missing] = True
+        return np.ma.MaskedArray(array, mask=mask, copy=False)
+
+    def _allocate_array(self, shape, dtype):
+        if self._mmap_path is None:
+            return np.zeros(shape, dtype=dtype)
+
+        etau.ensure_basedir(self._mmap_path)
+        return np.lib.format.open_memmap(
+            self._mmap_path, mode="w+", dtype=dtype, shape=shape
+        )
+
+    def _grow_array(self, array, num):
+        if self._mmap_path is not None:
+            raise ValueError(
+                "Found more than the expected %d values when writing to '%s'"
+                % (len(array), self._mmap_path)
+            )
+
+        shape = (max(num, 2 * len(array)),) + array.shape[1:]
+        new_array = np.zeros(shape, dtype=array.dtype)
+        new_array[: len(array)] = array
+        return new_array
+
+    def _shrink_array(self, array, num):
+        if self._mmap_path is not None:
+            raise ValueError(
+                "Found fewer than the expected %d values when writing to '%s'"
+                % (len(array), self._mmap_path)
+            )
+
+        return array[:num]
+
 
 class _AggregationRepr(reprlib.Repr):
     def repr_ViewExpression(self, expr, level):
@@ -2748,6 +2748,9 @@ class DelegatedLaunchCommand(Command):
 
         # Launch a local service
         fiftyone delegated launch
+
+        # Launch a local service that runs up to 4 operations concurrently
+        fiftyone delegated launch --num-workers 4
     """
 
     @staticmethod
@@ -2759,6 +2762,17 @@ class DelegatedLaunchCommand(Command):
             metavar="TYPE",
             help="the type of service to launch. The default is 'local'",
         )
+        parser.add_argument(
+            "-n",
+            "--num-workers",
+            default=None,
+            type=int,
+            metavar="NUM_WORKERS",
+            help=(
+                "the number of worker processes to use to execute operations "
+                "concurrently. By default, operations are executed serially"
+            ),
+        )
 
     @staticmethod
     def execute(parser, args):
@@ -2770,10 +2784,10 @@ class DelegatedLaunchCommand(Command):
             )
 
         if args.type == "local":
-            _launch_delegated_local()
+            _launch_delegated_local(num_workers=args.num_workers)
 
 
-def _launch_delegated_local():
+def _launch_delegated_local(num_workers=None):
     from fiftyone.core.session.session import _WELCOME_MESSAGE
 
     try:
@@ -2783,7 +2797,7 @@ def _launch_delegated_local():
         print("Delegated operation service running")
         print("\nTo exit, press ctrl + c")
         while True:
-            dos.execute_queued_operations(log=True)
+            dos.execute_queued_operations(log=True, num_workers=num_workers)
             time.sleep(1)
     except KeyboardInterrupt:
         pass
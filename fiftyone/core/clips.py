@@ -52,9 +52,11 @@ class ClipView(fos.SampleView):
                 "Clips views do not support save contexts"
             )
 
-        super()._save(deferred=deferred)
+        ops = super()._save(deferred=deferred)
         self._view._sync_source_sample(self)
 
+        return ops
+
 
 class ClipsView(fov.DatasetView):
     """A :class:`fiftyone.core.view.DatasetView` of clips from a video
@@ -92,6 +94,7 @@ class ClipsView(fov.DatasetView):
         self._source_collection = source_collection
         self._clips_stage = clips_stage
         self._clips_dataset = clips_dataset
+        self._stage_pipelines_cache = None
         self.__stages = _stages
         self.__name = _name
 
@@ -456,6 +459,7 @@ class TrajectoriesView(ClipsView):
         self._source_collection = source_collection
         self._clips_stage = clips_stage
         self._clips_dataset = clips_dataset
+        self._stage_pipelines_cache = None
         self.__stages = _stages
         self.__name = _name
 
@@ -6,6 +6,7 @@ Interface for sample collections.
 |
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 import fnmatch
 import itertools
@@ -34,13 +35,13 @@ import fiftyone.core.groups as fog
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
 import fiftyone.core.metadata as fomt
-import fiftyone.core.models as fomo
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fosa
 import fiftyone.core.storage as fost
 import fiftyone.core.utils as fou
 
 fod = fou.lazy_import("fiftyone.core.dataset")
+fomo = fou.lazy_import("fiftyone.core.models")
 fos = fou.lazy_import("fiftyone.core.stages")
 fov = fou.lazy_import("fiftyone.core.view")
 foua = fou.lazy_import("fiftyone.utils.annotations")
@@ -81,14 +82,18 @@ class SaveContext(object):
         batch_size (None): the batching strategy to use. Can either be an
             integer specifying the number of samples to save in a batch, or a
             float number of seconds between batched saves
+        async_writes (False): whether to write each batch to the database in
+            a background thread, so that the writes can overlap with
+            subsequent work. At most one batch is written at a time
     """
 
-    def __init__(self, sample_collection, batch_size=None):
+    def __init__(self, sample_collection, batch_size=None, async_writes=False):
         if batch_size is None:
             batch_size = 0.2
 
         self.sample_collection = sample_collection
         self.batch_size = batch_size
+        self.async_writes = async_writes
 
         self._dataset = sample_collection._dataset
         self._sample_coll = sample_collection._dataset._sample_collection
@@ -102,15 +107,35 @@ class SaveContext(object):
         self._dynamic_batches = not isinstance(batch_size, numbers.Integral)
         self._last_time = None
 
+        self._executor = None
+        self._write_future = None
+        self._write_reload_parents = []
+
     def __enter__(self):
         if self._dynamic_batches:
             self._last_time = timeit.default_timer()
 
+        if self.async_writes:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        # Any sample saves within this context, including direct calls to
+        # `sample.save()`, increment the dataset's revision once per batch
+        self._dataset._revision_deferred += 1
+
         self._curr_batch_size = 0
         return self
 
     def __exit__(self, *args):
-        self._save_batch()
+        try:
+            self._save_batch()
+            self._wait_for_writes()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+            self._dataset._revision_deferred -= 1
+            self._dataset._flush_revision()
 
     def save(self, sample):
         """Registers the sample for saving in the next batch.
@@ -149,19 +174,53 @@ class SaveContext(object):
     def _save_batch(self):
         self._curr_batch_size = 0
 
-        if self._sample_ops:
-            foo.bulk_write(self._sample_ops, self._sample_coll, ordered=False)
+        if self._executor is None:
+            self._write_batch(self._sample_ops, self._frame_ops)
             self._sample_ops.clear()
-
-        if self._frame_ops:
-            foo.bulk_write(self._frame_ops, self._frame_coll, ordered=False)
             self._frame_ops.clear()
+            self._reload(self._reload_parents)
+            return
+
+        # Only one batch may be in flight at a time
+        self._wait_for_writes()
+
+        if self._sample_ops or self._frame_ops:
+            self._write_future = self._executor.submit(
+                self._write_batch, self._sample_ops, self._frame_ops
+            )
+            self._sample_ops = []
+            self._frame_ops = []
+
+        self._write_reload_parents = self._reload_parents
+        self._reload_parents = []
+
+    def _wait_for_writes(self):
+        if self._write_future is not None:
+            future = self._write_future
+            self._write_future = None
+            future.result()
+
+        # In-memory samples are reloaded in the calling thread
+        self._reload(self._write_reload_parents)
 
-        if self._reload_parents:
-            for sample in self._reload_parents:
+    def _write_batch(self, sample_ops, frame_ops):
+        if sample_ops:
+            foo.bulk_write(sample_ops, self._sample_coll, ordered=False)
+
+        if frame_ops:
+            foo.bulk_write(frame_ops, self._frame_coll, ordered=False)
+
+        if sample_ops or frame_ops:
+            self._dataset._revision_pending = True
+
+        self._dataset._flush_revision()
+
+    def _reload(self, samples):
+        if samples:
+            for sample in samples:
                 sample._reload_parents()
 
-            self._reload_parents.clear()
+            samples.clear()
 
 
 class SampleCollection(object):
@@ -885,7 +944,7 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement get_group()")
 
-    def save_context(self, batch_size=None):
+    def save_context(self, batch_size=None, async_writes=False):
         """Returns a context that can be used to save samples from this
         collection according to a configurable batching strategy.
 
@@ -923,11 +982,16 @@ class SampleCollection(object):
             batch_size (None): the batching strategy to use. Can either be an
                 integer specifying the number of samples to save in a batch, or
                 a float number of seconds between batched saves
+            async_writes (False): whether to write each batch to the database
+                in a background thread, so that the writes can overlap with
+                subsequent work. At most one batch is written at a time
 
         Returns:
             a :class:`SaveContext`
         """
-        return SaveContext(self, batch_size=batch_size)
+        return SaveContext(
+            self, batch_size=batch_size, async_writes=async_writes
+        )
 
     def _get_default_sample_fields(
         self,
@@ -2719,9 +2783,11 @@ class SampleCollection(object):
                 has logits, ``model.has_logits == True``
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images. For Torch-based models, this is the number of workers
+                for the :class:`torch:torch.utils.data.DataLoader`. For other
+                models applied to image collections, this is the number of
+                threads used to prefetch images while the model is running
             skip_failures (True): whether to gracefully continue without
                 raising an error if predictions cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
@@ -2793,9 +2859,11 @@ class SampleCollection(object):
                 "frames." prefix is optional
             batch_size (None): an optional batch size to use, if the model
                 supports batching
-            num_workers (None): the number of workers for the
-                :class:`torch:torch.utils.data.DataLoader` to use. Only
-                applicable for Torch-based models
+            num_workers (None): the number of workers to use when loading
+                images. For Torch-based models, this is the number of workers
+                for the :class:`torch:torch.utils.data.DataLoader`. For other
+                models applied to image collections, this is the number of
+                threads used to prefetch images while the model is running
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
@@ -3068,6 +3136,8 @@ class SampleCollection(object):
         use_boxes=False,
         classwise=True,
         dynamic=True,
+        num_workers=None,
+        batch_size=None,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -3160,6 +3230,18 @@ class SampleCollection(object):
                 label (True) or allow matches between classes (False)
             dynamic (True): whether to declare the dynamic object-level
                 attributes that are populated on the dataset's schema
+            num_workers (None): an optional number of worker processes to use.
+                If more than one worker is requested, the collection is split
+                into shards of contiguous sample IDs that are evaluated in
+                parallel. In this case, the ``ytrue`` and ``ypred`` of the
+                results are ordered by sample ID range rather than by the
+                order of the samples in the collection. By default, evaluation
+                is performed in the main process
+            batch_size (None): a batch size to use when saving evaluation
+                results to the database. Can either be an integer specifying
+                the number of samples to save in a batch, or a float number of
+                seconds between batched saves. Only applicable when an
+                ``eval_key`` is provided
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -3180,6 +3262,8 @@ class SampleCollection(object):
             use_boxes=use_boxes,
             classwise=classwise,
             dynamic=dynamic,
+            num_workers=num_workers,
+            batch_size=batch_size,
             **kwargs,
         )
 
@@ -3190,6 +3274,7 @@ class SampleCollection(object):
         eval_key=None,
         mask_targets=None,
         method="simple",
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified semantic segmentation masks in this
@@ -3240,6 +3325,9 @@ class SampleCollection(object):
                 labels
             method ("simple"): a string specifying the evaluation method to
                 use. Supported values are ``("simple")``
+            num_workers (None): the number of worker threads to use to load
+                and evaluate masks. By default,
+                ``multiprocessing.cpu_count()`` is used
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.segmentation.SegmentationEvaluationConfig`
                 being used
@@ -3254,6 +3342,7 @@ class SampleCollection(object):
             eval_key=eval_key,
             mask_targets=mask_targets,
             method=method,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -5967,7 +6056,7 @@ class SampleCollection(object):
         )
 
     @view_stage
-    def shuffle(self, seed=None):
+    def shuffle(self, seed=None, use_index=False):
         """Randomly shuffles the samples in the collection.
 
         Examples::
@@ -6005,14 +6094,30 @@ class SampleCollection(object):
 
             view = dataset.shuffle(seed=51)
 
+            #
+            # Shuffle the samples by scanning an index rather than sorting the
+            # entire collection
+            #
+
+            view = dataset.shuffle(seed=51, use_index=True)
+
         Args:
             seed (None): an optional random seed to use when shuffling the
                 samples
+            use_index (False): whether to generate the shuffled order by
+                scanning an index on the samples' random values rather than
+                sorting the entire collection. This is much faster for large
+                datasets, but the shuffled order is a rotation of a fixed
+                random order determined by ``seed``. This option only applies
+                when shuffling an entire non-generated, non-video, non-grouped
+                dataset; otherwise the default behavior is used
 
         Returns:
             a :class:`fiftyone.core.view.DatasetView`
         """
-        return self._add_view_stage(fos.Shuffle(seed=seed))
+        return self._add_view_stage(
+            fos.Shuffle(seed=seed, use_index=use_index)
+        )
 
     @view_stage
     def skip(self, skip):
@@ -6214,7 +6319,7 @@ class SampleCollection(object):
         )
 
     @view_stage
-    def take(self, size, seed=None):
+    def take(self, size, seed=None, use_index=False):
         """Randomly samples the given number of samples from the collection.
 
         Examples::
@@ -6255,16 +6360,32 @@ class SampleCollection(object):
 
             view = dataset.take(2, seed=51)
 
+            #
+            # Take two random samples via index seeks rather than sorting the
+            # entire collection
+            #
+
+            view = dataset.take(2, seed=51, use_index=True)
+
         Args:
             size: the number of samples to return. If a non-positive number is
                 provided, an empty view is returned
             seed (None): an optional random seed to use when selecting the
                 samples
+            use_index (False): whether to select the samples via range seeks
+                on an index of the samples' random values rather than sorting
+                the entire collection. This is much faster for large datasets,
+                but the samples are a contiguous run of a fixed random order
+                determined by ``seed``. This option only applies when sampling
+                from an entire non-generated, non-video, non-grouped dataset;
+                otherwise the default behavior is used
 
         Returns:
             a :class:`fiftyone.core.view.DatasetView`
         """
-        return self._add_view_stage(fos.Take(size, seed=seed))
+        return self._add_view_stage(
+            fos.Take(size, seed=seed, use_index=use_index)
+        )
 
     @view_stage
     def to_patches(self, field, **kwargs):
@@ -7713,6 +7834,8 @@ class SampleCollection(object):
         expr=None,
         missing_value=None,
         unwind=False,
+        as_array=False,
+        mmap_path=None,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -7788,6 +7911,18 @@ class SampleCollection(object):
             values = dataset.values(2 * (F("numeric_field") + 1))
             print(values)  # [4.0, 10.0, None]
 
+            #
+            # Get values as a numpy array
+            #
+
+            values = dataset.values("numeric_field", as_array=True)
+            print(values)  # [1.0 4.0 --]
+
+            values = dataset.values(
+                "numeric_field", missing_value=0, as_array=True
+            )
+            print(values)  # [1. 4. 0.]
+
             #
             # Get values from a label list field
             #
@@ -7820,15 +7955,29 @@ class SampleCollection(object):
             unwind (False): whether to automatically unwind all recognized list
                 fields (True) or unwind all list fields except the top-level
                 sample field (-1)
+            as_array (False): whether to return the values as a numpy array
+                whose first dimension indexes the samples. Only applicable to
+                numeric, :class:`fiftyone.core.fields.VectorField`, and
+                :class:`fiftyone.core.fields.ArrayField` fields whose values
+                all have the same shape, and which are not nested in list
+                fields. If any values are missing and no ``missing_value`` is
+                provided, a ``numpy.ma.MaskedArray`` whose mask indicates the
+                missing rows is returned
+            mmap_path (None): an optional path to a ``.npy`` file to which to
+                write the array via ``numpy.lib.format.open_memmap()`` rather
+                than storing it in memory. Only applicable when ``as_array``
+                is True
 
         Returns:
-            the list of values
+            the list of values, or a numpy array when ``as_array`` is True
         """
         make = lambda field_or_expr: foa.Values(
             field_or_expr,
             expr=expr,
             missing_value=missing_value,
             unwind=unwind,
+            as_array=as_array,
+            mmap_path=mmap_path,
             _allow_missing=_allow_missing,
             _big_result=_big_result,
             _raw=_raw,
@@ -7931,6 +8080,7 @@ class SampleCollection(object):
         label_field=None,
         frame_labels_field=None,
         overwrite=False,
+        num_workers=None,
         **kwargs,
     ):
         """Exports the samples in the collection to disk.
@@ -8104,6 +8254,11 @@ class SampleCollection(object):
             overwrite (False): whether to delete existing directories before
                 performing the export (True) or to merge the export with
                 existing files and directories (False)
+            num_workers (None): a number of worker threads to use to transfer
+                media files in the background while labels are being exported.
+                Only applicable to dataset exporters that support this
+                parameter, which includes all builtin exporters that export
+                media. By default, media files are transferred synchronously
             **kwargs: optional keyword arguments to pass to the dataset
                 exporter's constructor. If you are exporting image patches,
                 this can also contain keyword arguments for
@@ -8129,6 +8284,7 @@ class SampleCollection(object):
             label_field=label_field,
             frame_labels_field=frame_labels_field,
             overwrite=overwrite,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -8979,8 +9135,12 @@ class SampleCollection(object):
 
         # Parse big results
         for idx, aggregation in big_aggs.items():
-            result = list(_results[idx_map[idx]])
-            results[idx] = self._parse_big_result(aggregation, result)
+            result = _results[idx_map[idx]]
+            if aggregation._streams_big_result:
+                results[idx] = aggregation.parse_result(result)
+            else:
+                result = list(result)
+                results[idx] = self._parse_big_result(aggregation, result)
 
         # Parse facet-able results
         for idx, aggregation in compiled_facet_aggs.items():
@@ -7,15 +7,10 @@ Context utilities.
 """
 import json
 import os
+import sys
 import typing as t
 from urllib.parse import urlparse
 
-try:
-    import IPython.display
-except:
-    pass
-
-
 _COLAB = "COLAB"
 _DATABRICKS = "DATABRICKS"
 _IPYTHON = "IPYTHON"
@@ -90,6 +85,13 @@ def _get_context():
         _context = os.environ["FIFTYONE_CONTEXT"]
         return _context
 
+    # All notebook contexts below require a running IPython shell, which
+    # implies that IPython has already been imported
+    if "IPython" not in sys.modules:
+        _context = _NONE
+        os.environ["FIFTYONE_CONTEXT"] = _context
+        return _context
+
     # In Colab, the `google.colab` module is available, but the shell returned
     # by `IPython.get_ipython` does not have a `get_trait` method.
     try:
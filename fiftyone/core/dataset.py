@@ -15,6 +15,8 @@ import numbers
 import os
 import random
 import string
+import threading
+import timeit
 
 from bson import json_util, ObjectId, DBRef
 import cachetools
@@ -52,6 +54,9 @@ foud = fou.lazy_import("fiftyone.utils.data")
 
 logger = logging.getLogger(__name__)
 
+# Revision increments from document saves within this interval are coalesced
+_REVISION_DEBOUNCE_SECS = 0.1
+
 
 def list_datasets(glob_patt=None, info=False):
     """Lists the available FiftyOne datasets.
@@ -261,6 +266,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if name is None and _create:
             name = get_default_dataset_name()
 
+        self._revision_deferred = 0
+        self._revision_pending = False
+        self._revision_lock = threading.Lock()
+        self._revision_timer = None
+        self._revision_time = None
+
         if overwrite and dataset_exists(name):
             delete_dataset(name)
 
@@ -1823,6 +1834,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._sample_doc_cls._clear_fields(sample_collection, field_names)
 
         fos.Sample._reload_docs(self._sample_collection_name)
+        self._update_revision()
 
     def _clear_frame_fields(self, field_names, view=None):
         sample_collection = self if view is None else view
@@ -1835,6 +1847,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._frame_doc_cls._clear_fields(sample_collection, field_names)
 
         fofr.Frame._reload_docs(self._frame_collection_name)
+        self._update_revision()
 
     def delete_sample_field(self, field_name, error_level=0):
         """Deletes the field from all samples in the dataset.
@@ -2535,11 +2548,14 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         return self.skip(num_samples).values("id")
 
     def _add_samples_batch(self, samples, expand_schema, dynamic, validate):
-        samples = [s.copy() if s._in_db else s for s in samples]
-
         if self.media_type is None and samples:
             self.media_type = _get_media_type(samples[0])
 
+        if expand_schema:
+            self._expand_codec_schema(samples)
+
+        samples = [s.copy() if s._in_db else s for s in samples]
+
         if expand_schema:
             self._expand_schema(samples, dynamic)
 
@@ -2559,7 +2575,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             doc = self._sample_dict_to_doc(d)
             sample._set_backing_doc(doc, dataset=self)
             if sample.media_type == fom.VIDEO:
-                sample.frames.save()
+                sample.frames._save()
+
+        self._update_revision()
 
         return [str(d["_id"]) for d in dicts]
 
@@ -2598,6 +2616,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             self.media_type = _get_media_type(samples[0])
 
         if expand_schema:
+            self._expand_codec_schema(samples)
             self._expand_schema(samples, dynamic)
 
         if validate:
@@ -2622,7 +2641,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             sample._set_backing_doc(doc, dataset=self)
 
             if sample.media_type == fom.VIDEO:
-                sample.frames.save()
+                sample.frames._save()
+
+        self._update_revision()
 
     def _make_dict(self, sample, include_id=False):
         d = sample.to_mongo_dict(include_id=include_id)
@@ -2632,10 +2653,29 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         # because None and missing are equivalent in our data model
         d = {k: v for k, v in d.items() if v is not None}
 
+        self._encode_array_fields(sample, d)
+
         d["_dataset_id"] = self._doc.id
 
         return d
 
+    def _encode_array_fields(self, document, d, frames=False):
+        # In-memory documents always serialize arrays with the default codec,
+        # so we must re-encode fields that declare a different one
+        if frames:
+            doc_cls = self._frame_doc_cls
+        else:
+            doc_cls = self._sample_doc_cls
+
+        for field in doc_cls._fields.values():
+            if (
+                isinstance(field, (fof.VectorField, fof.ArrayField))
+                and field.codec is not None
+                and d.get(field.db_field, None) is not None
+            ):
+                value = document.get_field(field.name)
+                d[field.db_field] = field.to_mongo(value)
+
     def _bulk_write(self, ops, frames=False, ordered=False):
         if frames:
             coll = self._frame_collection
@@ -2649,6 +2689,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         else:
             fos.Sample._reload_docs(self._sample_collection_name)
 
+        self._update_revision()
+
     def _merge_doc(
         self,
         doc,
@@ -3192,6 +3234,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             foo.bulk_write(frame_ops, self._frame_collection)
             fofr.Frame._reload_docs(self._frame_collection_name)
 
+        self._update_revision()
+
     def _delete_labels(self, labels, fields=None):
         if etau.is_str(fields):
             fields = [fields]
@@ -3302,6 +3346,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 self._frame_collection_name, sample_ids=sample_ids
             )
 
+        if sample_ops or frame_ops:
+            self._update_revision()
+
     @deprecated(reason="Use delete_samples() instead")
     def remove_sample(self, sample_or_id):
         """Removes the given sample from the dataset.
@@ -3707,6 +3754,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if contains_videos:
             self._clear_frames(sample_ids=sample_ids)
 
+        self._update_revision()
+
     def _clear_groups(self, view=None, group_ids=None):
         if self.group_field is None:
             raise ValueError("%s has no group field" % type(self))
@@ -3792,6 +3841,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             fofr.Frame._reset_docs_by_frame_id(
                 self._frame_collection_name, frame_ids
             )
+            self._update_revision()
             return
 
         if view is not None:
@@ -3810,6 +3860,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             self._frame_collection_name, sample_ids=sample_ids
         )
 
+        self._update_revision()
+
     def _keep_frames(self, view=None, frame_ids=None):
         sample_collection = view if view is not None else self
         if not sample_collection._contains_videos(any_slice=True):
@@ -3833,6 +3885,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             fofr.Frame._reset_docs_by_frame_id(
                 self._frame_collection_name, frame_ids, keep=True
             )
+            self._update_revision()
             return
 
         if view is None:
@@ -3863,6 +3916,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 self._frame_collection_name, sample_id, fns, keep=True
             )
 
+        self._update_revision()
+
     def ensure_frames(self):
         """Ensures that the video dataset contains frame instances for every
         frame of each sample's source video.
@@ -3914,6 +3969,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             ]
         )
 
+        self._update_revision()
+
     def delete(self):
         """Deletes the dataset.
 
@@ -6374,6 +6431,33 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if expanded:
             self._reload()
 
+    def _expand_codec_schema(self, samples):
+        # Array codecs cannot be inferred from values, so we copy any array
+        # fields that declare a codec from the datasets of the input samples
+        datasets = {}
+        for sample in samples:
+            dataset = sample._dataset
+            if sample._in_db and dataset is not None and dataset is not self:
+                datasets[dataset._doc.id] = dataset
+
+        expanded = False
+        for dataset in datasets.values():
+            expanded |= _merge_codec_fields(
+                self._sample_doc_cls,
+                dataset.get_field_schema(include_private=True),
+                self.get_field_schema(include_private=True),
+            )
+
+            if dataset._has_frame_fields() and self._has_frame_fields():
+                expanded |= _merge_codec_fields(
+                    self._frame_doc_cls,
+                    dataset.get_frame_field_schema(include_private=True),
+                    self.get_frame_field_schema(include_private=True),
+                )
+
+        if expanded:
+            self._reload()
+
     def _expand_group_schema(self, field_name, slice_name, media_type):
         if self.group_field is not None and field_name != self.group_field:
             raise ValueError("Dataset has no group field '%s'" % field_name)
@@ -6554,6 +6638,68 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._doc.last_loaded_at = datetime.utcnow()
         self.save()
 
+    def _update_revision(self, debounce=False):
+        # Within save contexts, the revision is incremented once per batch
+        # rather than once per modification
+        if self._revision_deferred > 0:
+            self._revision_pending = True
+            return
+
+        # Individual document saves increment the revision immediately if the
+        # revision was not recently incremented by another save. Otherwise the
+        # increment is coalesced with any other saves into a single increment
+        # at the end of the debounce interval
+        if debounce:
+            with self._revision_lock:
+                now = timeit.default_timer()
+                if (
+                    self._revision_time is not None
+                    and now - self._revision_time < _REVISION_DEBOUNCE_SECS
+                ):
+                    self._revision_pending = True
+                    if self._revision_timer is None:
+                        delay = _REVISION_DEBOUNCE_SECS - (
+                            now - self._revision_time
+                        )
+                        self._revision_timer = threading.Timer(
+                            delay, self._flush_revision
+                        )
+                        self._revision_timer.start()
+
+                    return
+
+                self._revision_time = now
+
+        self._increment_revision()
+
+    def _flush_revision(self):
+        if self._revision_pending:
+            self._increment_revision()
+
+    def _increment_revision(self):
+        with self._revision_lock:
+            self._revision_pending = False
+            if self._revision_timer is not None:
+                self._revision_timer.cancel()
+                self._revision_timer = None
+
+        foo.increment_dataset_revision(self._doc.name)
+
+
+def _merge_codec_fields(doc_cls, src_schema, schema):
+    codec_schema = {
+        name: field
+        for name, field in src_schema.items()
+        if name not in schema
+        and isinstance(field, (fof.VectorField, fof.ArrayField))
+        and field.codec is not None
+    }
+
+    if not codec_schema:
+        return False
+
+    return doc_cls.merge_field_schema(codec_schema, validate=False)
+
 
 def _get_random_characters(n):
     return "".join(
@@ -7100,6 +7246,9 @@ def _save_view(view, fields=None):
             )
             foo.aggregate(dataset._sample_collection, pipeline)
 
+    if save_samples or save_frames:
+        dataset._update_revision()
+
     #
     # Reload in-memory documents
     #
@@ -7345,7 +7494,8 @@ def _clone_run(run_doc):
     if run_doc.results:
         run_doc.results.seek(0)
         results_bytes = run_doc.results.read()
-        _run_doc.results.put(results_bytes, content_type="application/json")
+        content_type = run_doc.results.content_type or "application/json"
+        _run_doc.results.put(results_bytes, content_type=content_type)
 
     return _run_doc
 
@@ -7463,6 +7613,7 @@ def _add_collection_with_new_ids(
     )
 
     new_ids = dst_samples[-num_ids:].values("id")
+    dataset._update_revision()
 
     if contains_groups:
         ops = []
@@ -7973,6 +8124,8 @@ def _merge_samples_pipeline(
     if contains_videos:
         fofr.Frame._reload_docs(dst_dataset._frame_collection_name)
 
+    dst_dataset._update_revision()
+
 
 def _merge_docs(
     sample_collection,
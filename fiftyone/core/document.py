@@ -447,6 +447,10 @@ class _Document(object):
 
         return self._doc._save(deferred=deferred)
 
+    def _is_modified(self):
+        # Whether saving the document will write to the database
+        return self._doc._created or bool(self._doc._get_changed_fields())
+
     def _parse_fields(self, fields=None, omit_fields=None):
         if fields is None:
             fields = {
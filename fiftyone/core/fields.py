@@ -192,6 +192,19 @@ def _make_prefix(path):
     return "Field '%s'" % path
 
 
+_ARRAY_CODECS = ("zlib", "raw")
+
+
+def _validate_codec(codec):
+    if codec is not None and codec not in _ARRAY_CODECS:
+        raise ValueError(
+            "Unsupported codec '%s'; supported values are %s"
+            % (codec, _ARRAY_CODECS)
+        )
+
+    return codec
+
+
 def flatten_schema(
     schema,
     ftype=None,
@@ -955,24 +968,38 @@ class VectorField(mongoengine.fields.BinaryField, Field):
 
     :class:`VectorField` instances accept numeric lists, tuples, and 1D numpy
     array values. The underlying data is serialized and stored in the database
-    as zlib-compressed bytes generated by ``numpy.save`` and always retrieved
-    as a numpy array.
+    via the field's ``codec`` and always retrieved as a numpy array.
+
+    By default, arrays are stored as zlib-compressed bytes generated by
+    ``numpy.save``. The ``"raw"`` codec instead stores the raw array buffer,
+    which is much faster to read and write for incompressible data such as
+    embeddings. Arrays stored with the ``"raw"`` codec are retrieved as
+    read-only arrays.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        codec (None): the codec to use to store arrays in the database. See
+            :func:`fiftyone.core.utils.serialize_numpy_array` for the
+            supported values. By default, ``"zlib"`` is used
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(self, description=None, info=None, codec=None, **kwargs):
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self._codec = _validate_codec(codec)
+
+    @property
+    def codec(self):
+        """The codec used to store arrays in the database."""
+        return self._codec
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_numpy_array(value, codec=self._codec)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -999,24 +1026,38 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
     """An n-dimensional array field.
 
     :class:`ArrayField` instances accept numpy array values. The underlying
-    data is serialized and stored in the database as zlib-compressed bytes
-    generated by ``numpy.save`` and always retrieved as a numpy array.
+    data is serialized and stored in the database via the field's ``codec``
+    and always retrieved as a numpy array.
+
+    By default, arrays are stored as zlib-compressed bytes generated by
+    ``numpy.save``. The ``"raw"`` codec instead stores the raw array buffer,
+    which is much faster to read and write for incompressible data. Arrays
+    stored with the ``"raw"`` codec are retrieved as read-only arrays.
 
     Args:
         description (None): an optional description
         info (None): an optional info dict
+        codec (None): the codec to use to store arrays in the database. See
+            :func:`fiftyone.core.utils.serialize_numpy_array` for the
+            supported values. By default, ``"zlib"`` is used
     """
 
-    def __init__(self, description=None, info=None, **kwargs):
+    def __init__(self, description=None, info=None, codec=None, **kwargs):
         super().__init__(**kwargs)
         self._description = description
         self._info = info
+        self._codec = _validate_codec(codec)
+
+    @property
+    def codec(self):
+        """The codec used to store arrays in the database."""
+        return self._codec
 
     def to_mongo(self, value):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.serialize_numpy_array(value, codec=self._codec)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
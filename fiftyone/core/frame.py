@@ -466,7 +466,8 @@ class Frames(object):
 
     def save(self):
         """Saves all frames for the sample to the database."""
-        self._save()
+        if self._save():
+            self._dataset._update_revision(debounce=True)
 
     def _save(self, deferred=False):
         if not self._in_db:
@@ -641,6 +642,8 @@ class Frames(object):
         # because None and missing are equivalent in our data model
         d = {k: v for k, v in d.items() if v is not None}
 
+        self._dataset._encode_array_fields(frame, d, frames=True)
+
         d["_sample_id"] = self._sample_id
         d["_dataset_id"] = self._dataset._doc.id
 
@@ -656,9 +659,8 @@ class Frames(object):
         ops = []
 
         if self._delete_all:
-            if deferred:
-                ops.append(DeleteMany({"_sample_id": self._sample_id}))
-            else:
+            ops.append(DeleteMany({"_sample_id": self._sample_id}))
+            if not deferred:
                 self._frame_collection.delete_many(
                     {"_sample_id": self._sample_id}
                 )
@@ -1074,8 +1076,12 @@ class Frame(Document, metaclass=FrameSingleton):
                 "Use `sample.save()` to save newly added frames to a sample"
             )
 
+        modified = self._is_modified()
         super().save()
 
+        if modified:
+            self._dataset._update_revision(debounce=True)
+
     def _reload_backing_doc(self):
         if not self._in_db:
             return
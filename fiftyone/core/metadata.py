@@ -12,6 +12,7 @@ import os
 import requests
 
 from PIL import Image
+from pymongo import UpdateOne
 
 import eta.core.utils as etau
 import eta.core.video as etav
@@ -19,11 +20,17 @@ import eta.core.video as etav
 from fiftyone.core.odm import DynamicEmbeddedDocument
 import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 import fiftyone.core.utils as fou
 
+fos = fou.lazy_import("fiftyone.core.sample")
+
 
 logger = logging.getLogger(__name__)
 
+# The number of metadata results to write to the database in each batch
+_WRITE_BATCH_SIZE = 1000
+
 
 class Metadata(DynamicEmbeddedDocument):
     """Base class for storing metadata about generic samples.
@@ -290,47 +297,76 @@ def get_image_info(f):
 
 
 def _compute_metadata(sample_collection, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
+    inputs = _get_metadata_inputs(sample_collection, overwrite=overwrite)
+    num_samples = len(inputs)
 
-    num_samples = len(sample_collection)
     if num_samples == 0:
         return
 
     logger.info("Computing metadata...")
     with fou.ProgressBar(total=num_samples) as pb:
-        for sample in pb(sample_collection.select_fields()):
-            compute_sample_metadata(sample, skip_failures=True)
+        results = map(_do_compute_metadata, inputs)
+        _save_metadata(sample_collection, pb(results))
 
 
 def _compute_metadata_multi(sample_collection, num_workers, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
-
-    ids, filepaths, media_types = sample_collection.values(
-        ["id", "filepath", "_media_type"],
-        _allow_missing=True,
-    )
-
-    inputs = list(zip(ids, filepaths, media_types))
+    inputs = _get_metadata_inputs(sample_collection, overwrite=overwrite)
     num_samples = len(inputs)
 
     if num_samples == 0:
         return
 
     logger.info("Computing metadata...")
-
-    view = sample_collection.select_fields()
     with fou.ProgressBar(total=num_samples) as pb:
         with fou.get_multiprocessing_context().Pool(
             processes=num_workers
         ) as pool:
-            for sample_id, metadata in pb(
-                pool.imap_unordered(_do_compute_metadata, inputs)
-            ):
-                sample = view[sample_id]
-                sample.metadata = metadata
-                sample.save()
+            results = pool.imap_unordered(_do_compute_metadata, inputs)
+            _save_metadata(sample_collection, pb(results))
+
+
+def _get_metadata_inputs(sample_collection, overwrite=False):
+    if not overwrite:
+        sample_collection = sample_collection.exists("metadata", False)
+
+    ids, filepaths, media_types = sample_collection.values(
+        ["_id", "filepath", "_media_type"],
+        _allow_missing=True,
+    )
+
+    return list(zip(ids, filepaths, media_types))
+
+
+def _save_metadata(sample_collection, results):
+    # Buffers the `(sample_id, metadata)` results as they are computed and
+    # writes them to the database in batches
+    dataset = sample_collection._dataset
+    sample_ids = []
+    ops = []
+
+    for sample_id, metadata in results:
+        if metadata is not None:
+            metadata = metadata.to_dict()
+
+        sample_ids.append(sample_id)
+        ops.append(
+            UpdateOne({"_id": sample_id}, {"$set": {"metadata": metadata}})
+        )
+
+        if len(ops) >= _WRITE_BATCH_SIZE:
+            foo.bulk_write(ops, dataset._sample_collection)
+            ops.clear()
+
+    if ops:
+        foo.bulk_write(ops, dataset._sample_collection)
+
+    fos.Sample._reload_docs(
+        dataset._sample_collection_name,
+        sample_ids=[str(_id) for _id in sample_ids],
+    )
+
+    if sample_ids:
+        dataset._update_revision()
 
 
 def _do_compute_metadata(args):
@@ -5,9 +5,12 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import inspect
 import logging
+import multiprocessing
 
 import numpy as np
 
@@ -84,7 +87,9 @@ def apply_model(
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+            For Torch-based models, this is the number of data loader workers.
+            For other models applied to image collections, this is the number
+            of threads used to prefetch images while the model is running
         skip_failures (True): whether to gracefully continue without raising an
             error if predictions cannot be generated for a sample. Only
             applicable to :class:`Model` instances
@@ -153,9 +158,14 @@ def apply_model(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if (
+        num_workers is not None
+        and not use_data_loader
+        and samples.media_type != fom.IMAGE
+    ):
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for Torch "
+            "models and image collections"
         )
 
     if output_dir is not None:
@@ -256,6 +266,7 @@ def apply_model(
                 label_field,
                 confidence_thresh,
                 batch_size,
+                num_workers,
                 skip_failures,
                 filename_maker,
             )
@@ -265,6 +276,7 @@ def apply_model(
             model,
             label_field,
             confidence_thresh,
+            num_workers,
             skip_failures,
             filename_maker,
         )
@@ -286,15 +298,18 @@ def _apply_image_model_single(
     model,
     label_field,
     confidence_thresh,
+    num_workers,
     skip_failures,
     filename_maker,
 ):
     needs_samples = isinstance(model, SamplesMixin)
+    images_loader = _make_image_loader(samples, None, num_workers)
 
-    with fou.ProgressBar() as pb:
-        for sample in pb(samples):
+    with fou.ProgressBar(samples) as pb:
+        for sample, img in pb(images_loader):
             try:
-                img = foui.read(sample.filepath)
+                if isinstance(img, Exception):
+                    raise img
 
                 if needs_samples:
                     labels = model.predict(img, sample=sample)
@@ -323,16 +338,22 @@ def _apply_image_model_batch(
     label_field,
     confidence_thresh,
     batch_size,
+    num_workers,
     skip_failures,
     filename_maker,
 ):
     needs_samples = isinstance(model, SamplesMixin)
-    samples_loader = fou.iter_batches(samples, batch_size)
+    images_loader = _make_image_loader(samples, batch_size, num_workers)
 
-    with fou.ProgressBar(samples) as pb:
-        for sample_batch in samples_loader:
+    # Each batch of predictions is written in a single bulk write, which runs
+    # in the background while the next batch is being processed
+    ctx = samples.save_context(batch_size=batch_size, async_writes=True)
+
+    with fou.ProgressBar(samples) as pb, ctx:
+        for sample_batch, imgs in images_loader:
             try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
+                if isinstance(imgs, Exception):
+                    raise imgs
 
                 if needs_samples:
                     labels_batch = model.predict_all(
@@ -350,7 +371,7 @@ def _apply_image_model_batch(
                         label_field=label_field,
                         confidence_thresh=confidence_thresh,
                     )
-                    sample.save()
+                    ctx.save(sample)
 
             except Exception as e:
                 if not skip_failures:
@@ -382,7 +403,11 @@ def _apply_image_model_data_loader(
         samples, model, batch_size, num_workers, skip_failures
     )
 
-    with fou.ProgressBar(samples) as pb:
+    # Each batch of predictions is written in a single bulk write, which runs
+    # in the background while the next batch is being processed
+    ctx = samples.save_context(batch_size=batch_size, async_writes=True)
+
+    with fou.ProgressBar(samples) as pb, ctx:
         for sample_batch, imgs in zip(samples_loader, data_loader):
             try:
                 if isinstance(imgs, Exception):
@@ -404,7 +429,7 @@ def _apply_image_model_data_loader(
                         label_field=label_field,
                         confidence_thresh=confidence_thresh,
                     )
-                    sample.save()
+                    ctx.save(sample)
 
             except Exception as e:
                 if not skip_failures:
@@ -628,6 +653,60 @@ def _iter_batches(video_reader, batch_size):
         yield frame_numbers, imgs
 
 
+def _make_image_loader(samples, batch_size, num_workers, num_prefetch=2):
+    # Generic loader for models that are not Torch-based. Images are decoded
+    # in a thread pool while the caller processes the current batch. At most
+    # `num_prefetch` batches are loaded ahead of the current batch
+    #
+    # Emits `(sample, img)` tuples if `batch_size` is None, and
+    # `(sample_batch, imgs)` tuples otherwise. If an image cannot be loaded,
+    # the exception is emitted in place of the image(s), so that the caller
+    # can apply its own `skip_failures` logic
+    if num_workers is None:
+        num_workers = min(multiprocessing.cpu_count(), 8)
+
+    num_workers = max(num_workers, 1)
+
+    samples_loader = fou.iter_batches(samples, batch_size or 1)
+    queue = deque()
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+
+        def _load_next_batch():
+            sample_batch = next(samples_loader, None)
+            if sample_batch is not None:
+                futures = [
+                    executor.submit(foui.read, sample.filepath)
+                    for sample in sample_batch
+                ]
+                queue.append((sample_batch, futures))
+
+        try:
+            for _ in range(num_prefetch + 1):
+                _load_next_batch()
+
+            while queue:
+                sample_batch, futures = queue.popleft()
+                _load_next_batch()
+
+                try:
+                    imgs = [future.result() for future in futures]
+                except Exception as e:
+                    imgs = e
+
+                if batch_size is None:
+                    if isinstance(imgs, list):
+                        imgs = imgs[0]
+
+                    yield sample_batch[0], imgs
+                else:
+                    yield sample_batch, imgs
+        finally:
+            for _, futures in queue:
+                for future in futures:
+                    future.cancel()
+
+
 def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
     # This function supports DataLoaders that emit numpy arrays that can
     # therefore be used for non-Torch models; but we do not currenly use this
@@ -745,7 +824,9 @@ def compute_embeddings(
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
-            Only applicable for Torch-based models
+            For Torch-based models, this is the number of data loader workers.
+            For other models applied to image collections, this is the number
+            of threads used to prefetch images while the model is running
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample. Only
             applicable to :class:`Model` instances
@@ -816,9 +897,14 @@ def compute_embeddings(
         isinstance(model, TorchModelMixin) and samples.media_type == fom.IMAGE
     )
 
-    if num_workers is not None and not use_data_loader:
+    if (
+        num_workers is not None
+        and not use_data_loader
+        and samples.media_type != fom.IMAGE
+    ):
         logger.warning(
-            "Ignoring `num_workers` parameter; only supported for Torch models"
+            "Ignoring `num_workers` parameter; only supported for Torch "
+            "models and image collections"
         )
 
     if embeddings_field is not None:
@@ -878,28 +964,36 @@ def compute_embeddings(
 
         if batch_size is not None:
             return _compute_image_embeddings_batch(
-                samples, model, embeddings_field, batch_size, skip_failures
+                samples,
+                model,
+                embeddings_field,
+                batch_size,
+                num_workers,
+                skip_failures,
             )
 
         return _compute_image_embeddings_single(
-            samples, model, embeddings_field, skip_failures
+            samples, model, embeddings_field, num_workers, skip_failures
         )
 
 
 def _compute_image_embeddings_single(
-    samples, model, embeddings_field, skip_failures
+    samples, model, embeddings_field, num_workers, skip_failures
 ):
     samples = samples.select_fields()
+    images_loader = _make_image_loader(samples, None, num_workers)
     embeddings = []
 
     errors = False
 
-    with fou.ProgressBar() as pb:
-        for sample in pb(samples):
+    with fou.ProgressBar(samples) as pb:
+        for sample, img in pb(images_loader):
             embedding = None
 
             try:
-                img = foui.read(sample.filepath)
+                if isinstance(img, Exception):
+                    raise img
+
                 embedding = model.embed(img)[0]
             except Exception as e:
                 if not skip_failures:
@@ -924,20 +1018,22 @@ def _compute_image_embeddings_single(
 
 
 def _compute_image_embeddings_batch(
-    samples, model, embeddings_field, batch_size, skip_failures
+    samples, model, embeddings_field, batch_size, num_workers, skip_failures
 ):
     samples = samples.select_fields()
-    samples_loader = fou.iter_batches(samples, batch_size)
+    images_loader = _make_image_loader(samples, batch_size, num_workers)
 
     embeddings = []
     errors = False
 
     with fou.ProgressBar(samples) as pb:
-        for sample_batch in samples_loader:
+        for sample_batch, imgs in images_loader:
             embeddings_batch = [None] * len(sample_batch)
 
             try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
+                if isinstance(imgs, Exception):
+                    raise imgs
+
                 embeddings_batch = list(model.embed_all(imgs))  # list of 1D
             except Exception as e:
                 if not skip_failures:
@@ -11,6 +11,7 @@ from .database import (
     aggregate,
     get_db_config,
     establish_db_conn,
+    reset_db_conn,
     get_db_client,
     get_db_conn,
     get_async_db_client,
@@ -18,6 +19,8 @@ from .database import (
     drop_database,
     sync_database,
     list_datasets,
+    get_dataset_revision,
+    increment_dataset_revision,
     patch_saved_views,
     patch_annotation_runs,
     patch_brain_runs,
@@ -39,9 +42,12 @@ from .database import (
     count_documents,
     export_document,
     export_collection,
+    export_collection_shards,
     import_document,
     import_collection,
+    is_sharded_collection,
     insert_documents,
+    insert_collection_shards,
     bulk_write,
 )
 from .dataset import (
@@ -6,15 +6,20 @@ Database utilities.
 |
 """
 import atexit
+from collections import deque
 from datetime import datetime
+import gzip
 import logging
+import multiprocessing
 from multiprocessing.pool import ThreadPool
 import os
+import threading
 
 import asyncio
+import bson
 from bson import json_util, ObjectId
 from bson.codec_options import CodecOptions
-from mongoengine import connect
+from mongoengine import connect, disconnect
 import mongoengine.errors as moe
 import motor.motor_asyncio as mtr
 
@@ -38,6 +43,10 @@ foa = fou.lazy_import("fiftyone.core.annotation")
 fob = fou.lazy_import("fiftyone.core.brain")
 fod = fou.lazy_import("fiftyone.core.dataset")
 foe = fou.lazy_import("fiftyone.core.evaluation")
+fom = fou.lazy_import("fiftyone.migrations")
+zstd = fou.lazy_import(
+    "zstandard", callback=lambda: fou.ensure_package("zstandard")
+)
 
 
 logger = logging.getLogger(__name__)
@@ -46,6 +55,9 @@ _client = None
 _async_client = None
 _connection_kwargs = {}
 _db_service = None
+_db_conn_lock = threading.RLock()
+_db_conn_ready = False
+_db_conn_pending = False
 
 
 #
@@ -217,7 +229,11 @@ def establish_db_conn(config):
     )
     _validate_db_version(config, _client)
 
-    # Register cleanup method
+    # Register cleanup method. Deleting datasets also deletes their delegated
+    # operations, so we import that service now, since modules cannot be
+    # safely imported while the interpreter is shutting down
+    import fiftyone.operators.delegated  # pylint: disable=unused-import
+
     atexit.register(_delete_non_persistent_datasets_if_allowed)
 
     connect(config.database_name, **_connection_kwargs)
@@ -230,7 +246,37 @@ def establish_db_conn(config):
         )
 
 
+def _establish_db_conn_if_necessary():
+    # The database connection is established, and the database is migrated,
+    # the first time that it is used rather than when `fiftyone` is imported
+    global _db_conn_ready
+    global _db_conn_pending
+
+    if _db_conn_ready:
+        return
+
+    with _db_conn_lock:
+        # Connecting and migrating use the database, so we must allow
+        # reentrant calls from the thread that is establishing the connection
+        if _db_conn_ready or _db_conn_pending:
+            return
+
+        _db_conn_pending = True
+        try:
+            if _client is None:
+                establish_db_conn(fo.config)
+
+            if os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
+                fom.migrate_database_if_necessary()
+
+            _db_conn_ready = True
+        finally:
+            _db_conn_pending = False
+
+
 def _connect():
+    _establish_db_conn_if_necessary()
+
     global _client
     if _client is None:
         global _connection_kwargs
@@ -242,6 +288,8 @@ def _connect():
 
 
 def _async_connect():
+    _establish_db_conn_if_necessary()
+
     global _async_client
     if _async_client is None:
         global _connection_kwargs
@@ -250,6 +298,22 @@ def _async_connect():
         )
 
 
+def reset_db_conn():
+    """Discards any existing database clients and establishes new ones.
+
+    This is necessary in worker processes that are forked from a process with
+    an active connection, since ``pymongo`` clients are not fork-safe.
+    """
+    global _client
+    global _async_client
+
+    _client = None
+    _async_client = None
+    disconnect()
+
+    _connect()
+
+
 def _delete_non_persistent_datasets_if_allowed():
     """Deletes all non-persistent datasets if and only if we are the only
     client currently connected to the database.
@@ -688,8 +752,9 @@ def import_collection(json_dir_or_path, key="documents"):
     """Imports the collection from JSON on disk.
 
     Args:
-        json_dir_or_path: the path to a JSON file on disk, or a directory
-            containing per-document JSON files
+        json_dir_or_path: the path to a JSON file on disk, a directory
+            containing per-document JSON files, or a directory of shards
+            written by :func:`export_collection_shards`
         key ("documents"): the field name under which the documents are stored
             when ``json_path`` is a single JSON file
 
@@ -702,6 +767,9 @@ def import_collection(json_dir_or_path, key="documents"):
     if json_dir_or_path.endswith(".json"):
         return _import_collection_single(json_dir_or_path, key)
 
+    if is_sharded_collection(json_dir_or_path):
+        return _import_collection_shards(json_dir_or_path)
+
     return _import_collection_multi(json_dir_or_path)
 
 
@@ -725,6 +793,264 @@ def _import_collection_multi(json_dir):
     return docs, len(json_paths)
 
 
+def export_collection_shards(
+    docs,
+    shards_dir,
+    shard_size=10000,
+    shard_format="bson",
+    compression=None,
+    num_docs=None,
+):
+    """Exports the collection to disk as a directory of shards.
+
+    The shards are written alongside a ``manifest.json`` file that records the
+    format and contents of each shard. Collections exported in this way can
+    be read via :func:`import_collection` and inserted in parallel via
+    :func:`insert_collection_shards`.
+
+    Args:
+        docs: an iterable containing the documents to export
+        shards_dir: the directory in which to write the shards
+        shard_size (10000): the maximum number of documents per shard
+        shard_format ("bson"): the format of each shard. Supported values are
+            ``("bson", "ndjson")``
+        compression (None): an optional compression to apply to each shard.
+            Supported values are ``(None, "gzip", "zstd")``
+        num_docs (None): the total number of documents. If omitted, this must
+            be computable via ``len(docs)``
+
+    Returns:
+        the manifest dict
+    """
+    if shard_format not in _SHARD_FORMATS:
+        raise ValueError(
+            "Unsupported shard_format '%s'. Supported values are %s"
+            % (shard_format, tuple(_SHARD_FORMATS.keys()))
+        )
+
+    if compression not in _SHARD_COMPRESSIONS:
+        raise ValueError(
+            "Unsupported compression '%s'. Supported values are %s"
+            % (compression, tuple(_SHARD_COMPRESSIONS.keys()))
+        )
+
+    if num_docs is None:
+        num_docs = len(docs)
+
+    etau.ensure_dir(shards_dir)
+
+    ext = _SHARD_FORMATS[shard_format] + _SHARD_COMPRESSIONS[compression]
+
+    shards = []
+    f = None
+    try:
+        with fou.ProgressBar(total=num_docs, iters_str="docs") as pb:
+            for doc in pb(docs):
+                if f is None or shards[-1]["num_docs"] >= shard_size:
+                    if f is not None:
+                        f.close()
+
+                    filename = "%06d%s" % (len(shards) + 1, ext)
+                    path = os.path.join(shards_dir, filename)
+                    f = _open_shard(path, "wb", compression)
+                    shards.append({"filename": filename, "num_docs": 0})
+
+                f.write(_encode_doc(doc, shard_format))
+                shards[-1]["num_docs"] += 1
+    finally:
+        if f is not None:
+            f.close()
+
+    manifest = {
+        "format": shard_format,
+        "compression": compression,
+        "num_docs": sum(s["num_docs"] for s in shards),
+        "shards": shards,
+    }
+
+    manifest_path = os.path.join(shards_dir, _SHARDS_MANIFEST)
+    etau.write_file(json_util.dumps(manifest), manifest_path)
+
+    return manifest
+
+
+def is_sharded_collection(path):
+    """Determines whether the given path contains a collection that was
+    exported via :func:`export_collection_shards`.
+
+    Args:
+        path: a path
+
+    Returns:
+        True/False
+    """
+    return os.path.isfile(os.path.join(path, _SHARDS_MANIFEST))
+
+
+def insert_collection_shards(
+    shards_dir,
+    coll,
+    parse_fcn=None,
+    ordered=False,
+    skip_existing=False,
+    num_workers=None,
+    progress=False,
+):
+    """Inserts a collection that was exported via
+    :func:`export_collection_shards` into a database collection.
+
+    Shards are read and decoded by a pool of worker threads. When ``ordered``
+    is True, the shards are inserted in manifest order by the calling thread;
+    otherwise each worker inserts its shards as soon as they are decoded.
+
+    Args:
+        shards_dir: the directory containing the shards
+        coll: a pymongo collection
+        parse_fcn (None): an optional function to apply to each document
+            before it is inserted
+        ordered (False): whether the documents must be inserted in order
+        skip_existing (False): whether to skip documents whose ``_id`` already
+            exists in ``coll``, which allows for resuming a previous partial
+            insertion
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used
+        progress (False): whether to render a progress bar tracking the
+            insertion
+
+    Returns:
+        the list of IDs of the documents in the shards
+    """
+    manifest = _read_shards_manifest(shards_dir)
+    shards = manifest["shards"]
+
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    num_workers = max(1, min(num_workers, len(shards)))
+
+    def _load_shard(shard):
+        path = os.path.join(shards_dir, shard["filename"])
+        docs = _read_shard(path, manifest["format"], manifest["compression"])
+
+        if parse_fcn is not None:
+            docs = [parse_fcn(d) for d in docs]
+
+        return docs
+
+    def _insert_shard(docs):
+        ids = [d["_id"] for d in docs]
+
+        if skip_existing and ids:
+            existing = set(
+                d["_id"]
+                for d in coll.find({"_id": {"$in": ids}}, {"_id": True})
+            )
+            _docs = [d for d in docs if d["_id"] not in existing]
+        else:
+            _docs = docs
+
+        if _docs:
+            coll.insert_many(_docs, ordered=ordered)
+
+        return ids
+
+    def _load_and_insert_shard(shard):
+        return _insert_shard(_load_shard(shard))
+
+    ids = []
+    try:
+        quiet = not (progress and fo.config.show_progress_bars)
+        with fou.ProgressBar(
+            total=manifest["num_docs"], iters_str="docs", quiet=quiet
+        ) as pb:
+            with ThreadPool(processes=num_workers) as pool:
+                # Bound the number of decoded shards held in memory
+                pending = deque()
+                for shard in shards:
+                    if ordered:
+                        fcn = _load_shard
+                    else:
+                        fcn = _load_and_insert_shard
+
+                    pending.append(pool.apply_async(fcn, (shard,)))
+                    if len(pending) >= 2 * num_workers:
+                        _ids = _get_shard_ids(pending, ordered, _insert_shard)
+                        ids.extend(_ids)
+                        pb.update(count=len(_ids))
+
+                while pending:
+                    _ids = _get_shard_ids(pending, ordered, _insert_shard)
+                    ids.extend(_ids)
+                    pb.update(count=len(_ids))
+    except BulkWriteError as bwe:
+        msg = bwe.details["writeErrors"][0]["errmsg"]
+        raise ValueError(msg) from bwe
+
+    return ids
+
+
+def _get_shard_ids(pending, ordered, insert_fcn):
+    result = pending.popleft().get()
+
+    # When inserting in order, the workers only decode the shards, and the
+    # insertions happen here in the calling thread
+    if ordered:
+        return insert_fcn(result)
+
+    return result
+
+
+_SHARDS_MANIFEST = "manifest.json"
+
+_SHARD_FORMATS = {"bson": ".bson", "ndjson": ".ndjson"}
+
+_SHARD_COMPRESSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _import_collection_shards(shards_dir):
+    manifest = _read_shards_manifest(shards_dir)
+    shard_format = manifest["format"]
+    compression = manifest["compression"]
+
+    def _iter_docs():
+        for shard in manifest["shards"]:
+            path = os.path.join(shards_dir, shard["filename"])
+            yield from _read_shard(path, shard_format, compression)
+
+    return _iter_docs(), manifest["num_docs"]
+
+
+def _read_shards_manifest(shards_dir):
+    manifest_path = os.path.join(shards_dir, _SHARDS_MANIFEST)
+    with open(manifest_path, "r") as f:
+        return json_util.loads(f.read())
+
+
+def _open_shard(path, mode, compression):
+    if compression == "gzip":
+        return gzip.open(path, mode)
+
+    if compression == "zstd":
+        return zstd.open(path, mode)
+
+    return open(path, mode)
+
+
+def _encode_doc(doc, shard_format):
+    if shard_format == "bson":
+        return bson.encode(doc)
+
+    return (json_util.dumps(doc) + "\n").encode("utf-8")
+
+
+def _read_shard(path, shard_format, compression):
+    with _open_shard(path, "rb", compression) as f:
+        if shard_format == "bson":
+            return bson.decode_all(f.read())
+
+        return [json_util.loads(line) for line in f if line.strip()]
+
+
 def insert_documents(docs, coll, ordered=False, progress=False, num_docs=None):
     """Inserts documents into a collection.
 
@@ -799,6 +1125,37 @@ def list_datasets():
     return conn.datasets.distinct("name")
 
 
+def get_dataset_revision(name):
+    """Returns the revision of the dataset with the given name.
+
+    A dataset's revision is a counter that is incremented whenever the
+    contents or schema of the dataset are modified, which allows other
+    processes, such as the App server, to cheaply detect changes.
+
+    Args:
+        name: the name of the dataset
+
+    Returns:
+        the revision, or None if the dataset does not exist
+    """
+    conn = get_db_conn()
+    dataset_dict = conn.datasets.find_one({"name": name}, {"revision": True})
+    if dataset_dict is None:
+        return None
+
+    return dataset_dict.get("revision", 0)
+
+
+def increment_dataset_revision(name):
+    """Increments the revision of the dataset with the given name.
+
+    Args:
+        name: the name of the dataset
+    """
+    conn = get_db_conn()
+    conn.datasets.update_one({"name": name}, {"$inc": {"revision": 1}})
+
+
 def patch_saved_views(dataset_name, dry_run=False):
     """Ensures that the saved view documents in the ``views`` collection for
     the given dataset exactly match the IDs in its dataset document.
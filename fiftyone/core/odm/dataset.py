@@ -62,6 +62,7 @@ class SampleFieldDocument(EmbeddedDocument):
     db_field = StringField(null=True)
     description = StringField(null=True)
     info = DictField(null=True)
+    codec = StringField(null=True)
 
     def to_field(self):
         """Creates the :class:`fiftyone.core.fields.Field` specified by this
@@ -84,6 +85,10 @@ class SampleFieldDocument(EmbeddedDocument):
         if self.fields is not None:
             fields = [field_doc.to_field() for field_doc in list(self.fields)]
 
+        kwargs = {}
+        if self.codec is not None:
+            kwargs["codec"] = self.codec
+
         return create_field(
             self.name,
             ftype,
@@ -93,6 +98,7 @@ class SampleFieldDocument(EmbeddedDocument):
             db_field=self.db_field,
             description=self.description,
             info=self.info,
+            **kwargs,
         )
 
     @classmethod
@@ -120,6 +126,7 @@ class SampleFieldDocument(EmbeddedDocument):
             db_field=field.db_field,
             description=field.description,
             info=field.info,
+            codec=getattr(field, "codec", None),
         )
 
     @staticmethod
@@ -501,6 +508,7 @@ class DatasetDocument(Document):
     version = StringField(required=True, null=True)
     created_at = DateTimeField()
     last_loaded_at = DateTimeField()
+    revision = IntField(default=0)
     sample_collection_name = StringField(unique=True, required=True)
     frame_collection_name = StringField()
     persistent = BooleanField(default=False)
@@ -527,6 +535,31 @@ class DatasetDocument(Document):
     brain_methods = DictField(ReferenceField(RunDocument))
     evaluations = DictField(ReferenceField(RunDocument))
 
+    def _update(self, _id, updates, **kwargs):
+        # The revision is only ever incremented in the database, so in-memory
+        # values may be stale and must not be written back
+        for op in ("$set", "$unset"):
+            if op in updates:
+                updates[op].pop("revision", None)
+                if not updates[op]:
+                    del updates[op]
+
+        # Any edit other than bookkeeping constitutes a modification
+        paths = set(updates.get("$set", {})) | set(updates.get("$unset", {}))
+        if paths - {"last_loaded_at"}:
+            updates["$inc"] = {"revision": 1}
+
+        if not updates:
+            return None, True
+
+        result = super()._update(_id, updates, **kwargs)
+
+        # Mirror the increment so that in-process caches can detect changes
+        if "$inc" in updates:
+            self._data["revision"] = (self.revision or 0) + 1
+
+        return result
+
     def get_saved_views(self):
         saved_views = []
         for view_doc in self.saved_views:
@@ -310,6 +310,9 @@ def get_field_kwargs(field):
         "info": field.info,
     }
 
+    if isinstance(field, (fof.VectorField, fof.ArrayField)) and field.codec:
+        kwargs["codec"] = field.codec
+
     if isinstance(field, (fof.ListField, fof.DictField)):
         field = field.field
         if field is not None:
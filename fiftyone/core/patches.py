@@ -42,9 +42,11 @@ class _PatchView(fos.SampleView):
                 "Patches views do not support save contexts"
             )
 
-        super()._save(deferred=deferred)
+        ops = super()._save(deferred=deferred)
         self._view._sync_source_sample(self)
 
+        return ops
+
 
 class PatchView(_PatchView):
     """A patch in a :class:`PatchesView`.
@@ -101,6 +103,7 @@ class _PatchesView(fov.DatasetView):
         self._source_collection = source_collection
         self._patches_stage = patches_stage
         self._patches_dataset = patches_dataset
+        self._stage_pipelines_cache = None
         self.__stages = _stages
         self.__name = _name
 
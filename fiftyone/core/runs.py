@@ -5,11 +5,15 @@ Dataset runs framework.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import OrderedDict
 from copy import copy, deepcopy
 import datetime
+import inspect
 import logging
+import struct
 
 from bson import json_util, DBRef
+import numpy as np
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -543,9 +547,7 @@ class Run(Configurable):
             run_doc.results = None
         else:
             # Write run result to GridFS
-            # We use `json_util.dumps` so that run results may contain BSON
-            results_bytes = json_util.dumps(run_results.serialize()).encode()
-            run_doc.results.put(results_bytes, content_type="application/json")
+            _write_run_results(run_doc.results, run_results)
 
         # Cache the results for future use in this session
         if cache:
@@ -598,7 +600,7 @@ class Run(Configurable):
 
         # Load run result from GridFS
         run_doc.results.seek(0)
-        d = json_util.loads(run_doc.results.read().decode())
+        d = _read_run_results(run_doc.results)
 
         try:
             run_results = RunResults.from_dict(d, run_samples, config, key)
@@ -854,6 +856,27 @@ class RunResults(etas.Serializable):
         """
         return ["cls"] + super().attributes()
 
+    def serialize(self, reflective=False, _arrays=None):
+        """Serializes the results into a dictionary.
+
+        Args:
+            reflective (False): whether to include reflective attributes when
+                serializing the object
+
+        Returns:
+            a JSON dict
+        """
+        if _arrays is None:
+            return super().serialize(reflective=reflective)
+
+        # Numeric arrays are extracted into ``_arrays`` and replaced by
+        # placeholders so that they can be stored in binary format
+        d = self._prepare_serial_dict(reflective)
+        for a in self.attributes():
+            d[a] = _serialize_value(getattr(self, a), reflective, _arrays)
+
+        return d
+
     @classmethod
     def from_dict(cls, d, samples, config, key):
         """Builds a :class:`RunResults` from a JSON dict representation of it.
@@ -889,3 +912,159 @@ class RunResults(etas.Serializable):
             a :class:`RunResults`
         """
         raise NotImplementedError("subclass must implement _from_dict()")
+
+
+#
+# Run results are stored in GridFS in one of two formats:
+#
+# JSON: the ``json_util.dumps()`` of the results' serialized dict. This format
+# is used when the results contain no numeric arrays
+#
+# Binary: results that contain numeric arrays are stored as follows:
+#
+#   - ``_BINARY_RESULTS_MAGIC``
+#   - the length of the header in bytes, as a little-endian uint64
+#   - a JSON header (via ``json_util``) containing the serialized results, in
+#     which each numeric array is replaced by a ``{"_fo_array": idx}``
+#     placeholder, and a list describing the ``dtype``, ``shape``, ``offset``,
+#     and ``nbytes`` of each array
+#   - the raw C-order bytes of each array
+#
+
+_BINARY_RESULTS_MAGIC = b"\x93FORESULTS\x01"
+_BINARY_CONTENT_TYPE = "application/x-fiftyone-results"
+_ARRAY_KEY = "_fo_array"
+_ARRAY_KINDS = "biuf"
+_CHUNK_SIZE = 16 * 1024 * 1024  # bytes
+
+
+def _write_run_results(results_file, run_results):
+    arrays = []
+    if _supports_array_extraction(run_results):
+        d = run_results.serialize(_arrays=arrays)
+    else:
+        d = run_results.serialize()
+
+    if not arrays:
+        # We use `json_util.dumps` so that run results may contain BSON
+        results_bytes = json_util.dumps(d).encode()
+        results_file.put(results_bytes, content_type="application/json")
+        return
+
+    arrays = [np.ascontiguousarray(a) for a in arrays]
+
+    array_infos = []
+    offset = 0
+    for array in arrays:
+        dtype = array.dtype.newbyteorder("<")
+        array_infos.append(
+            {
+                "dtype": dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+                "nbytes": array.nbytes,
+            }
+        )
+        offset += array.nbytes
+
+    header = json_util.dumps({"results": d, "arrays": array_infos}).encode()
+
+    results_file.new_file(content_type=_BINARY_CONTENT_TYPE)
+    results_file.write(_BINARY_RESULTS_MAGIC)
+    results_file.write(struct.pack("<Q", len(header)))
+    results_file.write(header)
+
+    for array, info in zip(arrays, array_infos):
+        array = array.astype(info["dtype"], copy=False)
+        buf = memoryview(array.reshape(-1)).cast("B")
+        for start in range(0, len(buf), _CHUNK_SIZE):
+            results_file.write(bytes(buf[start : start + _CHUNK_SIZE]))
+
+    results_file.close()
+
+
+def _read_run_results(results_file):
+    magic = results_file.read(len(_BINARY_RESULTS_MAGIC))
+    if magic != _BINARY_RESULTS_MAGIC:
+        # Legacy JSON results
+        results_file.seek(0)
+        return json_util.loads(results_file.read().decode())
+
+    (header_len,) = struct.unpack("<Q", results_file.read(8))
+    header = json_util.loads(results_file.read(header_len).decode())
+
+    # Arrays are read directly into preallocated buffers to avoid making
+    # intermediate copies of the data
+    data_start = len(_BINARY_RESULTS_MAGIC) + 8 + header_len
+    arrays = []
+    for info in header["arrays"]:
+        array = np.empty(info["shape"], dtype=np.dtype(info["dtype"]))
+        buf = memoryview(array.reshape(-1)).cast("B")
+
+        results_file.seek(data_start + info["offset"])
+        pos = 0
+        while pos < info["nbytes"]:
+            chunk = results_file.read(min(_CHUNK_SIZE, info["nbytes"] - pos))
+            if not chunk:
+                raise ValueError("Run results are truncated")
+
+            buf[pos : pos + len(chunk)] = chunk
+            pos += len(chunk)
+
+        arrays.append(array)
+
+    return _deserialize_value(header["results"], arrays)
+
+
+def _supports_array_extraction(run_results):
+    params = inspect.signature(run_results.serialize).parameters
+    return "_arrays" in params or any(
+        p.kind == p.VAR_KEYWORD for p in params.values()
+    )
+
+
+def _serialize_value(value, reflective, arrays):
+    # Mirrors `eta.core.serial.Serializable.serialize()`, except that numeric
+    # arrays are extracted into `arrays`
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in _ARRAY_KINDS:
+            arrays.append(value)
+            return {_ARRAY_KEY: len(arrays) - 1}
+
+        return value.tolist()
+
+    if isinstance(value, etas.Serializable):
+        return value.serialize(reflective=reflective)
+
+    if isinstance(value, set):
+        value = list(value)
+
+    if isinstance(value, list):
+        return [_serialize_value(v, reflective, arrays) for v in value]
+
+    if isinstance(value, dict):
+        return OrderedDict(
+            (str(k), _serialize_value(v, reflective, arrays))
+            for k, v in value.items()
+        )
+
+    if hasattr(value, "serialize") and callable(value.serialize):
+        return value.serialize()
+
+    if hasattr(value, "to_dict") and callable(value.to_dict):
+        return value.to_dict()
+
+    return value
+
+
+def _deserialize_value(value, arrays):
+    if isinstance(value, dict):
+        if len(value) == 1 and _ARRAY_KEY in value:
+            return arrays[value[_ARRAY_KEY]]
+
+        return {k: _deserialize_value(v, arrays) for k, v in value.items()}
+
+    if isinstance(value, list):
+        return [_deserialize_value(v, arrays) for v in value]
+
+    return value
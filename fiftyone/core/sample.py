@@ -541,7 +541,11 @@ class Sample(_SampleMixin, Document, metaclass=SampleSingleton):
 
     def save(self):
         """Saves the sample to the database."""
-        super().save()
+        modified = self._is_modified()
+        _, frame_ops = self._save()
+
+        if modified or frame_ops:
+            self._dataset._update_revision(debounce=True)
 
     def _save(self, deferred=False):
         if not self._in_db:
@@ -735,7 +739,12 @@ class SampleView(_SampleMixin, DocumentView):
             This will permanently delete any omitted or filtered contents from
             the source dataset.
         """
-        super().save()
+        modified = self._is_modified()
+        _, frame_ops = self._save()
+        self._reload_parents()
+
+        if modified or frame_ops:
+            self._dataset._update_revision(debounce=True)
 
     def _save(self, deferred=False):
         if self.media_type == fomm.VIDEO:
@@ -6608,12 +6608,28 @@ class Shuffle(ViewStage):
         stage = fo.Shuffle(seed=51)
         view = dataset.add_stage(stage)
 
+        #
+        # Shuffle the samples by scanning an index rather than sorting the
+        # entire collection
+        #
+
+        stage = fo.Shuffle(seed=51, use_index=True)
+        view = dataset.add_stage(stage)
+
     Args:
         seed (None): an optional random seed to use when shuffling the samples
+        use_index (False): whether to generate the shuffled order by scanning
+            an index on the samples' random values rather than sorting the
+            entire collection. This is much faster for large datasets, but the
+            shuffled order is a rotation of a fixed random order determined by
+            ``seed``. This option only applies when shuffling an entire
+            non-generated, non-video, non-grouped dataset; otherwise the
+            default behavior is used
     """
 
-    def __init__(self, seed=None, _randint=None):
+    def __init__(self, seed=None, use_index=False, _randint=None):
         self._seed = seed
+        self._use_index = use_index
         self._randint = _randint or _get_rng(seed).randint(1e7, 1e10)
 
     @property
@@ -6621,7 +6637,15 @@ class Shuffle(ViewStage):
         """The random seed to use, or ``None``."""
         return self._seed
 
-    def to_mongo(self, _):
+    @property
+    def use_index(self):
+        """Whether to use an index to generate the shuffled order."""
+        return self._use_index
+
+    def to_mongo(self, sample_collection):
+        if self._use_index and _can_use_rand_index(sample_collection):
+            return _make_rand_index_pipeline(sample_collection, self._randint)
+
         # @todo can we avoid creating a new field here?
         return [
             {
@@ -6634,7 +6658,11 @@ class Shuffle(ViewStage):
         ]
 
     def _kwargs(self):
-        return [["seed", self._seed], ["_randint", self._randint]]
+        return [
+            ["seed", self._seed],
+            ["use_index", self._use_index],
+            ["_randint", self._randint],
+        ]
 
     @classmethod
     def _params(cls):
@@ -6645,9 +6673,19 @@ class Shuffle(ViewStage):
                 "default": "None",
                 "placeholder": "seed (default=None)",
             },
+            {
+                "name": "use_index",
+                "type": "bool",
+                "default": "False",
+                "placeholder": "use index (default=False)",
+            },
             {"name": "_randint", "type": "NoneType|int", "default": "None"},
         ]
 
+    def validate(self, sample_collection):
+        if self._use_index and _can_use_rand_index(sample_collection):
+            sample_collection.create_index("_rand")
+
 
 class Skip(ViewStage):
     """Omits the given number of samples from the head of a collection.
@@ -7235,15 +7273,31 @@ class Take(ViewStage):
         stage = fo.Take(2, seed=51)
         view = dataset.add_stage(stage)
 
+        #
+        # Take two random samples via index seeks rather than sorting the
+        # entire collection
+        #
+
+        stage = fo.Take(2, seed=51, use_index=True)
+        view = dataset.add_stage(stage)
+
     Args:
         size: the number of samples to return. If a non-positive number is
             provided, an empty view is returned
         seed (None): an optional random seed to use when selecting the samples
+        use_index (False): whether to select the samples via range seeks on
+            an index of the samples' random values rather than sorting the
+            entire collection. This is much faster for large datasets, but the
+            samples are a contiguous run of a fixed random order determined by
+            ``seed``. This option only applies when sampling from an entire
+            non-generated, non-video, non-grouped dataset; otherwise the
+            default behavior is used
     """
 
-    def __init__(self, size, seed=None, _randint=None):
+    def __init__(self, size, seed=None, use_index=False, _randint=None):
         self._seed = seed
         self._size = size
+        self._use_index = use_index
         self._randint = _randint or _get_rng(seed).randint(1e7, 1e10)
 
     @property
@@ -7256,10 +7310,20 @@ class Take(ViewStage):
         """The random seed to use, or ``None``."""
         return self._seed
 
-    def to_mongo(self, _):
+    @property
+    def use_index(self):
+        """Whether to use an index to select the samples."""
+        return self._use_index
+
+    def to_mongo(self, sample_collection):
         if self._size <= 0:
             return [{"$match": {"_id": None}}]
 
+        if self._use_index and _can_use_rand_index(sample_collection):
+            return _make_rand_index_pipeline(
+                sample_collection, self._randint, limit=self._size
+            )
+
         # @todo can we avoid creating a new field here?
         return [
             {
@@ -7276,6 +7340,7 @@ class Take(ViewStage):
         return [
             ["size", self._size],
             ["seed", self._seed],
+            ["use_index", self._use_index],
             ["_randint", self._randint],
         ]
 
@@ -7289,9 +7354,19 @@ class Take(ViewStage):
                 "default": "None",
                 "placeholder": "seed (default=None)",
             },
+            {
+                "name": "use_index",
+                "type": "bool",
+                "default": "False",
+                "placeholder": "use index (default=False)",
+            },
             {"name": "_randint", "type": "NoneType|int", "default": "None"},
         ]
 
+    def validate(self, sample_collection):
+        if self._use_index and _can_use_rand_index(sample_collection):
+            sample_collection.create_index("_rand")
+
 
 class ToPatches(ViewStage):
     """Creates a view that contains one sample per object patch in the
@@ -8121,6 +8196,59 @@ def _get_rng(seed):
     return _random
 
 
+def _can_use_rand_index(sample_collection):
+    # Index-backed sampling requires direct access to the samples of a
+    # non-generated dataset, so it is only possible for the first stage of a
+    # view. Video and grouped datasets are excluded because their pipelines
+    # may attach frames/select slices before this stage
+    if sample_collection._is_generated:
+        return False
+
+    dataset = sample_collection._dataset
+    if dataset.media_type == fom.GROUP or dataset._contains_videos(
+        any_slice=True
+    ):
+        return False
+
+    if isinstance(sample_collection, fov.DatasetView):
+        return not sample_collection._stages
+
+    return True
+
+
+def _make_rand_index_pipeline(sample_collection, randint, limit=None):
+    # Samples' `_rand` values lie in [0.999, 1), so we seek to a reproducible
+    # pivot in that range and then wrap around to the start if necessary
+    pivot = 0.999 + 0.001 * random.Random(randint).random()
+
+    head_pipeline = [
+        {"$match": {"_rand": {"$gte": pivot}}},
+        {"$sort": {"_rand": 1}},
+    ]
+    tail_pipeline = [
+        {"$match": {"_rand": {"$lt": pivot}}},
+        {"$sort": {"_rand": 1}},
+    ]
+
+    if limit is not None:
+        head_pipeline.append({"$limit": limit})
+        tail_pipeline.append({"$limit": limit})
+
+    pipeline = head_pipeline + [
+        {
+            "$unionWith": {
+                "coll": sample_collection._dataset._sample_collection_name,
+                "pipeline": tail_pipeline,
+            }
+        }
+    ]
+
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+
+    return pipeline
+
+
 def _parse_labels_field(sample_collection, field_path):
     path, is_list_field = sample_collection._get_label_field_root(field_path)
     is_frame_field = sample_collection._is_frame_field(field_path)
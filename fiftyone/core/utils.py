@@ -32,7 +32,6 @@ import timeit
 import types
 from xml.parsers.expat import ExpatError
 import zlib
-from matplotlib import colors as mcolors
 from concurrent.futures import ThreadPoolExecutor
 
 import asyncio
@@ -1402,20 +1401,48 @@ def compute_filehash(filepath, method=None, chunk_size=None):
     return hasher.hexdigest()
 
 
-def serialize_numpy_array(array, ascii=False):
+# Arrays serialized with the "raw" codec begin with this magic string, which
+# is followed by the format version, the dtype length, and the number of
+# dimensions (one byte each), the dtype string, the shape (little-endian
+# int64s), and zero padding that aligns the array buffer
+_RAW_ARRAY_MAGIC = b"\x93FOARR"
+_RAW_ARRAY_VERSION = 1
+_RAW_ARRAY_ALIGNMENT = 16
+
+
+def serialize_numpy_array(array, ascii=False, codec=None):
     """Serializes a numpy array.
 
+    The following codecs are supported:
+
+    -   ``"zlib"`` (default): zlib-compressed bytes generated by
+        ``numpy.save``
+    -   ``"raw"``: the raw little-endian array buffer, preceded by a small
+        versioned header that records the array's dtype and shape. Arrays
+        serialized with this codec are deserialized without copying their
+        data, which is much faster for incompressible data such as embeddings
+
     Args:
         array: a numpy array-like
         ascii (False): whether to return a base64-encoded ASCII string instead
             of raw bytes
+        codec (None): the codec to use. The supported values are
+            ``("zlib", "raw")``. By default, ``"zlib"`` is used
 
     Returns:
         the serialized bytes
     """
-    with io.BytesIO() as f:
-        np.save(f, np.asarray(array), allow_pickle=False)
-        bytes_str = zlib.compress(f.getvalue())
+    if codec is None or codec == "zlib":
+        with io.BytesIO() as f:
+            np.save(f, np.asarray(array), allow_pickle=False)
+            bytes_str = zlib.compress(f.getvalue())
+    elif codec == "raw":
+        bytes_str = _serialize_raw_array(array)
+    else:
+        raise ValueError(
+            "Unsupported codec '%s'; supported values are %s"
+            % (codec, ("zlib", "raw"))
+        )
 
     if ascii:
         bytes_str = b64encode(bytes_str).decode("ascii")
@@ -1427,6 +1454,10 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     """Loads a serialized numpy array generated by
     :func:`serialize_numpy_array`.
 
+    The codec that was used to serialize the array is automatically detected.
+    Arrays serialized with the ``"raw"`` codec are read-only views into
+    ``numpy_bytes``.
+
     Args:
         numpy_bytes: the serialized numpy array bytes
         ascii (False): whether the bytes were generated with the
@@ -1438,10 +1469,66 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     if ascii:
         numpy_bytes = b64decode(numpy_bytes.encode("ascii"))
 
+    if numpy_bytes[: len(_RAW_ARRAY_MAGIC)] == _RAW_ARRAY_MAGIC:
+        return _deserialize_raw_array(numpy_bytes)
+
     with io.BytesIO(zlib.decompress(numpy_bytes)) as f:
         return np.load(f)
 
 
+def _serialize_raw_array(array):
+    array = np.asarray(array)
+
+    if array.dtype.hasobject:
+        raise ValueError("Cannot serialize arrays of Python objects")
+
+    dtype = array.dtype.newbyteorder("<")
+    array = np.asarray(array, dtype=dtype, order="C")
+
+    dtype_str = dtype.str.encode("ascii")
+    header = b"".join(
+        [
+            _RAW_ARRAY_MAGIC,
+            struct.pack(
+                "<BBB", _RAW_ARRAY_VERSION, len(dtype_str), array.ndim
+            ),
+            dtype_str,
+            struct.pack("<%dq" % array.ndim, *array.shape),
+        ]
+    )
+
+    # Pad the header so that the array buffer is aligned
+    num_pad = -len(header) % _RAW_ARRAY_ALIGNMENT
+    header += b"\x00" * num_pad
+
+    return header + array.tobytes()
+
+
+def _deserialize_raw_array(numpy_bytes):
+    offset = len(_RAW_ARRAY_MAGIC)
+    version, dtype_len, ndim = struct.unpack_from("<BBB", numpy_bytes, offset)
+
+    if version > _RAW_ARRAY_VERSION:
+        raise ValueError(
+            "Unsupported raw array format version %d; you may need to "
+            "upgrade FiftyOne" % version
+        )
+
+    offset += 3
+    dtype = np.dtype(bytes(numpy_bytes[offset : offset + dtype_len]).decode())
+    offset += dtype_len
+    shape = struct.unpack_from("<%dq" % ndim, numpy_bytes, offset)
+    offset += 8 * ndim
+    offset += -offset % _RAW_ARRAY_ALIGNMENT
+
+    count = int(np.prod(shape, dtype=np.int64))
+    if count == 0:
+        return np.empty(shape, dtype=dtype)
+
+    array = np.frombuffer(numpy_bytes, dtype=dtype, count=count, offset=offset)
+    return array.reshape(shape)
+
+
 def iter_batches(iterable, batch_size):
     """Iterates over the given iterable in batches.
 
@@ -1918,6 +2005,7 @@ def validate_color(value):
     Raises:
         ValueError: if ``value`` is not a valid css color name.
     """
+    from matplotlib import colors as mcolors
 
     if not etau.is_str(value) or not (
         value in mcolors.CSS4_COLORS
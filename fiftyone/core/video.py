@@ -59,9 +59,11 @@ class FrameView(fos.SampleView):
                 "Frames views do not support save contexts"
             )
 
-        super()._save(deferred=deferred)
+        ops = super()._save(deferred=deferred)
         self._view._sync_source_sample(self)
 
+        return ops
+
 
 class FramesView(fov.DatasetView):
     """A :class:`fiftyone.core.view.DatasetView` of frames from a video
@@ -97,6 +99,7 @@ class FramesView(fov.DatasetView):
         self._source_collection = source_collection
         self._frames_stage = frames_stage
         self._frames_dataset = frames_dataset
+        self._stage_pipelines_cache = None
         self.__stages = _stages
         self.__name = _name
 
@@ -321,6 +324,7 @@ class FramesView(fov.DatasetView):
         }
 
         dst_dataset._frame_collection.update_one(match, {"$set": updates})
+        dst_dataset._update_revision()
 
     def _sync_source(self, fields=None, ids=None, update=True, delete=False):
         dst_dataset = self._source_collection._root_dataset
@@ -373,6 +377,7 @@ class FramesView(fov.DatasetView):
             )
 
             self._frames_dataset._aggregate(pipeline=pipeline)
+            dst_dataset._update_revision()
 
         if delete:
             frame_ids = self._frames_dataset.exclude(self).values("id")
@@ -463,6 +468,7 @@ def make_frames_dataset(
     force_sample=False,
     skip_failures=True,
     verbose=False,
+    num_workers=None,
     name=None,
 ):
     """Creates a dataset that contains one sample per frame in the video
@@ -588,6 +594,9 @@ def make_frames_dataset(
             an error if a video cannot be sampled
         verbose (False): whether to log information about the frames that will
             be sampled, if any
+        num_workers (None): the number of worker threads to use when sampling
+            videos. By default, videos are sampled serially. Only applicable
+            when ``sample_frames=True``
         name (None): a name for the dataset
 
     Returns:
@@ -658,6 +667,7 @@ def make_frames_dataset(
             force_sample=True,
             save_filepaths=True,
             skip_failures=skip_failures,
+            num_workers=num_workers,
         )
 
     #
@@ -73,6 +73,7 @@ class DatasetView(foc.SampleCollection):
         self.__media_type = _media_type
         self.__group_slice = _group_slice
         self.__name = _name
+        self._stage_pipelines_cache = None
 
     def __eq__(self, other):
         if type(other) != type(self):
@@ -133,6 +134,18 @@ class DatasetView(foc.SampleCollection):
             _name=self.__name,
         )
 
+    def __deepcopy__(self, memo):
+        view = self.__class__.__new__(self.__class__)
+        memo[id(self)] = view
+
+        for key, value in self.__dict__.items():
+            view.__dict__[key] = deepcopy(value, memo)
+
+        # Cached pipelines are derived state, so they are regenerated
+        view._stage_pipelines_cache = None
+
+        return view
+
     @property
     def _base_view(self):
         return self.__class__(self.__dataset, _group_slice=self.group_slice)
@@ -1268,11 +1281,47 @@ class DatasetView(foc.SampleCollection):
         be updated by calling this method.
         """
         self._dataset.reload()
+        self._stage_pipelines_cache = None
 
         _view = self._base_view
         for stage in self._stages:
             _view = _view.add_stage(stage)
 
+    def explain(self):
+        """Returns the MongoDB aggregation pipeline that defines this view,
+        both before and after optimization.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+            from fiftyone import ViewField as F
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            view = (
+                dataset
+                .filter_labels("predictions", F("confidence") > 0.5)
+                .match(F("uniqueness") > 0.5)
+            )
+
+            explain = view.explain()
+
+            print(explain["pipeline"])
+            print(explain["optimized_pipeline"])
+
+        Returns:
+            a dict containing:
+
+            -   ``pipeline``: the pipeline generated by the view's stages
+            -   ``optimized_pipeline``: the pipeline that is actually executed
+                when the view is aggregated
+        """
+        return {
+            "pipeline": self._pipeline(optimize=False),
+            "optimized_pipeline": self._pipeline(),
+        }
+
     def to_dict(
         self,
         rel_dir=None,
@@ -1403,21 +1452,16 @@ class DatasetView(foc.SampleCollection):
 
         return pipeline
 
-    def _pipeline(
-        self,
-        pipeline=None,
-        media_type=None,
-        attach_frames=False,
-        detach_frames=False,
-        frames_only=False,
-        support=None,
-        group_slice=None,
-        group_slices=None,
-        detach_groups=False,
-        groups_only=False,
-        manual_group_select=False,
-        post_pipeline=None,
-    ):
+    def _get_stage_pipelines(self):
+        # Generating stage pipelines may be expensive, so they are cached for
+        # as long as the dataset's schema and group slice remain unchanged
+        doc = self._dataset._doc
+        key = (id(doc), doc.revision, self.group_slice)
+
+        cache = self._stage_pipelines_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
         _pipelines = []
         _view = self._base_view
 
@@ -1428,6 +1472,7 @@ class DatasetView(foc.SampleCollection):
         _attach_frames_idx1 = None
 
         _contains_groups = self._dataset.media_type == fom.GROUP
+        _manual_group_select = False
         _group_slices = set()
         _attach_groups_idx = None
 
@@ -1454,7 +1499,7 @@ class DatasetView(foc.SampleCollection):
                 if idx == 0:
                     _media_type = stage.get_media_type(_view)
                     if _media_type not in (None, fom.GROUP):
-                        manual_group_select = True
+                        _manual_group_select = True
 
                 # Determine if stage needs group slices attached
                 _stage_group_slices = stage._needs_group_slices(_view)
@@ -1490,6 +1535,53 @@ class DatasetView(foc.SampleCollection):
             _view = _view._add_view_stage(stage, validate=False)
             idx += 1
 
+        result = (
+            _pipelines,
+            _attach_frames_idx,
+            _attach_frames_idx0,
+            _attach_frames_idx1,
+            _found_select_group_slice,
+            _attach_groups_idx,
+            _group_slices,
+            _manual_group_select,
+        )
+        self._stage_pipelines_cache = (key, result)
+
+        return result
+
+    def _pipeline(
+        self,
+        pipeline=None,
+        media_type=None,
+        attach_frames=False,
+        detach_frames=False,
+        frames_only=False,
+        support=None,
+        group_slice=None,
+        group_slices=None,
+        detach_groups=False,
+        groups_only=False,
+        manual_group_select=False,
+        post_pipeline=None,
+        optimize=True,
+    ):
+        (
+            _pipelines,
+            _attach_frames_idx,
+            _attach_frames_idx0,
+            _attach_frames_idx1,
+            _found_select_group_slice,
+            _attach_groups_idx,
+            _group_slices,
+            _manual_group_select,
+        ) = self._get_stage_pipelines()
+
+        # The stage pipelines are cached, so we work with a copy
+        _pipelines = list(_pipelines)
+
+        if _manual_group_select:
+            manual_group_select = True
+
         if _attach_frames_idx is None and (attach_frames or frames_only):
             _attach_frames_idx = len(_pipelines)
 
@@ -1561,7 +1653,7 @@ class DatasetView(foc.SampleCollection):
         if group_slice is None and self._dataset.media_type == fom.GROUP:
             group_slice = self.__group_slice or self._dataset.group_slice
 
-        return self._dataset._pipeline(
+        _pipeline = self._dataset._pipeline(
             pipeline=_pipeline,
             attach_frames=attach_frames,
             detach_frames=detach_frames,
@@ -1576,6 +1668,11 @@ class DatasetView(foc.SampleCollection):
             post_pipeline=post_pipeline,
         )
 
+        if optimize:
+            _pipeline = optimize_pipeline(_pipeline)
+
+        return _pipeline
+
     def _aggregate(
         self,
         pipeline=None,
@@ -1848,6 +1945,228 @@ def make_optimized_select_view(
     return view
 
 
+def optimize_pipeline(pipeline):
+    """Applies a conservative, rule-based optimizer to the given MongoDB
+    aggregation pipeline.
+
+    The following rules are applied:
+
+    -   ``$match`` stages are moved ahead of ``$addFields``, ``$set``, and
+        ``$lookup`` stages that do not modify any fields they reference
+    -   ``$limit`` stages are moved ahead of stages that do not change the
+        number or order of documents
+    -   Adjacent ``$match`` stages are merged
+    -   Adjacent exclusion ``$project`` stages are merged, and ``$project``
+        stages that repeat the previous stage are removed
+
+    The input pipeline is not modified.
+
+    Args:
+        pipeline: a MongoDB aggregation pipeline (a list of dicts)
+
+    Returns:
+        the optimized pipeline
+    """
+    pipeline = _hoist_stages(pipeline)
+    pipeline = _merge_matches(pipeline)
+    pipeline = _merge_projects(pipeline)
+    return pipeline
+
+
+def _get_stage_op(stage):
+    if isinstance(stage, dict) and len(stage) == 1:
+        return next(iter(stage))
+
+    return None
+
+
+def _hoist_stages(pipeline):
+    pipeline = list(pipeline)
+    for idx, stage in enumerate(pipeline):
+        _idx = idx
+        while _idx > 0 and _can_hoist(stage, pipeline[_idx - 1]):
+            pipeline[_idx] = pipeline[_idx - 1]
+            _idx -= 1
+
+        pipeline[_idx] = stage
+
+    return pipeline
+
+
+def _can_hoist(stage, prev_stage):
+    op = _get_stage_op(stage)
+    prev_op = _get_stage_op(prev_stage)
+
+    if op == "$limit":
+        # These stages don't change the number or order of documents
+        return prev_op in (
+            "$addFields",
+            "$set",
+            "$project",
+            "$unset",
+            "$lookup",
+        )
+
+    if op == "$match":
+        if prev_op in ("$addFields", "$set"):
+            modified_fields = _get_roots(prev_stage[prev_op].keys())
+        elif prev_op == "$lookup":
+            modified_fields = _get_roots([prev_stage[prev_op]["as"]])
+        else:
+            return False
+
+        fields = _get_query_fields(stage["$match"])
+        if fields is None:
+            return False
+
+        return not (fields & modified_fields)
+
+    return False
+
+
+def _get_roots(paths):
+    return set(path.split(".", 1)[0] for path in paths)
+
+
+def _get_query_fields(query):
+    # Returns the root fields referenced by the query, or None if they cannot
+    # be determined
+    fields = set()
+    for key, value in query.items():
+        if key in ("$and", "$or", "$nor"):
+            for _query in value:
+                _fields = _get_query_fields(_query)
+                if _fields is None:
+                    return None
+
+                fields.update(_fields)
+        elif key == "$expr":
+            if not _get_expr_fields(value, fields):
+                return None
+        elif key.startswith("$"):
+            # $text, $where, $jsonSchema, etc.
+            return None
+        else:
+            fields.add(key.split(".", 1)[0])
+
+    return fields
+
+
+def _get_expr_fields(expr, fields):
+    # Adds the root fields referenced by the expression to `fields` and returns
+    # True, or returns False if they cannot be determined
+    if isinstance(expr, str):
+        if expr.startswith("$$"):
+            var = expr[2:].split(".", 1)[0]
+            if var in ("ROOT", "CURRENT"):
+                return False
+        elif expr.startswith("$"):
+            fields.add(expr[1:].split(".", 1)[0])
+
+        return True
+
+    if isinstance(expr, dict):
+        for key, value in expr.items():
+            # `$getField` may reference fields without a `$` prefix
+            if key == "$getField":
+                return False
+
+            if not _get_expr_fields(value, fields):
+                return False
+
+        return True
+
+    if isinstance(expr, (list, tuple)):
+        return all(_get_expr_fields(e, fields) for e in expr)
+
+    return True
+
+
+def _merge_matches(pipeline):
+    _pipeline = []
+    for stage in pipeline:
+        if (
+            _pipeline
+            and _get_stage_op(stage) == "$match"
+            and _get_stage_op(_pipeline[-1]) == "$match"
+        ):
+            query = _merge_queries(_pipeline[-1]["$match"], stage["$match"])
+            _pipeline[-1] = {"$match": query}
+        else:
+            _pipeline.append(stage)
+
+    return _pipeline
+
+
+def _merge_queries(query1, query2):
+    if not query1:
+        return query2
+
+    if not query2:
+        return query1
+
+    queries = []
+    for query in (query1, query2):
+        if list(query.keys()) == ["$and"]:
+            queries.extend(query["$and"])
+        else:
+            queries.append(query)
+
+    return {"$and": queries}
+
+
+def _merge_projects(pipeline):
+    _pipeline = []
+    for stage in pipeline:
+        if (
+            _pipeline
+            and _get_stage_op(stage) == "$project"
+            and _get_stage_op(_pipeline[-1]) == "$project"
+        ):
+            project = _merge_project_specs(
+                _pipeline[-1]["$project"], stage["$project"]
+            )
+            if project is not None:
+                _pipeline[-1] = {"$project": project}
+                continue
+
+        _pipeline.append(stage)
+
+    return _pipeline
+
+
+def _merge_project_specs(project1, project2):
+    # Returns a single spec that is equivalent to applying both specs, or None
+    # if the specs cannot be safely merged
+    if not _is_simple_project(project1) or not _is_simple_project(project2):
+        return None
+
+    # Repeated inclusions/exclusions are redundant
+    if project1 == project2:
+        return project1
+
+    # Exclusions can be combined, barring path collisions
+    if any(project1.values()) or any(project2.values()):
+        return None
+
+    for path1 in project1.keys():
+        for path2 in project2.keys():
+            if path1 != path2 and (
+                path1.startswith(path2 + ".") or path2.startswith(path1 + ".")
+            ):
+                return None
+
+    project = dict(project1)
+    project.update(project2)
+    return project
+
+
+def _is_simple_project(project):
+    return all(
+        isinstance(v, (bool, int)) and v in (0, 1) for v in project.values()
+    )
+
+
 def _merge_selected_fields(selected_fields, sf):
     #
     # When merging selected fields from multiple view stages, it is possible
@@ -16,10 +16,6 @@ from fiftyone.factory.repos.delegated_operation import (
 )
 
 
-db_client: pymongo.mongo_client.MongoClient = foo.get_db_client()
-db: Database = db_client[fo.config.database_name]
-
-
 class RepositoryFactory(object):
     repos = {}
 
@@ -29,6 +25,8 @@ class RepositoryFactory(object):
             MongoDelegatedOperationRepo.COLLECTION_NAME
             not in RepositoryFactory.repos
         ):
+            db_client: pymongo.mongo_client.MongoClient = foo.get_db_client()
+            db: Database = db_client[fo.config.database_name]
             RepositoryFactory.repos[
                 MongoDelegatedOperationRepo.COLLECTION_NAME
             ] = MongoDelegatedOperationRepo(
@@ -5,7 +5,7 @@ FiftyOne delegated operation repository.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, List
 
 from bson import ObjectId
@@ -38,6 +38,31 @@ class DelegatedOperationRepo(object):
         """Update the run state of an operation."""
         raise NotImplementedError("subclass must implement update_run_state()")
 
+    def claim_operation(
+        self,
+        worker_id: str = None,
+        operator: str = None,
+        dataset_name: str = None,
+        delegation_target: str = None,
+        **kwargs: Any,
+    ) -> DelegatedOperationDocument:
+        """Atomically claim the oldest matching queued operation by moving it
+        to running state, or return None if there are no queued operations.
+        """
+        raise NotImplementedError("subclass must implement claim_operation()")
+
+    def ping(self, _ids: List[ObjectId]):
+        """Update the heartbeat of the given running operations."""
+        raise NotImplementedError("subclass must implement ping()")
+
+    def requeue_stale_operations(self, timeout: float) -> int:
+        """Requeue running operations whose heartbeat is older than the given
+        number of seconds.
+        """
+        raise NotImplementedError(
+            "subclass must implement requeue_stale_operations()"
+        )
+
     def get_queued_operations(
         self, operator: str = None, dataset_name=None
     ) -> List[DelegatedOperationDocument]:
@@ -126,6 +151,16 @@ class MongoDelegatedOperationRepo(DelegatedOperationRepo):
                     [("run_state", pymongo.ASCENDING)], name="run_state_1"
                 )
             )
+        if "run_state_1_queued_at_1" not in index_names:
+            indices_to_create.append(
+                IndexModel(
+                    [
+                        ("run_state", pymongo.ASCENDING),
+                        ("queued_at", pymongo.ASCENDING),
+                    ],
+                    name="run_state_1_queued_at_1",
+                )
+            )
 
         if indices_to_create:
             self._collection.create_indexes(indices_to_create)
@@ -217,6 +252,79 @@ class MongoDelegatedOperationRepo(DelegatedOperationRepo):
 
         return DelegatedOperationDocument().from_pymongo(doc)
 
+    def claim_operation(
+        self,
+        worker_id: str = None,
+        operator: str = None,
+        dataset_name: str = None,
+        delegation_target: str = None,
+        **kwargs: Any,
+    ) -> DelegatedOperationDocument:
+        query = {"run_state": ExecutionRunState.QUEUED}
+        if operator:
+            query["operator"] = operator
+        if dataset_name:
+            query["context.request_params.dataset_name"] = dataset_name
+        if delegation_target:
+            query["delegation_target"] = delegation_target
+
+        for arg in kwargs:
+            query[arg] = kwargs[arg]
+
+        now = datetime.utcnow()
+        doc = self._collection.find_one_and_update(
+            filter=query,
+            update={
+                "$set": {
+                    "run_state": ExecutionRunState.RUNNING,
+                    "started_at": now,
+                    "updated_at": now,
+                    "heartbeat_at": now,
+                    "worker_id": worker_id,
+                }
+            },
+            sort=[("queued_at", pymongo.ASCENDING)],
+            return_document=pymongo.ReturnDocument.AFTER,
+        )
+
+        if doc is None:
+            return None
+
+        return DelegatedOperationDocument().from_pymongo(doc)
+
+    def ping(self, _ids: List[ObjectId]):
+        if not _ids:
+            return
+
+        self._collection.update_many(
+            filter={
+                "_id": {"$in": list(_ids)},
+                "run_state": ExecutionRunState.RUNNING,
+            },
+            update={"$set": {"heartbeat_at": datetime.utcnow()}},
+        )
+
+    def requeue_stale_operations(self, timeout: float) -> int:
+        # Only operations that were claimed by a worker have heartbeats
+        cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+        result = self._collection.update_many(
+            filter={
+                "run_state": ExecutionRunState.RUNNING,
+                "heartbeat_at": {"$lt": cutoff},
+            },
+            update={
+                "$set": {
+                    "run_state": ExecutionRunState.QUEUED,
+                    "updated_at": datetime.utcnow(),
+                    "started_at": None,
+                    "heartbeat_at": None,
+                    "worker_id": None,
+                }
+            },
+        )
+
+        return result.modified_count
+
     def get_queued_operations(
         self,
         operator: str = None,
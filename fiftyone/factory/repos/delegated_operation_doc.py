@@ -40,6 +40,8 @@ class DelegatedOperationDocument(object):
         self.updated_at = datetime.utcnow()
         self.dataset_id = None
         self.started_at = None
+        self.heartbeat_at = None
+        self.worker_id = None
         self.pinned = False
         self.completed_at = None
         self.failed_at = None
@@ -59,6 +61,10 @@ class DelegatedOperationDocument(object):
             doc["delegation_target"] if "delegation_target" in doc else None
         )
         self.started_at = doc["started_at"] if "started_at" in doc else None
+        self.heartbeat_at = (
+            doc["heartbeat_at"] if "heartbeat_at" in doc else None
+        )
+        self.worker_id = doc["worker_id"] if "worker_id" in doc else None
         self.completed_at = (
             doc["completed_at"] if "completed_at" in doc else None
         )
@@ -6,15 +6,17 @@ FiftyOne operator decorators.
 |
 """
 import asyncio
-import glob
+import hashlib
 
 from cachetools.keys import hashkey
 from contextlib import contextmanager
 from functools import wraps
 import signal
 import os
+import threading
 
 import fiftyone as fo
+from fiftyone.core.config import locate_app_config
 
 
 def coroutine_timeout(seconds):
@@ -56,13 +58,20 @@ def raise_timeout_error(seconds):
 
 
 cache = {}
-dir_cache = {"state": None}
+dir_cache = {"state": None, "depth": 0}
+_cache_lock = threading.RLock()
+
+_IGNORED_PLUGIN_DIRS = {"__pycache__", "node_modules"}
 
 
 def plugins_cache(func):
-    """Decorator that returns cached function results as long as no
-    subdirectories of ``fo.config.plugins_dir`` have been modified since last
-    time.
+    """Decorator that returns cached function results as long as no plugin
+    files in ``fo.config.plugins_dir`` and no plugin settings in the App
+    config have been modified since last time.
+
+    Caching can be disabled via ``fo.config.plugins_cache_enabled``.
+
+    The cache can be explicitly invalidated via :func:`clear_plugins_cache`.
     """
 
     @wraps(func)
@@ -70,25 +79,90 @@ def plugins_cache(func):
         if not fo.config.plugins_cache_enabled:
             return func(*args, **kwargs)
 
-        curr_dir_state = dir_state(fo.config.plugins_dir)
-        if curr_dir_state != dir_cache["state"]:
-            cache.clear()
-            dir_cache["state"] = curr_dir_state
-
-        key = hashkey(func, *args, **kwargs)
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
+        with plugins_cache_validated():
+            key = hashkey(func, *args, **kwargs)
+            if key not in cache:
+                cache[key] = func(*args, **kwargs)
 
-        return cache[key]
+            return cache[key]
 
     return wrapper
 
 
-def dir_state(dirpath):
-    if not os.path.isdir(dirpath):
-        return None
-    # use glob instead of os.listdir to ignore hidden files (eg .DS_STORE)
-    return max(
-        (os.path.getmtime(f) for f in glob.glob(os.path.join(dirpath, "*"))),
-        default=None,
-    )
+@contextmanager
+def plugins_cache_validated():
+    """Context manager that invalidates the :func:`plugins_cache` if any
+    plugins have been modified since last time.
+
+    Any cached functions that are called within the context reuse this
+    validation rather than rescanning ``fo.config.plugins_dir``.
+    """
+    if not fo.config.plugins_cache_enabled:
+        yield
+        return
+
+    with _cache_lock:
+        if not dir_cache["depth"]:
+            curr_dir_state = plugins_state(fo.config.plugins_dir)
+            if curr_dir_state != dir_cache["state"]:
+                cache.clear()
+                dir_cache["state"] = curr_dir_state
+
+        dir_cache["depth"] += 1
+        try:
+            yield
+        finally:
+            dir_cache["depth"] -= 1
+
+
+def clear_plugins_cache():
+    """Clears all results cached by :func:`plugins_cache`.
+
+    This should be called whenever plugins are added, removed, enabled, or
+    disabled.
+    """
+    with _cache_lock:
+        cache.clear()
+        dir_cache["state"] = None
+
+
+def plugins_state(dirpath):
+    """Returns a hash that changes whenever a plugin in the given directory or
+    the plugin settings in the App config are modified.
+
+    The hash covers the paths, modification times, and sizes of all
+    non-hidden files in ``dirpath``, excluding the contents of
+    ``__pycache__`` and ``node_modules`` directories.
+
+    Args:
+        dirpath: the plugins directory
+
+    Returns:
+        a hash string
+    """
+    state = hashlib.md5()
+
+    if dirpath and os.path.isdir(dirpath):
+        for root, dirs, files in os.walk(dirpath, followlinks=True):
+            dirs[:] = sorted(
+                d
+                for d in dirs
+                if not d.startswith(".") and d not in _IGNORED_PLUGIN_DIRS
+            )
+            for filename in sorted(files):
+                if not filename.startswith("."):
+                    _update_state(state, os.path.join(root, filename))
+
+    _update_state(state, locate_app_config())
+
+    return state.hexdigest()
+
+
+def _update_state(state, path):
+    try:
+        stat = os.stat(path)
+        entry = "%s:%d:%d\n" % (path, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        entry = "%s\n" % path
+
+    state.update(entry.encode())
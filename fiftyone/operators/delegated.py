@@ -7,8 +7,14 @@ FiftyOne delegated operations.
 """
 import asyncio
 import logging
+import os
+import socket
+import threading
+import time
 import traceback
 
+import fiftyone.core.odm as foo
+import fiftyone.core.utils as fou
 from fiftyone.factory.repo_factory import RepositoryFactory
 from fiftyone.factory import DelegatedOperationPagingParams
 from fiftyone.operators.executor import (
@@ -22,13 +28,20 @@ logger = logging.getLogger(__name__)
 
 
 class DelegatedOperationService(object):
-    """Service for executing delegated operations."""
+    """Service for executing delegated operations.
+
+    Operations are claimed atomically before they are executed, so any number
+    of services, in any number of processes, can safely execute operations
+    from the same queue.
+    """
 
     def __init__(self, repo=None):
         if repo is None:
             repo = RepositoryFactory.delegated_operation_repo()
 
         self._repo = repo
+        self._worker_id = "%s:%d" % (socket.gethostname(), os.getpid())
+        self._stats = _ExecutionStats()
 
     def queue_operation(self, operator, delegation_target=None, context=None):
         """Queues the given delegated operation for execution.
@@ -205,6 +218,61 @@ class DelegatedOperationService(object):
             **kwargs,
         )
 
+    def claim_operation(
+        self,
+        operator=None,
+        delegation_target=None,
+        dataset_name=None,
+        **kwargs,
+    ):
+        """Atomically claims the oldest queued delegated operation matching
+        the given criteria by moving it to running state.
+
+        Args:
+            operator (None): the optional name of the operator whose queued
+                operations to claim
+            delegation_target (None): the optional delegation target of the
+                queued operations to claim
+            dataset_name (None): the optional name of the dataset whose
+                queued operations to claim
+
+        Returns:
+            a :class:`fiftyone.factory.repos.DelegatedOperationDocument`, or
+            None if no matching operations are queued
+        """
+        return self._repo.claim_operation(
+            worker_id=self._worker_id,
+            operator=operator,
+            delegation_target=delegation_target,
+            dataset_name=dataset_name,
+            **kwargs,
+        )
+
+    def requeue_stale_operations(self, timeout):
+        """Requeues claimed delegated operations whose executors have not
+        reported a heartbeat in the given amount of time.
+
+        Args:
+            timeout: the timeout, in seconds
+
+        Returns:
+            the number of requeued operations
+        """
+        return self._repo.requeue_stale_operations(timeout)
+
+    def get_stats(self):
+        """Returns statistics about the delegated operations that have been
+        executed by this service.
+
+        Returns:
+            a dict containing the number of ``completed`` and ``failed``
+            operations, the ``throughput`` in operations per second while
+            executing, the ``avg_execution_time`` of operations in seconds,
+            and the ``avg_queue_latency`` in seconds between when operations
+            were queued and when they started running
+        """
+        return self._stats.to_dict()
+
     def execute_queued_operations(
         self,
         operator=None,
@@ -212,10 +280,18 @@ class DelegatedOperationService(object):
         dataset_name=None,
         limit=None,
         log=False,
+        num_workers=None,
+        lease_timeout=300,
         **kwargs,
     ):
         """Executes queued delegated operations matching the given criteria.
 
+        Each operation is atomically claimed before it is executed, and
+        executors send periodic heartbeats for the operations that they are
+        running. Any claimed operations whose heartbeats are older than
+        ``lease_timeout`` are assumed to belong to executors that have died,
+        and are requeued before execution begins.
+
         Args:
             operator (None): the optional name of the operator to execute all
                 the queued delegated operations for
@@ -227,36 +303,139 @@ class DelegatedOperationService(object):
                 operations to execute
             log (False): the optional boolean flag to log the execution of the
                 delegated operations
+            num_workers (None): the number of worker processes to use to
+                execute operations concurrently. By default, operations are
+                executed serially in this process
+            lease_timeout (300): the number of seconds after which claimed
+                operations without a heartbeat are requeued, or None to
+                disable requeuing
         """
-        if limit is not None:
-            paging = DelegatedOperationPagingParams(limit=limit)
+        if lease_timeout is not None:
+            num_requeued = self.requeue_stale_operations(lease_timeout)
+            if num_requeued and log:
+                logger.info("Requeued %d stale operation(s)", num_requeued)
+
+            heartbeat_interval = lease_timeout / 10.0
         else:
-            paging = None
+            heartbeat_interval = 30.0
 
-        queued_ops = self.list_operations(
+        claim_kwargs = dict(
             operator=operator,
-            dataset_name=dataset_name,
             delegation_target=delegation_target,
-            run_state=ExecutionRunState.QUEUED,
-            paging=paging,
+            dataset_name=dataset_name,
             **kwargs,
         )
 
-        for op in queued_ops:
+        with _Heartbeat(self._repo, heartbeat_interval) as heartbeat:
+            if num_workers is None or num_workers <= 1:
+                self._execute_serial(heartbeat, limit, log, claim_kwargs)
+            else:
+                self._execute_parallel(
+                    heartbeat, num_workers, limit, log, claim_kwargs
+                )
+
+    def _execute_serial(self, heartbeat, limit, log, claim_kwargs):
+        num_claimed = 0
+        while limit is None or num_claimed < limit:
+            op = self.claim_operation(**claim_kwargs)
+            if op is None:
+                break
+
+            num_claimed += 1
+            heartbeat.add(op.id)
             try:
-                if log:
-                    logger.info(
-                        "\nRunning operation %s (%s)", op.id, op.operator
-                    )
-                result = asyncio.run(self._execute_operator(op))
-                self.set_completed(doc_id=op.id, result=result)
-                if log:
-                    logger.info("Operation %s complete", op.id)
-            except:
-                result = ExecutionResult(error=traceback.format_exc())
-                self.set_failed(doc_id=op.id, result=result)
-                if log:
-                    logger.info("Operation %s failed", op.id)
+                self._execute_queued_operation(op, log=log)
+            finally:
+                heartbeat.remove(op.id)
+
+    def _execute_parallel(
+        self, heartbeat, num_workers, limit, log, claim_kwargs
+    ):
+        # Process pools are only needed here, so we avoid importing them (and
+        # registering their exit handlers) whenever this module is imported
+        from concurrent.futures import (
+            FIRST_COMPLETED,
+            ProcessPoolExecutor,
+            wait,
+        )
+        from concurrent.futures.process import BrokenProcessPool
+
+        # Worker processes execute operations via the default repository
+        ctx = fou.get_multiprocessing_context()
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+        ) as pool:
+            running = {}
+            num_claimed = 0
+            broken = False
+            while True:
+                while (
+                    not broken
+                    and len(running) < num_workers
+                    and (limit is None or num_claimed < limit)
+                ):
+                    op = self.claim_operation(**claim_kwargs)
+                    if op is None:
+                        break
+
+                    num_claimed += 1
+                    heartbeat.add(op.id)
+                    if log:
+                        logger.info(
+                            "\nRunning operation %s (%s)", op.id, op.operator
+                        )
+
+                    future = pool.submit(_do_execute_operation, op.id)
+                    running[future] = (op, time.time())
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    op, start = running.pop(future)
+                    heartbeat.remove(op.id)
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        # The worker died before it could record the outcome
+                        broken |= isinstance(e, BrokenProcessPool)
+                        result = ExecutionResult(error=traceback.format_exc())
+                        self.set_failed(doc_id=op.id, result=result)
+                        success = False
+
+                    self._stats.add(op, start, success)
+                    if log:
+                        if success:
+                            logger.info("Operation %s complete", op.id)
+                        else:
+                            logger.info("Operation %s failed", op.id)
+
+    def _execute_queued_operation(self, op, log=False):
+        start = time.time()
+        if log:
+            logger.info("\nRunning operation %s (%s)", op.id, op.operator)
+
+        success = self._run_operation(op)
+
+        self._stats.add(op, start, success)
+        if log:
+            if success:
+                logger.info("Operation %s complete", op.id)
+            else:
+                logger.info("Operation %s failed", op.id)
+
+    def _run_operation(self, op):
+        try:
+            result = asyncio.run(self._execute_operator(op))
+            self.set_completed(doc_id=op.id, result=result)
+            return True
+        except:
+            result = ExecutionResult(error=traceback.format_exc())
+            self.set_failed(doc_id=op.id, result=result)
+            return False
 
     def count(self, filters=None, search=None):
         """Counts the delegated operations matching the given criteria.
@@ -288,3 +467,101 @@ class DelegatedOperationService(object):
             operator, _, ctx = prepared
             self.set_running(doc_id=doc.id)
             return operator.execute(ctx)
+
+
+class _Heartbeat(object):
+    def __init__(self, repo, interval):
+        self._repo = repo
+        self._interval = interval
+        self._ids = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stopped.set()
+        self._thread.join()
+
+    def add(self, _id):
+        with self._lock:
+            self._ids.add(_id)
+
+    def remove(self, _id):
+        with self._lock:
+            self._ids.discard(_id)
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            with self._lock:
+                ids = list(self._ids)
+
+            try:
+                self._repo.ping(ids)
+            except Exception as e:
+                logger.warning("Failed to send heartbeat: %s", e)
+
+
+class _ExecutionStats(object):
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.execution_time = 0.0
+        self.queue_latency = 0.0
+        self._busy_time = 0.0
+        self._busy_until = None
+        self._lock = threading.Lock()
+
+    def add(self, op, start, success):
+        end = time.time()
+        with self._lock:
+            if success:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+            self.execution_time += end - start
+            if op.started_at is not None and op.queued_at is not None:
+                latency = (op.started_at - op.queued_at).total_seconds()
+                self.queue_latency += max(latency, 0.0)
+
+            # Overlapping executions only count once towards busy time
+            if self._busy_until is None or start >= self._busy_until:
+                self._busy_time += end - start
+            elif end > self._busy_until:
+                self._busy_time += end - self._busy_until
+
+            self._busy_until = max(end, self._busy_until or end)
+
+    def to_dict(self):
+        with self._lock:
+            num_ops = self.completed + self.failed
+            return {
+                "completed": self.completed,
+                "failed": self.failed,
+                "throughput": (
+                    num_ops / self._busy_time if self._busy_time > 0 else None
+                ),
+                "avg_execution_time": (
+                    self.execution_time / num_ops if num_ops else None
+                ),
+                "avg_queue_latency": (
+                    self.queue_latency / num_ops if num_ops else None
+                ),
+            }
+
+
+def _init_worker():
+    # Don't share database connections with the parent process
+    foo.reset_db_conn()
+    RepositoryFactory.repos.clear()
+
+
+def _do_execute_operation(doc_id):
+    svc = DelegatedOperationService()
+    op = svc.get(doc_id)
+    return svc._run_operation(op)
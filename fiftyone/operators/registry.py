@@ -50,6 +50,11 @@ class OperatorRegistry(object):
     def __init__(self, enabled=True):
         self.plugin_contexts = fopc.build_plugin_contexts(enabled=enabled)
 
+        # Index operators by URI. If URIs collide, the first operator wins
+        self._operators = {}
+        for operator in self.list_operators():
+            self._operators.setdefault(operator.uri, operator)
+
     def list_operators(self, include_builtin=True):
         """Lists the available FiftyOne operators.
 
@@ -89,11 +94,7 @@ class OperatorRegistry(object):
         Returns:
             True/False
         """
-        for operator in self.list_operators():
-            if operator_uri == operator.uri:
-                return True
-
-        return False
+        return operator_uri in self._operators
 
     def can_execute(self, operator_uri):
         """Whether the operator can be executed.
@@ -115,8 +116,4 @@ class OperatorRegistry(object):
         Returns:
             an :class:`fiftyone.operators.Operator`, or None
         """
-        for operator in self.list_operators():
-            if operator_uri == operator.uri:
-                return operator
-
-        return None
+        return self._operators.get(operator_uri, None)
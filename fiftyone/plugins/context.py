@@ -14,7 +14,10 @@ import traceback
 import fiftyone as fo
 import fiftyone.plugins as fop
 
-from fiftyone.operators.decorators import plugins_cache
+from fiftyone.operators.decorators import (
+    plugins_cache,
+    plugins_cache_validated,
+)
 from fiftyone.operators.operator import Operator
 
 
@@ -23,10 +26,13 @@ logger = logging.getLogger(__name__)
 INIT_FILENAME = "__init__.py"
 
 
-@plugins_cache
 def build_plugin_contexts(enabled=True):
     """Returns contexts for all available plugins.
 
+    Plugin definitions and modules are cached via
+    :func:`fiftyone.operators.decorators.plugins_cache`, but each call returns
+    new contexts with new operator instances.
+
     Args:
         enabled (True): whether to include only enabled plugins (True) or only
             disabled plugins (False) or all plugins ("all")
@@ -35,14 +41,37 @@ def build_plugin_contexts(enabled=True):
         a list of :class:`PluginContext` instances
     """
     plugin_contexts = []
-    for pd in fop.list_plugins(enabled=enabled):
-        pctx = PluginContext(pd)
-        pctx.register_all()
-        plugin_contexts.append(pctx)
+    with plugins_cache_validated():
+        for pd in _list_plugins(enabled=enabled):
+            pctx = PluginContext(pd)
+            pctx.register_all()
+            plugin_contexts.append(pctx)
 
     return plugin_contexts
 
 
+@plugins_cache
+def _list_plugins(enabled=True):
+    return fop.list_plugins(enabled=enabled)
+
+
+@plugins_cache
+def _load_plugin_module(module_dir):
+    module_path = os.path.join(module_dir, INIT_FILENAME)
+    if not os.path.isfile(module_path):
+        return None
+
+    module_name = os.path.relpath(module_dir, fo.config.plugins_dir).replace(
+        "/", "."
+    )
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module.__name__] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+
 class PluginContext(object):
     """Context that represents a plugin and the Python objects it creates.
 
@@ -121,20 +150,10 @@ class PluginContext(object):
         self.dispose_all()
 
         try:
-            module_dir = self.plugin_definition.directory
-            module_path = os.path.join(module_dir, INIT_FILENAME)
-            if not os.path.isfile(module_path):
+            module = _load_plugin_module(self.plugin_definition.directory)
+            if module is None:
                 return
 
-            module_name = os.path.relpath(
-                module_dir, fo.config.plugins_dir
-            ).replace("/", ".")
-            spec = importlib.util.spec_from_file_location(
-                module_name, module_path
-            )
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module.__name__] = module
-            spec.loader.exec_module(module)
             module.register(self)
         except:
             logger.warning(
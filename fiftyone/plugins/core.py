@@ -26,6 +26,8 @@ import fiftyone.core.utils as fou
 from fiftyone.plugins.definitions import PluginDefinition
 from fiftyone.utils.github import GitHubRepository
 
+fopd = fou.lazy_import("fiftyone.operators.decorators")
+
 
 _PLUGIN_METADATA_FILENAMES = ["fiftyone.yaml", "fiftyone.yml"]
 
@@ -98,6 +100,7 @@ def delete_plugin(plugin_name):
     plugin = _get_plugin(plugin_name)
     _update_plugin_settings(plugin_name, delete=True)
     etau.delete_dir(plugin.path)
+    fopd.clear_plugins_cache()
 
 
 def list_downloaded_plugins():
@@ -263,6 +266,9 @@ def download_plugin(
         if missing_plugins:
             logger.warning(f"Plugins not found: {missing_plugins}")
 
+    if downloaded_plugins:
+        fopd.clear_plugins_cache()
+
     return downloaded_plugins
 
 
@@ -484,6 +490,8 @@ def create_plugin(
     with open(yaml_path, "w") as f:
         yaml.dump(pd, f)
 
+    fopd.clear_plugins_cache()
+
     return plugin_dir
 
 
@@ -683,3 +691,5 @@ def _update_plugin_settings(plugin_name, enabled=None, delete=False, **kwargs):
 
     with open(app_config_path, "wt") as f:
         json.dump(app_config, f, indent=4)
+
+    fopd.clear_plugins_cache()
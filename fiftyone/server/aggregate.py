@@ -5,9 +5,11 @@ FiftyOne Server aggregations
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from dataclasses import asdict
 from datetime import date, datetime, timedelta
 import typing as t
 
+from bson import json_util
 import strawberry as gql
 
 import fiftyone as fo
@@ -17,11 +19,19 @@ import fiftyone.core.collections as foc
 from fiftyone.server.constants import LIST_LIMIT
 from fiftyone.server.data import T
 from fiftyone.server.scalars import BSONArray
+from fiftyone.server.utils import get_dataset_revision, RevisionCache
 from fiftyone.server.view import load_view, ExtendedViewForm
 
 
 _DEFAULT_NUM_HISTOGRAM_BINS = 25
 
+# The TTL bounds the staleness of results if a dataset is modified without
+# updating its revision
+_CACHE_MAX_SIZE = 4096
+_CACHE_TTL = 600  # seconds
+
+_cache = RevisionCache(_CACHE_MAX_SIZE, ttl=_CACHE_TTL)
+
 
 @gql.type
 class CountResponse:
@@ -146,16 +156,38 @@ class AggregateQuery:
             ),
         )
     ]:
+        form = form or ExtendedViewForm()
+
+        # The revision must be retrieved before any results are computed
+        revision = await get_dataset_revision(dataset_name)
+        serialized_view = view
+
         view = await load_view(
             dataset_name=dataset_name,
-            serialized_view=view,
+            serialized_view=serialized_view,
             view_name=view_name,
-            form=(form or ExtendedViewForm()),
+            form=form,
+        )
+
+        cache_key = _make_cache_key(
+            view, revision, serialized_view, view_name, form
         )
 
+        responses = [None] * len(aggregations)
+        keys = []
         resolvers = []
         aggs = []
-        for input in aggregations:
+        for idx, input in enumerate(aggregations):
+            if cache_key is not None:
+                key = (cache_key, _serialize_input(input))
+            else:
+                key = None
+
+            response = _cache.get(key)
+            if response is not None:
+                responses[idx] = response
+                continue
+
             if input.count:
                 resolve, agg = await _count(view, input.count)
             elif input.count_values:
@@ -165,18 +197,62 @@ class AggregateQuery:
                     view, input.histogram_values
                 )
 
+            keys.append((idx, key))
             aggs.append(agg)
             resolvers.append(resolve)
 
         results = await view._async_aggregate(aggs)
 
-        responses = []
-        for resolver, result in zip(resolvers, results):
-            responses.append(resolver(result))
+        for (idx, key), resolver, result in zip(keys, resolvers, results):
+            response = resolver(result)
+            responses[idx] = response
+            _cache.set(key, response)
 
         return responses
 
 
+def get_cache_stats():
+    """Returns statistics about the aggregation result cache.
+
+    Returns:
+        a dict containing the number of cache ``hits`` and ``misses``, and the
+        current ``size`` and ``max_size`` of the cache
+    """
+    return _cache.stats()
+
+
+def clear_cache():
+    """Clears the aggregation result cache and resets its statistics."""
+    _cache.clear()
+
+
+def _make_cache_key(view, revision, serialized_view, view_name, form):
+    if revision is None:
+        return None
+
+    return json_util.dumps(
+        [
+            # A deleted dataset may be replaced by one with the same name
+            view._dataset._doc.id,
+            revision,
+            serialized_view,
+            view_name,
+            asdict(form),
+        ],
+        sort_keys=True,
+    )
+
+
+def _serialize_input(input: Aggregate) -> t.Tuple[str, str]:
+    if input.count:
+        return "count", input.count.field
+
+    if input.count_values:
+        return "count_values", input.count_values.field
+
+    return "histogram_values", input.histogram_values.field
+
+
 async def _count(
     view: foc.SampleCollection, input: Count
 ) -> t.Tuple[t.Callable[[t.List], CountResponse], foa.Count]:
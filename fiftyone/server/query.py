@@ -43,7 +43,7 @@ from fiftyone.server.samples import (
     paginate_samples,
 )
 from fiftyone.server.scalars import BSON, BSONArray, JSON
-from fiftyone.server.utils import from_dict
+from fiftyone.server.utils import from_dict, load_and_sync_dataset
 
 
 ID = gql.scalar(
@@ -565,8 +565,7 @@ async def serialize_dataset(
     dicts=True,
 ) -> Dataset:
     def run():
-        dataset = fod.load_dataset(dataset_name)
-        dataset.reload()
+        dataset, _ = load_and_sync_dataset(dataset_name)
         view_name = None
         try:
             doc = dataset._get_saved_view_doc(saved_view_slug, slug=True)
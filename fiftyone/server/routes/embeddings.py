@@ -6,9 +6,14 @@ FiftyOne Server ``/embeddings`` route.
 |
 """
 import itertools
+import struct
+import sys
 
+from bson import json_util
+import numpy as np
 from starlette.endpoints import HTTPEndpoint
 from starlette.requests import Request
+from starlette.responses import Response
 
 import fiftyone.core.fields as fof
 import fiftyone.core.stages as fos
@@ -28,6 +33,31 @@ COLOR_BY_TYPES = (
     fof.FloatField,
 )
 
+# Plots are also keyed by brain run timestamp, so that regenerating a brain
+# run invalidates its plots. The cache is bounded by the approximate memory
+# footprint of the plots, in bytes
+_PLOT_CACHE_MAX_BYTES = 256 * 1024**2
+
+
+def _get_plot_size(plot):
+    # The points and per-point lists of IDs and labels of the traces dominate
+    # the size of large plots
+    size = 0
+    for trace in plot.get("traces", {}).values():
+        size += trace["points"].nbytes
+        for key in ("ids", "sample_ids", "labels"):
+            values = trace.get(key, None)
+            if values:
+                size += sys.getsizeof(values)
+                size += sum(map(sys.getsizeof, values))
+
+    return size
+
+
+_plot_cache = fosu.RevisionCache(
+    _PLOT_CACHE_MAX_BYTES, getsizeof=_get_plot_size
+)
+
 
 def get_sample_filter(slices):
     if slices:
@@ -37,8 +67,23 @@ def get_sample_filter(slices):
 class OnPlotLoad(HTTPEndpoint):
     @route
     async def post(self, request: Request, data: dict) -> dict:
-        """Loads an embeddings plot based on the current view."""
-        return await run_sync_task(self._post_sync, data)
+        """Loads an embeddings plot based on the current view.
+
+        By default, the plot is returned as JSON traces. If the request
+        contains ``"format": "binary"``, the plot is instead returned as a
+        compact binary payload; see :func:`encode_plot` for details.
+        """
+        plot = await run_sync_task(self._post_sync, data)
+
+        if data.get("format", None) == "binary":
+            return Response(
+                encode_plot(plot), media_type="application/octet-stream"
+            )
+
+        if "error" in plot:
+            return plot
+
+        return await run_sync_task(_plot_to_json, plot)
 
     def _post_sync(self, data):
         dataset_name = data["datasetName"]
@@ -47,7 +92,33 @@ class OnPlotLoad(HTTPEndpoint):
         filters = data.get("filters", None)
         label_field = data["labelField"]
         slices = data["slices"]
-        dataset = fosu.load_and_cache_dataset(dataset_name)
+
+        # The revision must be retrieved before the plot is computed
+        dataset, revision = fosu.load_and_sync_dataset(
+            dataset_name, reload=False
+        )
+
+        try:
+            timestamp = dataset.get_brain_info(brain_key).timestamp
+        except:
+            timestamp = None
+
+        key = json_util.dumps(
+            [
+                dataset._doc.id,
+                revision,
+                brain_key,
+                timestamp,
+                stages,
+                filters,
+                slices,
+                label_field,
+            ]
+        )
+
+        plot = _plot_cache.get(key)
+        if plot is not None:
+            return plot
 
         try:
             results = dataset.load_brain_results(brain_key)
@@ -92,7 +163,7 @@ class OnPlotLoad(HTTPEndpoint):
             sample_ids = results._curr_sample_ids
         else:
             ids = results._curr_sample_ids
-            sample_ids = itertools.repeat(None)
+            sample_ids = None
 
         # Color by data
         if label_field:
@@ -128,17 +199,11 @@ class OnPlotLoad(HTTPEndpoint):
                 else:
                     style = "continuous"
         else:
-            labels = itertools.repeat(None)
+            labels = None
             style = "uncolored"
 
-        selected = itertools.repeat(True)
-
-        traces = {}
-        for data in zip(points, ids, sample_ids, labels, selected):
-            _add_to_trace(traces, style, *data)
-
-        return {
-            "traces": traces,
+        plot = {
+            "traces": _make_traces(style, points, ids, sample_ids, labels),
             "style": style,
             "index_size": index_size,
             "available_count": available_count,
@@ -146,6 +211,10 @@ class OnPlotLoad(HTTPEndpoint):
             "patches_field": patches_field,
         }
 
+        _plot_cache.set(key, plot)
+
+        return plot
+
 
 class EmbeddingsSelection(HTTPEndpoint):
     @route
@@ -315,17 +384,151 @@ EmbeddingsRoutes = [
 ]
 
 
-def _add_to_trace(traces, style, points, id, sample_id, label, selected):
-    key = label if style == "categorical" else "points"
-    if key not in traces:
-        traces[key] = []
+def encode_plot(plot):
+    """Encodes an embeddings plot as a compact binary payload.
+
+    The payload has the following layout, where all integers are little
+    endian:
+
+    -   a uint32 containing the length ``N`` of the header
+    -   ``N`` bytes containing the UTF-8 JSON header, padded with spaces to a
+        multiple of 4 bytes. The header contains the metadata of the plot and
+        a ``traces`` list whose elements contain the ``key`` and ``count`` of
+        each trace, plus the ``label`` of its points for categorical plots or
+        the ``labels`` of its points for continuous plots
+    -   a float32 array containing the ``[x, y]`` coordinates of the points of
+        each trace, in order
+    -   a uint8 array containing the 12-byte IDs of the points of each trace
+    -   if the header's ``has_sample_ids`` is True, a uint8 array containing
+        the 12-byte sample IDs of the points of each trace
+
+    Args:
+        plot: a plot dict
 
-    traces[key].append(
-        {
+    Returns:
+        the encoded bytes
+    """
+    header = {k: v for k, v in plot.items() if k != "traces"}
+    header["traces"] = []
+    header["has_sample_ids"] = False
+
+    points = []
+    ids = []
+    sample_ids = []
+    for key, trace in plot.get("traces", {}).items():
+        d = {"key": key, "count": len(trace["ids"])}
+        if plot["style"] == "categorical":
+            d["label"] = trace["label"]
+        elif plot["style"] == "continuous":
+            d["labels"] = trace["labels"]
+
+        header["traces"].append(d)
+        points.append(trace["points"])
+        ids.append(trace["ids"])
+        if trace["sample_ids"] is not None:
+            header["has_sample_ids"] = True
+            sample_ids.append(trace["sample_ids"])
+
+    _header = json_util.dumps(header).encode("utf-8")
+    _header += b" " * (-len(_header) % 4)
+
+    chunks = [struct.pack("<I", len(_header)), _header]
+
+    if points:
+        chunks.append(np.concatenate(points).astype("<f4").tobytes())
+
+    chunks.append(_encode_ids(ids))
+    if header["has_sample_ids"]:
+        chunks.append(_encode_ids(sample_ids))
+
+    return b"".join(chunks)
+
+
+def _encode_ids(ids):
+    return bytes.fromhex("".join(itertools.chain.from_iterable(ids)))
+
+
+def _make_traces(style, points, ids, sample_ids, labels):
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    ids = list(ids)
+    if sample_ids is not None:
+        sample_ids = list(sample_ids)
+
+    if not ids:
+        return {}
+
+    if style != "categorical":
+        if labels is not None:
+            labels = list(labels)
+
+        trace = {
             "points": points,
-            "id": id,
-            "sample_id": sample_id or id,
+            "ids": ids,
+            "sample_ids": sample_ids,
+            "labels": labels,
+        }
+
+        return {"points": trace}
+
+    # Group the points by label, in order of first appearance
+    codes = {}
+    inds = np.array([codes.setdefault(l, len(codes)) for l in labels])
+    order = np.argsort(inds, kind="stable")
+    splits = np.cumsum(np.bincount(inds, minlength=len(codes)))[:-1]
+
+    _ids = np.array(ids, dtype=object)
+    if sample_ids is not None:
+        _sample_ids = np.array(sample_ids, dtype=object)
+
+    traces = {}
+    for label, _inds in zip(codes.keys(), np.split(order, splits)):
+        traces[_make_trace_key(label)] = {
+            "points": points[_inds],
+            "ids": _ids[_inds].tolist(),
+            "sample_ids": (
+                _sample_ids[_inds].tolist() if sample_ids is not None else None
+            ),
             "label": label,
-            "selected": selected,
         }
-    )
+
+    return traces
+
+
+def _make_trace_key(label):
+    # Trace keys are serialized as JSON object keys
+    if label is None:
+        return "null"
+
+    if isinstance(label, bool):
+        return "true" if label else "false"
+
+    return str(label)
+
+
+def _plot_to_json(plot):
+    style = plot["style"]
+    traces = {}
+    for key, trace in plot["traces"].items():
+        ids = trace["ids"]
+        sample_ids = trace["sample_ids"] or ids
+        if style == "categorical":
+            labels = itertools.repeat(trace["label"])
+        elif style == "continuous":
+            labels = trace["labels"]
+        else:
+            labels = itertools.repeat(None)
+
+        traces[key] = [
+            {
+                "points": points,
+                "id": id,
+                "sample_id": sample_id,
+                "label": label,
+                "selected": True,
+            }
+            for points, id, sample_id, label in zip(
+                trace["points"].tolist(), ids, sample_ids, labels
+            )
+        ]
+
+    return dict(plot, traces=traces)
@@ -5,8 +5,12 @@ FiftyOne Server /frames route
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+import logging
+
+from bson import json_util
 from starlette.endpoints import HTTPEndpoint
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.requests import Request
 
 from fiftyone.core.expressions import ViewField as F
@@ -15,9 +19,19 @@ import fiftyone.core.odm as foo
 import fiftyone.core.view as fov
 
 from fiftyone.server.decorators import route
+from fiftyone.server.utils import get_dataset_revision, RevisionCache
 import fiftyone.server.view as fosv
 
 
+# Serialized frame chunks, bounded by their total size in bytes
+_CACHE_MAX_BYTES = 256 * 1024**2
+
+_cache = RevisionCache(_CACHE_MAX_BYTES, getsizeof=len)
+_pending = {}
+
+logger = logging.getLogger(__name__)
+
+
 class Frames(HTTPEndpoint):
     @route
     async def post(self, request: Request, data: dict):
@@ -30,31 +44,128 @@ class Frames(HTTPEndpoint):
         sample_id = data.get("sampleId")
         group_slice = data.get("slice", None)
 
-        view = fosv.get_view(dataset, stages=stages, extended_stages=extended)
-        view = fov.make_optimized_select_view(view, sample_id)
+        end_frame = min(num_frames + start_frame, frame_count)
 
-        if group_slice is not None:
-            view.group_slice = group_slice
+        # The revision must be retrieved before any frames are loaded
+        revision = await get_dataset_revision(dataset)
 
-        end_frame = min(num_frames + start_frame, frame_count)
-        support = None if stages else [start_frame, end_frame]
-        if not support:
-            view = view.set_field(
-                "frames",
-                F("frames").filter(
-                    (F("frame_number") >= start_frame)
-                    & (F("frame_number") <= end_frame)
-                ),
-            )
-
-        frames = await foo.aggregate(
-            foo.get_async_db_conn()[view._dataset._sample_collection_name],
-            view._pipeline(frames_only=True, support=support),
-        ).to_list(end_frame - start_frame + 1)
-
-        return JSONResponse(
-            {
-                "frames": foj.stringify(frames),
-                "range": [start_frame, end_frame],
-            }
+        args = (dataset, stages, extended, sample_id, group_slice)
+        body = await _get_frames(revision, *args, start_frame, end_frame)
+
+        # Prefetch the chunk that the App will request next
+        next_start = end_frame + 1
+        if revision is not None and next_start <= frame_count:
+            next_end = min(num_frames + next_start, frame_count)
+            _prefetch_frames(revision, *args, next_start, next_end)
+
+        return Response(body, media_type="application/json")
+
+
+def get_cache_stats():
+    """Returns statistics about the frame chunk cache.
+
+    Returns:
+        a dict containing the number of cache ``hits`` and ``misses``, the
+        current ``size`` and ``max_size`` of the cache in bytes, and the
+        number of ``pending`` prefetches
+    """
+    return dict(_cache.stats(), pending=len(_pending))
+
+
+def clear_cache():
+    """Clears the frame chunk cache and resets its statistics."""
+    _cache.clear()
+
+
+async def _get_frames(revision, *args):
+    key = _make_cache_key(revision, *args)
+    if key is None:
+        return await _load_frames(*args)
+
+    # Wait for a prefetch of this chunk, if one is in progress
+    task = _pending.get(key, None)
+    if task is not None:
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            pass
+
+    body = _cache.get(key)
+    if body is not None:
+        return body
+
+    body = await _load_frames(*args)
+    _cache.set(key, body)
+
+    return body
+
+
+def _prefetch_frames(revision, *args):
+    key = _make_cache_key(revision, *args)
+    if key in _cache or key in _pending:
+        return
+
+    async def _prefetch():
+        try:
+            body = await _load_frames(*args)
+            _cache.set(key, body)
+            return body
+        finally:
+            _pending.pop(key, None)
+
+    task = asyncio.create_task(_prefetch())
+    task.add_done_callback(_log_prefetch_error)
+    _pending[key] = task
+
+
+def _log_prefetch_error(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Failed to prefetch frames: %s", task.exception())
+
+
+def _make_cache_key(
+    revision, dataset, stages, extended, sample_id, group_slice, start, end
+):
+    if revision is None:
+        return None
+
+    key = json_util.dumps(
+        [dataset, revision, stages, extended, sample_id, group_slice],
+        sort_keys=True,
+    )
+
+    return key + ":%d-%d" % (start, end)
+
+
+async def _load_frames(
+    dataset, stages, extended, sample_id, group_slice, start_frame, end_frame
+):
+    view = fosv.get_view(dataset, stages=stages, extended_stages=extended)
+    view = fov.make_optimized_select_view(view, sample_id)
+
+    if group_slice is not None:
+        view.group_slice = group_slice
+
+    support = None if stages else [start_frame, end_frame]
+    if not support:
+        view = view.set_field(
+            "frames",
+            F("frames").filter(
+                (F("frame_number") >= start_frame)
+                & (F("frame_number") <= end_frame)
+            ),
         )
+
+    frames = await foo.aggregate(
+        foo.get_async_db_conn()[view._dataset._sample_collection_name],
+        view._pipeline(frames_only=True, support=support),
+    ).to_list(end_frame - start_frame + 1)
+
+    response = JSONResponse(
+        {
+            "frames": foj.stringify(frames),
+            "range": [start_frame, end_frame],
+        }
+    )
+
+    return response.body
@@ -6,20 +6,28 @@ FiftyOne Server samples pagination
 |
 """
 import asyncio
+import base64
+import math
+
+from bson import json_util
+import cachetools
 import strawberry as gql
 import typing as t
 
+import eta.core.utils as etau
 
 from fiftyone.core.collections import SampleCollection
+import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.stages as fost
 from fiftyone.core.utils import run_sync_task
 
 from fiftyone.server.filters import SampleFilter
 import fiftyone.server.metadata as fosm
 from fiftyone.server.paginator import Connection, Edge, PageInfo
 from fiftyone.server.scalars import BSON, JSON, BSONArray
-from fiftyone.server.utils import from_dict
+from fiftyone.server.utils import from_dict, get_dataset_revision
 import fiftyone.server.view as fosv
 
 
@@ -63,6 +71,63 @@ MEDIA_TYPES = {
     fom.VIDEO: VideoSample,
 }
 
+# Stages that only filter samples, and therefore preserve the sort order of
+# their input
+_FILTER_STAGES = (
+    fost.Exclude,
+    fost.ExcludeBy,
+    fost.ExcludeGroups,
+    fost.Exists,
+    fost.Match,
+    fost.MatchFrames,
+    fost.MatchLabels,
+    fost.MatchTags,
+)
+
+# Filter stages that preserve the sort order of their input unless `ordered`
+_SELECT_STAGES = (fost.Select, fost.SelectBy, fost.SelectGroups)
+
+# Stages that project fields, and therefore preserve the sort order of their
+# input and the values of the fields that they include
+_PROJECT_STAGES = (
+    fost.ExcludeFields,
+    fost.ExcludeFrames,
+    fost.SelectFields,
+    fost.SelectFrames,
+)
+
+# Stages that preserve the sort order of their input but may modify the
+# value(s) of their ``field``
+_FIELD_STAGES = (
+    fost.FilterField,
+    fost.FilterKeypoints,
+    fost.FilterLabels,
+    fost.LimitLabels,
+    fost.MapLabels,
+    fost.SetField,
+)
+
+# Stages that preserve the sort order of their input but may modify the
+# value(s) of their ``fields``
+_LABELS_STAGES = (fost.ExcludeLabels, fost.SelectLabels)
+
+# Field types whose values can be used as keyset pagination cursors
+_KEYSET_FIELD_TYPES = (
+    fof.BooleanField,
+    fof.DateField,
+    fof.DateTimeField,
+    fof.FloatField,
+    fof.IntField,
+    fof.ObjectIdField,
+    fof.StringField,
+)
+
+# Keyset positions of recently served pages, so that requests that provide
+# offset cursors can also be served via keyset pagination. Positions are keyed
+# by dataset ID and revision, so they are invalidated by any modification to
+# the dataset
+_keyset_cache = cachetools.LRUCache(maxsize=1024)
+
 
 async def paginate_samples(
     dataset: str,
@@ -74,6 +139,9 @@ async def paginate_samples(
     sample_filter: t.Optional[SampleFilter] = None,
     pagination_data: t.Optional[bool] = False,
 ) -> Connection[t.Union[ImageSample, VideoSample], str]:
+    # The revision must be retrieved before any samples are loaded
+    revision = await get_dataset_revision(dataset)
+
     run = lambda reload: fosv.get_view(
         dataset,
         stages=stages,
@@ -96,11 +164,50 @@ async def paginate_samples(
     # full datasets.
     full_lookup = has_frames and (filters or stages)
     support = [1, 1] if not full_lookup else None
-    if after is None:
-        after = "-1"
 
-    if int(after) > -1:
-        view = view.skip(int(after) + 1)
+    offset, position = _parse_cursor(after)
+
+    # Pages are fetched via a range match on the sort key(s) of the last
+    # sample of the previous page whenever the view's sort order can be
+    # expressed that way. Otherwise we fall back to skipping `offset` samples
+    sort_idx, keys = _get_keyset_keys(view)
+    cache_key = None
+    post_pipeline = []
+
+    if keys is not None:
+        cache_key = _make_cache_key(
+            view,
+            revision,
+            stages,
+            filters,
+            extended_stages,
+            sample_filter,
+            pagination_data,
+        )
+
+        if cache_key is not None and position is None and offset > -1:
+            position = _keyset_cache.get((cache_key, offset), None)
+
+        values = _get_position_values(keys, position)
+
+        if values is not None:
+            match = _make_keyset_match(keys, values)
+        else:
+            match = None
+
+        if sort_idx is None:
+            # Unsorted views are sorted by `_id`, which their stages do not
+            # modify, so the page can be matched before any stages
+            view = _sort_by_keys(view, sort_idx, keys, match=match)
+        else:
+            view = _sort_by_keys(view, sort_idx, keys)
+            if match is not None:
+                post_pipeline.append({"$match": match})
+
+        if match is None and offset > -1:
+            view = view.skip(offset + 1)
+    elif offset > -1:
+        view = view.skip(offset + 1)
 
     pipeline = view._pipeline(
         attach_frames=has_frames,
@@ -110,6 +217,8 @@ async def paginate_samples(
         and (sample_filter.group.id and not sample_filter.group.slices),
         support=support,
     )
+    pipeline += post_pipeline
+    pipeline.append({"$limit": first + 1})
 
     # Only return the first frame of each video sample for the grid thumbnail
     if has_frames:
@@ -141,16 +250,31 @@ async def paginate_samples(
         edges.append(
             Edge(
                 node=node,
-                cursor=str(idx + int(after) + 1),
+                cursor=str(idx + offset + 1),
             )
         )
 
+    end_cursor = edges[-1].cursor if len(edges) > 1 else None
+
+    if keys is not None and samples:
+        values = _get_sample_values(keys, samples[-1])
+        if values is not None:
+            end_offset = offset + len(samples)
+            position = {
+                "keys": [[path, order] for _, path, order in keys],
+                "values": values,
+            }
+            if cache_key is not None:
+                _keyset_cache[(cache_key, end_offset)] = position
+
+            end_cursor = _make_cursor(end_offset, position)
+
     return Connection(
         page_info=PageInfo(
             has_previous_page=False,
             has_next_page=more,
             start_cursor=edges[0].cursor if edges else None,
-            end_cursor=edges[-1].cursor if len(edges) > 1 else None,
+            end_cursor=end_cursor,
         ),
         edges=edges,
     )
@@ -187,3 +311,212 @@ async def _create_sample_item(
         _id = f"{_id}-modal"
 
     return from_dict(cls, {"id": _id, "sample": sample, **metadata})
+
+
+def _make_cache_key(
+    view,
+    revision,
+    stages,
+    filters,
+    extended_stages,
+    sample_filter,
+    pagination_data,
+):
+    if revision is None:
+        return None
+
+    return json_util.dumps(
+        [
+            view._root_dataset._doc.id,
+            revision,
+            stages,
+            filters,
+            extended_stages,
+            repr(sample_filter),
+            pagination_data,
+        ],
+        sort_keys=True,
+    )
+
+
+def _parse_cursor(after):
+    # Cursors are either sample offsets or encoded keyset positions
+    if after is None:
+        return -1, None
+
+    try:
+        return int(after), None
+    except ValueError:
+        pass
+
+    try:
+        d = json_util.loads(base64.urlsafe_b64decode(after.encode()))
+        return int(d["offset"]), {"keys": d["keys"], "values": d["values"]}
+    except Exception:
+        raise ValueError("Invalid cursor '%s'" % after)
+
+
+def _make_cursor(offset, position):
+    d = {"offset": offset, **position}
+    return base64.urlsafe_b64encode(json_util.dumps(d).encode()).decode()
+
+
+def _get_keyset_keys(view):
+    # Returns the index of the stage that sorts the view, if any, and the
+    # `(field, path, order)` keys that define the sort order of the view, or
+    # None if the order cannot be expressed as a keyset
+    if view._is_dynamic_groups:
+        return None, None
+
+    stages = view._stages
+
+    sort_idx = None
+    for idx, stage in enumerate(stages):
+        if not _preserves_order(stage):
+            sort_idx = idx
+
+    # Unsorted views are paginated in `_id` order, which is their natural
+    # order unless samples were inserted out of `_id` order
+    if sort_idx is None:
+        return None, [("id", "_id", 1)]
+
+    stage = stages[sort_idx]
+    if not isinstance(stage, fost.SortBy):
+        return None, None
+
+    field_or_expr = stage._get_mongo_field_or_expr()
+    if etau.is_str(field_or_expr):
+        field_or_expr = [(field_or_expr, 1)]
+    elif not isinstance(field_or_expr, (list, tuple)):
+        return None, None
+
+    if stage.reverse:
+        field_or_expr = [(f, -order) for f, order in field_or_expr]
+
+    keys = []
+    for field, order in field_or_expr:
+        if not etau.is_str(field) or field.startswith("$"):
+            return None, None
+
+        try:
+            (
+                path,
+                is_frame_field,
+                unwind_list_fields,
+                other_list_fields,
+                _,
+            ) = view._parse_field_name(field, auto_unwind=False)
+        except ValueError:
+            return None, None
+
+        if is_frame_field or unwind_list_fields or other_list_fields:
+            return None, None
+
+        if not isinstance(view.get_field(field), _KEYSET_FIELD_TYPES):
+            return None, None
+
+        keys.append((field, path, order))
+
+    # Subsequent stages must not modify the sort values
+    roots = set(field.split(".", 1)[0] for field, _, _ in keys)
+    for stage in stages[sort_idx + 1 :]:
+        if isinstance(stage, _FIELD_STAGES):
+            if stage._field.split(".", 1)[0] in roots:
+                return None, None
+        elif isinstance(stage, _LABELS_STAGES):
+            if stage.fields is None:
+                if any("." in field for field, _, _ in keys):
+                    return None, None
+            elif any(f.split(".", 1)[0] in roots for f in stage.fields):
+                return None, None
+
+    # Break ties by `_id` so that the order is total
+    if not any(path == "_id" for _, path, _ in keys):
+        keys.append(("id", "_id", 1))
+
+    return sort_idx, keys
+
+
+def _preserves_order(stage):
+    if isinstance(stage, _SELECT_STAGES):
+        return not stage.ordered
+
+    return isinstance(
+        stage,
+        _FILTER_STAGES + _PROJECT_STAGES + _FIELD_STAGES + _LABELS_STAGES,
+    )
+
+
+def _sort_by_keys(view, sort_idx, keys, match=None):
+    # Sorts the view by the given keys, including the `_id` tiebreaker. If the
+    # view is unsorted, the sort and optional `match` are applied before all
+    # stages of the view
+    _view = view._base_view
+
+    if sort_idx is None:
+        if match is not None:
+            _view = _view._add_view_stage(
+                fost.Mongo([{"$match": match}]), validate=False
+            )
+
+        sort = fost.SortBy([(field, order) for field, _, order in keys])
+        _view = _view._add_view_stage(sort, validate=False)
+
+    for idx, stage in enumerate(view._stages):
+        if idx == sort_idx:
+            stage = fost.SortBy([(field, order) for field, _, order in keys])
+
+        _view = _view._add_view_stage(stage, validate=False)
+
+    return _view
+
+
+def _get_position_values(keys, position):
+    if position is None:
+        return None
+
+    if position["keys"] != [[path, order] for _, path, order in keys]:
+        return None
+
+    return position["values"]
+
+
+def _get_sample_values(keys, sample):
+    values = []
+    for _, path, _ in keys:
+        value = sample
+        for chunk in path.split("."):
+            if not isinstance(value, dict):
+                return None
+
+            value = value.get(chunk, None)
+
+        # null values sort before all others and cannot be range matched
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return None
+
+        values.append(value)
+
+    return values
+
+
+def _make_keyset_match(keys, values):
+    # Matches the samples that come after `values` in the order defined by
+    # `keys`
+    clauses = []
+    for idx, ((_, path, order), value) in enumerate(zip(keys, values)):
+        if order == 1:
+            after = {path: {"$gt": value}}
+        elif path == "_id":
+            after = {path: {"$lt": value}}
+        else:
+            # null values sort after all others in descending order
+            after = {"$or": [{path: {"$lt": value}}, {path: None}]}
+
+        prefix = [{p: v} for (_, p, _), v in zip(keys[:idx], values[:idx])]
+        clauses.append({"$and": prefix + [after]} if prefix else after)
+
+    if len(clauses) == 1:
+        return clauses[0]
+
+    return {"$or": clauses}
@@ -5,6 +5,7 @@ FiftyOne Server utils.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import threading
 import typing as t
 
 import cachetools
@@ -17,10 +18,13 @@ import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.media as fom
+import fiftyone.core.odm as foo
 
 
 _cache = cachetools.TTLCache(maxsize=10, ttl=900)  # ttl in seconds
 _dacite_config = Config(check_types=False)
+_synced_revisions = {}
+_synced_revisions_lock = threading.Lock()
 
 
 def load_and_cache_dataset(name):
@@ -51,6 +55,159 @@ def load_and_cache_dataset(name):
     return dataset
 
 
+def load_and_sync_dataset(name, reload=True):
+    """Loads the dataset with the given name, reloading it from the database
+    only if it has been modified since it was last synced by this process.
+
+    Modifications are detected via the dataset's revision, which is a counter
+    that is incremented in the database whenever the dataset is modified, so
+    checking for changes only requires a single lightweight query.
+
+    Args:
+        name: the dataset name
+        reload (True): whether to reload the dataset if it has been modified
+
+    Returns:
+        a tuple of
+
+        -   the :class:`fiftyone.core.dataset.Dataset`
+        -   the dataset's revision at the time it was loaded
+    """
+    # The revision must be retrieved before the dataset is (re)loaded so that
+    # any concurrent modifications will be detected by the next call
+    revision = foo.get_dataset_revision(name)
+    dataset = load_and_cache_dataset(name)
+
+    if not reload:
+        return dataset, revision
+
+    key = (dataset._doc.id, revision)
+    with _synced_revisions_lock:
+        synced = _synced_revisions.get(name, None) == key
+
+    if not synced:
+        dataset.reload()
+        with _synced_revisions_lock:
+            _synced_revisions[name] = key
+
+    return dataset, revision
+
+
+async def get_dataset_revision(name):
+    """Asynchronously retrieves the revision of the dataset with the given
+    name.
+
+    Args:
+        name: the dataset name
+
+    Returns:
+        the revision, or None if the dataset does not exist
+    """
+    dataset_dict = await foo.get_async_db_conn().datasets.find_one(
+        {"name": name}, {"revision": True}
+    )
+    if dataset_dict is None:
+        return None
+
+    return dataset_dict.get("revision", 0)
+
+
+class RevisionCache(object):
+    """A thread-safe cache of server results that are keyed by dataset
+    revision.
+
+    The keys of cached results must include the revisions of the datasets
+    from which they were computed. Revisions are incremented whenever a
+    dataset is modified, so modifications invalidate all previous results,
+    which are evicted in least recently used order.
+
+    Args:
+        maxsize: the maximum size of the cache
+        getsizeof (None): an optional function that returns the size of a
+            value. By default, all values have size 1
+        ttl (None): an optional time-to-live of the cached results, in seconds
+    """
+
+    def __init__(self, maxsize, getsizeof=None, ttl=None):
+        if ttl is not None:
+            self._cache = cachetools.TTLCache(
+                maxsize=maxsize, ttl=ttl, getsizeof=getsizeof
+            )
+        else:
+            self._cache = cachetools.LRUCache(
+                maxsize=maxsize, getsizeof=getsizeof
+            )
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key is not None and key in self._cache
+
+    def get(self, key):
+        """Retrieves the cached result for the given key, if any.
+
+        Args:
+            key: the key, or None if the result cannot be cached
+
+        Returns:
+            the result, or None if it is not cached
+        """
+        if key is None:
+            return None
+
+        with self._lock:
+            value = self._cache.get(key, None)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return value
+
+    def set(self, key, value):
+        """Caches the result for the given key.
+
+        Results that are larger than the entire cache are not cached.
+
+        Args:
+            key: the key, or None if the result cannot be cached
+            value: the result
+        """
+        if key is None:
+            return
+
+        with self._lock:
+            try:
+                self._cache[key] = value
+            except ValueError:
+                pass  # value too large
+
+    def clear(self):
+        """Clears the cache and resets its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self):
+        """Returns statistics about the cache.
+
+        Returns:
+            a dict containing the number of cache ``hits`` and ``misses``, and
+            the current ``size`` and ``max_size`` of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": self._cache.currsize,
+                "max_size": self._cache.maxsize,
+            }
+
+
 def change_sample_tags(sample_collection, changes):
     """Applies the changes to tags to all samples of the collection, if
     necessary.
@@ -5,9 +5,12 @@ FiftyOne Server view.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from copy import copy
+import threading
 from typing import List, Optional
 
-from bson import ObjectId
+from bson import ObjectId, json_util
+import cachetools
 import strawberry as gql
 
 import fiftyone.core.collections as foc
@@ -22,10 +25,14 @@ import fiftyone.core.view as fov
 
 from fiftyone.server.aggregations import GroupElementFilter, SampleFilter
 from fiftyone.server.scalars import BSONArray, JSON
+from fiftyone.server.utils import load_and_sync_dataset
 
 
 _LABEL_TAGS = "_label_tags"
 
+_views = cachetools.LRUCache(maxsize=128)
+_views_lock = threading.Lock()
+
 
 @gql.input
 class ExtendedViewForm:
@@ -97,21 +104,19 @@ def get_view(
         extended_stages (None): extended view stages
         sample_filter (None): an optional
             :class:`fiftyone.server.filters.SampleFilter`
-        reload (None): whether to reload the dataset
+        reload (True): whether to reload the dataset, if it has been modified
+            since it was last loaded
 
     Returns:
         a :class:`fiftyone.core.view.DatasetView`
     """
-    dataset = fod.load_dataset(dataset_name)
-
-    if reload:
-        dataset.reload()
+    dataset, revision = load_and_sync_dataset(dataset_name, reload=reload)
 
     if view_name is not None:
         return dataset.load_saved_view(view_name)
 
     if stages:
-        view = fov.DatasetView._build(dataset, stages)
+        view = _build_view(dataset, revision, stages)
     else:
         view = dataset.view()
 
@@ -147,6 +152,26 @@ def get_view(
     return view
 
 
+def _build_view(dataset, revision, stages):
+    # Building a view validates all of its stages, so we reuse views built for
+    # identical stages, as long as the dataset has not been modified since
+    if revision is None:
+        return fov.DatasetView._build(dataset, stages)
+
+    key = json_util.dumps([dataset._doc.id, revision, stages])
+
+    with _views_lock:
+        view = _views.get(key, None)
+
+    if view is None:
+        view = fov.DatasetView._build(dataset, stages)
+        with _views_lock:
+            _views[key] = view
+
+    # Callers may modify the view (eg its group slice) in-place
+    return copy(view)
+
+
 def get_extended_view(
     view,
     filters=None,
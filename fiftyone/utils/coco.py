@@ -700,6 +700,9 @@ class COCODetectionDatasetExporter(
             done
         tolerance (None): a tolerance, in pixels, when generating approximate
             polylines for instance masks. Typical values are 1-3 pixels
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -718,6 +721,7 @@ class COCODetectionDatasetExporter(
         iscrowd="iscrowd",
         num_decimals=None,
         tolerance=None,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -747,6 +751,7 @@ class COCODetectionDatasetExporter(
         self.iscrowd = iscrowd
         self.num_decimals = num_decimals
         self.tolerance = tolerance
+        self.num_workers = num_workers
 
         self._image_id = None
         self._anno_id = None
@@ -780,6 +785,7 @@ class COCODetectionDatasetExporter(
             export_path=self.data_path,
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -303,6 +303,9 @@ class CSVDatasetExporter(foud.BatchDatasetExporter, foud.ExportPathsMixin):
             -   a dict mapping field names to column names
 
             By default, only the ``media_field`` is exported
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -315,6 +318,7 @@ class CSVDatasetExporter(foud.BatchDatasetExporter, foud.ExportPathsMixin):
         abs_paths=False,
         media_field="filepath",
         fields=None,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -338,6 +342,7 @@ class CSVDatasetExporter(foud.BatchDatasetExporter, foud.ExportPathsMixin):
         self.abs_paths = abs_paths
         self.media_field = media_field
         self.fields = fields
+        self.num_workers = num_workers
 
         self._media_exporter = None
         self._f = None
@@ -352,6 +357,7 @@ class CSVDatasetExporter(foud.BatchDatasetExporter, foud.ExportPathsMixin):
             self.export_media,
             export_path=self.data_path,
             rel_dir=self.rel_dir,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
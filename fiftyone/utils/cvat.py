@@ -6,7 +6,8 @@ Utilities for working with datasets in
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
+from collections import defaultdict, deque
+import contextlib
 from copy import copy, deepcopy
 from datetime import datetime
 import itertools
@@ -872,6 +873,9 @@ class CVATImageDatasetExporter(
         image_format (None): the image format to use when writing in-memory
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -883,6 +887,7 @@ class CVATImageDatasetExporter(
         rel_dir=None,
         abs_paths=False,
         image_format=None,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -905,6 +910,7 @@ class CVATImageDatasetExporter(
         self.rel_dir = rel_dir
         self.abs_paths = abs_paths
         self.image_format = image_format
+        self.num_workers = num_workers
 
         self._name = None
         self._task_labels = None
@@ -931,6 +937,7 @@ class CVATImageDatasetExporter(
             export_path=self.data_path,
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -1049,6 +1056,9 @@ class CVATVideoDatasetExporter(
             allows for populating nested subdirectories that match the shape of
             the input paths. The path is converted to an absolute path (if
             necessary) via :func:`fiftyone.core.storage.normalize_path`
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -1058,6 +1068,7 @@ class CVATVideoDatasetExporter(
         labels_path=None,
         export_media=None,
         rel_dir=None,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -1078,6 +1089,7 @@ class CVATVideoDatasetExporter(
         self.labels_path = labels_path
         self.export_media = export_media
         self.rel_dir = rel_dir
+        self.num_workers = num_workers
 
         self._task_labels = None
         self._num_samples = 0
@@ -1106,6 +1118,7 @@ class CVATVideoDatasetExporter(
             self.export_media,
             export_path=self.data_path,
             rel_dir=self.rel_dir,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -3107,6 +3120,10 @@ class CVATBackendConfig(foua.AnnotationBackendConfig):
 
             Note that this argument cannot be provided when uploading existing
             tracks
+        num_workers (None): the number of tasks to upload/download
+            concurrently. By default, tasks are processed serially
+        max_retries (3): the maximum number of times to retry requests that
+            fail due to connection errors or transient server errors
     """
 
     def __init__(
@@ -3137,6 +3154,8 @@ class CVATBackendConfig(foua.AnnotationBackendConfig):
         frame_start=None,
         frame_stop=None,
         frame_step=None,
+        num_workers=None,
+        max_retries=3,
         **kwargs,
     ):
         super().__init__(name, label_schema, media_field=media_field, **kwargs)
@@ -3160,6 +3179,8 @@ class CVATBackendConfig(foua.AnnotationBackendConfig):
         self.frame_start = _validate_frame_arg(frame_start, "frame_start")
         self.frame_stop = _validate_frame_arg(frame_stop, "frame_stop")
         self.frame_step = _validate_frame_arg(frame_step, "frame_step")
+        self.num_workers = num_workers
+        self.max_retries = max_retries
 
         # store privately so these aren't serialized
         self._username = username
@@ -3293,6 +3314,8 @@ class CVATBackend(foua.AnnotationBackend):
             password=self.config.password,
             headers=self.config.headers,
             organization=self.config.organization,
+            num_workers=self.config.num_workers,
+            max_retries=self.config.max_retries,
         )
 
     def upload_annotations(self, samples, anno_key, launch_editor=False):
@@ -3541,6 +3564,10 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         headers (None): an optional dict of headers to add to all requests
         organization (None): the name of the organization to use when sending
             requests to CVAT
+        num_workers (None): the number of tasks to upload/download
+            concurrently. By default, tasks are processed serially
+        max_retries (3): the maximum number of times to retry requests that
+            fail due to connection errors or transient server errors
     """
 
     def __init__(
@@ -3551,6 +3578,8 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         password=None,
         headers=None,
         organization=None,
+        num_workers=None,
+        max_retries=3,
     ):
         self._name = name
         self._url = url.rstrip("/")
@@ -3558,6 +3587,8 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         self._password = password
         self._headers = headers
         self._organization = organization
+        self._num_workers = num_workers
+        self._max_retries = max_retries
 
         self._server_version = None
         self._session = None
@@ -3714,7 +3745,7 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
 
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        self._session = requests.Session()
+        self._session = self._make_session()
 
         if self._headers:
             # pylint: disable=too-many-function-args
@@ -3752,6 +3783,31 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
 
         logger.debug("CVAT server version: %s", self._server_version)
 
+    def _make_session(self):
+        num_workers = self._num_workers or 1
+
+        # Only idempotent requests are retried after a response is received,
+        # but requests that fail to connect are always safe to retry
+        retry = urllib3.util.Retry(
+            total=self._max_retries or 0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+        )
+
+        # Each in-flight task may hold its own connection to the server
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(num_workers, 10),
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
     def _add_referer(self):
         if "Referer" not in self._session.headers:
             self._session.headers["Referer"] = self.login_url
@@ -4400,7 +4456,31 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         if num_samples <= batch_size:
             pb_kwargs["quiet"] = True
 
-        with fou.ProgressBar(**pb_kwargs) as pb:
+        num_workers = self._num_workers or 1
+        if num_batches > 1 and num_workers > 1:
+            pool = multiprocessing.dummy.Pool(processes=num_workers)
+        else:
+            pool = None
+
+        server_id_map = {}
+        pending = deque()
+
+        def _record_task(result):
+            task_id, _job_ids, _frame_id_map, _server_id_map = result
+            task_ids.append(task_id)
+            job_ids.update(_job_ids)
+            frame_id_map.update(_frame_id_map)
+            for label_field in label_schema.keys():
+                labels_task_map[label_field].append(task_id)
+
+            pb.update(batch_size)
+            return _server_id_map
+
+        with contextlib.ExitStack() as context:
+            pb = context.enter_context(fou.ProgressBar(**pb_kwargs))
+            if pool is not None:
+                context.enter_context(pool)
+
             for idx, offset in enumerate(range(0, num_samples, batch_size)):
                 samples_batch = samples[offset : (offset + batch_size)]
                 anno_tags = []
@@ -4498,38 +4578,41 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
                 if num_batches > 1:
                     task_name += f"_{idx + 1}"
 
-                (
-                    task_id,
-                    class_id_map,
-                    attr_id_map,
-                ) = self._create_task_upload_data(
+                # Later batches may add classes to `cvat_schema`, so tasks
+                # that are uploaded concurrently need their own copy
+                if pool is not None:
+                    task_schema = deepcopy(cvat_schema)
+                else:
+                    task_schema = cvat_schema
+
+                args = (
                     config,
                     idx,
                     task_name,
-                    cvat_schema,
+                    task_schema,
                     project_id,
                     samples_batch,
-                    task_ids,
-                    job_ids,
-                    frame_id_map,
+                    anno_shapes,
+                    anno_tags,
+                    anno_tracks,
                     _frame_start,
                     _frame_stop,
                     _frame_step,
                 )
 
-                for label_field in label_schema.keys():
-                    labels_task_map[label_field].append(task_id)
+                if pool is None:
+                    server_id_map = _record_task(self._upload_task(*args))
+                    continue
 
-                server_id_map = self._upload_annotations(
-                    anno_shapes,
-                    anno_tags,
-                    anno_tracks,
-                    class_id_map,
-                    attr_id_map,
-                    task_id,
-                )
+                pending.append(pool.apply_async(self._upload_task, args))
+
+                # Limit the number of tasks in-flight, and record them in the
+                # order in which they were created
+                if len(pending) >= num_workers:
+                    server_id_map = _record_task(pending.popleft().get())
 
-                pb.update(batch_size)
+            while pending:
+                server_id_map = _record_task(pending.popleft().get())
 
         results = CVATAnnotationResults(
             samples,
@@ -4599,187 +4682,235 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         annotations = {}
         deleted_tasks = []
 
+        tasks = [
+            (
+                task_id,
+                label_schema,
+                id_map,
+                server_id_map,
+                frame_id_map,
+                labels_task_map_rev[task_id],
+                project_id,
+                assigned_scalar_attrs,
+                occluded_attrs,
+                group_id_attrs,
+                label_field_classes,
+            )
+            for task_id in task_ids
+        ]
+
         pb_kwargs = {"total": len(task_ids), "iters_str": "tasks"}
         if len(task_ids) == 1:
             pb_kwargs["quiet"] = True
 
-        with fou.ProgressBar(**pb_kwargs) as pb:
-            for task_id in pb(task_ids):
-                if not self.task_exists(task_id):
-                    deleted_tasks.append(task_id)
-                    logger.warning(
-                        "Skipping task %d, which no longer exists", task_id
-                    )
+        num_workers = self._num_workers or 1
+        if len(task_ids) > 1 and num_workers > 1:
+            pool = multiprocessing.dummy.Pool(processes=num_workers)
+            map_fcn = pool.imap
+        else:
+            pool = None
+            map_fcn = map
+
+        # Tasks are downloaded and parsed concurrently, but their annotations
+        # are merged in order
+        with contextlib.ExitStack() as context:
+            pb = context.enter_context(fou.ProgressBar(**pb_kwargs))
+            if pool is not None:
+                context.enter_context(pool)
+
+            for task, task_annotations in zip(
+                tasks, pb(map_fcn(self._download_task, tasks))
+            ):
+                if task_annotations is None:
+                    deleted_tasks.append(task[0])
                     continue
 
-                data_resp = self.get(self.task_data_meta_url(task_id)).json()
-                frames = data_resp["frames"]
-                frame_start = data_resp["start_frame"]
-                frame_stop = data_resp["stop_frame"]
-                frame_step = _parse_frame_step(data_resp)
-
-                # Download task data
-                attr_id_map, _class_map_rev = self._get_attr_class_maps(
-                    task_id
-                )
-                task_resp = self.get(self.task_annotation_url(task_id)).json()
-                all_shapes = task_resp["shapes"]
-                all_tags = task_resp["tags"]
-                all_tracks = task_resp["tracks"]
-
-                # For videos that were subsampled, remap the frame numbers to
-                # those on the original video
-                all_shapes = _remap_annotation_frames(
-                    all_shapes, frame_start, frame_stop, frame_step
-                )
-                all_tags = _remap_annotation_frames(
-                    all_tags, frame_start, frame_stop, frame_step
-                )
-                all_tracks = _remap_annotation_frames(
-                    all_tracks, frame_start, frame_stop, frame_step
+                annotations = self._merge_results(
+                    annotations, task_annotations
                 )
 
-                label_fields = labels_task_map_rev[task_id]
-                label_types = self._get_return_label_types(
-                    label_schema, label_fields
-                )
+        if deleted_tasks:
+            results._forget_tasks(deleted_tasks)
 
-                for lf_ind, label_field in enumerate(label_fields):
-                    label_info = label_schema[label_field]
-                    label_type = label_info.get("type", None)
-                    scalar_attrs = assigned_scalar_attrs.get(
-                        label_field, False
-                    )
-                    _occluded_attrs = occluded_attrs.get(label_field, {})
-                    _group_id_attrs = group_id_attrs.get(label_field, {})
-                    _id_map = id_map.get(label_field, {})
+        return annotations
 
-                    label_field_results = {}
+    def _download_task(self, task):
+        (
+            task_id,
+            label_schema,
+            id_map,
+            server_id_map,
+            frame_id_map,
+            label_fields,
+            project_id,
+            assigned_scalar_attrs,
+            occluded_attrs,
+            group_id_attrs,
+            label_field_classes,
+        ) = task
 
-                    # Dict mapping class labels to the classes used in CVAT.
-                    # These are equal unless a class appears in multiple fields
-                    _classes = label_field_classes[label_field]
+        annotations = {}
 
-                    # Maps CVAT IDs to FiftyOne labels
-                    class_map = {
-                        _class_map_rev[name_lf]: name
-                        for name, name_lf in _classes.items()
-                    }
+        if not self.task_exists(task_id):
+            logger.warning("Skipping task %d, which no longer exists", task_id)
+            return None
 
-                    _cvat_classes = class_map.keys()
-                    tags, shapes, tracks = self._filter_field_classes(
-                        all_tags,
-                        all_shapes,
-                        all_tracks,
-                        _cvat_classes,
-                    )
+        data_resp = self.get(self.task_data_meta_url(task_id)).json()
+        frames = data_resp["frames"]
+        frame_start = data_resp["start_frame"]
+        frame_stop = data_resp["stop_frame"]
+        frame_step = _parse_frame_step(data_resp)
+
+        # Download task data
+        attr_id_map, _class_map_rev = self._get_attr_class_maps(task_id)
+        task_resp = self.get(self.task_annotation_url(task_id)).json()
+        all_shapes = task_resp["shapes"]
+        all_tags = task_resp["tags"]
+        all_tracks = task_resp["tracks"]
+
+        # For videos that were subsampled, remap the frame numbers to
+        # those on the original video
+        all_shapes = _remap_annotation_frames(
+            all_shapes, frame_start, frame_stop, frame_step
+        )
+        all_tags = _remap_annotation_frames(
+            all_tags, frame_start, frame_stop, frame_step
+        )
+        all_tracks = _remap_annotation_frames(
+            all_tracks, frame_start, frame_stop, frame_step
+        )
 
-                    is_last_field = lf_ind == len(label_fields) - 1
-                    ignore_types = self._get_ignored_types(
-                        project_id, label_types, label_type, is_last_field
-                    )
+        label_types = self._get_return_label_types(label_schema, label_fields)
 
-                    tag_results = self._parse_shapes_tags(
-                        "tags",
-                        tags,
-                        frame_id_map[task_id],
-                        label_type,
-                        _id_map,
-                        server_id_map.get("tags", {}),
-                        class_map,
-                        attr_id_map,
-                        frames,
-                        ignore_types,
-                        frame_stop,
-                        frame_step,
-                        assigned_scalar_attrs=scalar_attrs,
-                    )
-                    label_field_results = self._merge_results(
-                        label_field_results, tag_results
-                    )
+        for lf_ind, label_field in enumerate(label_fields):
+            label_info = label_schema[label_field]
+            label_type = label_info.get("type", None)
+            scalar_attrs = assigned_scalar_attrs.get(label_field, False)
+            _occluded_attrs = occluded_attrs.get(label_field, {})
+            _group_id_attrs = group_id_attrs.get(label_field, {})
+            _id_map = id_map.get(label_field, {})
 
-                    shape_results = self._parse_shapes_tags(
-                        "shapes",
-                        shapes,
-                        frame_id_map[task_id],
-                        label_type,
-                        _id_map,
-                        server_id_map.get("shapes", {}),
-                        class_map,
-                        attr_id_map,
-                        frames,
-                        ignore_types,
-                        frame_stop,
-                        frame_step,
-                        assigned_scalar_attrs=scalar_attrs,
-                        occluded_attrs=_occluded_attrs,
-                        group_id_attrs=_group_id_attrs,
-                    )
-                    label_field_results = self._merge_results(
-                        label_field_results, shape_results
-                    )
+            label_field_results = {}
 
-                    for track_index, track in enumerate(tracks, 1):
-                        label_id = track["label_id"]
-                        shapes = track["shapes"]
-                        track_group_id = track.get("group", None)
-                        for shape in shapes:
-                            shape["label_id"] = label_id
+            # Dict mapping class labels to the classes used in CVAT.
+            # These are equal unless a class appears in multiple fields
+            _classes = label_field_classes[label_field]
 
-                        immutable_attrs = track["attributes"]
+            # Maps CVAT IDs to FiftyOne labels
+            class_map = {
+                _class_map_rev[name_lf]: name
+                for name, name_lf in _classes.items()
+            }
 
-                        track_shape_results = self._parse_shapes_tags(
-                            "track",
-                            shapes,
-                            frame_id_map[task_id],
-                            label_type,
-                            _id_map,
-                            server_id_map.get("tracks", {}),
-                            class_map,
-                            attr_id_map,
-                            frames,
-                            ignore_types,
-                            frame_stop,
-                            frame_step,
-                            assigned_scalar_attrs=scalar_attrs,
-                            track_index=track_index,
-                            track_group_id=track_group_id,
-                            immutable_attrs=immutable_attrs,
-                            occluded_attrs=_occluded_attrs,
-                            group_id_attrs=_group_id_attrs,
-                        )
-                        label_field_results = self._merge_results(
-                            label_field_results, track_shape_results
-                        )
+            _cvat_classes = class_map.keys()
+            tags, shapes, tracks = self._filter_field_classes(
+                all_tags,
+                all_shapes,
+                all_tracks,
+                _cvat_classes,
+            )
 
-                    frames_metadata = {}
-                    for cvat_frame_id, frame_data in frame_id_map[
-                        task_id
-                    ].items():
-                        sample_id = frame_data["sample_id"]
-                        if "frame_id" in frame_data and len(frames) == 1:
-                            frames_metadata[sample_id] = frames[0]
-                            break
-
-                        if len(frames) > cvat_frame_id:
-                            frame_metadata = frames[cvat_frame_id]
-                        else:
-                            frame_metadata = None
+            is_last_field = lf_ind == len(label_fields) - 1
+            ignore_types = self._get_ignored_types(
+                project_id, label_types, label_type, is_last_field
+            )
 
-                        frames_metadata[sample_id] = frame_metadata
+            tag_results = self._parse_shapes_tags(
+                "tags",
+                tags,
+                frame_id_map[task_id],
+                label_type,
+                _id_map,
+                server_id_map.get("tags", {}),
+                class_map,
+                attr_id_map,
+                frames,
+                ignore_types,
+                frame_stop,
+                frame_step,
+                assigned_scalar_attrs=scalar_attrs,
+            )
+            label_field_results = self._merge_results(
+                label_field_results, tag_results
+            )
 
-                    # Polyline(s) corresponding to instance/semantic masks need to
-                    # be converted to their final format
-                    self._convert_polylines_to_masks(
-                        label_field_results, label_info, frames_metadata
-                    )
+            shape_results = self._parse_shapes_tags(
+                "shapes",
+                shapes,
+                frame_id_map[task_id],
+                label_type,
+                _id_map,
+                server_id_map.get("shapes", {}),
+                class_map,
+                attr_id_map,
+                frames,
+                ignore_types,
+                frame_stop,
+                frame_step,
+                assigned_scalar_attrs=scalar_attrs,
+                occluded_attrs=_occluded_attrs,
+                group_id_attrs=_group_id_attrs,
+            )
+            label_field_results = self._merge_results(
+                label_field_results, shape_results
+            )
 
-                    annotations = self._merge_results(
-                        annotations, {label_field: label_field_results}
-                    )
+            for track_index, track in enumerate(tracks, 1):
+                label_id = track["label_id"]
+                shapes = track["shapes"]
+                track_group_id = track.get("group", None)
+                for shape in shapes:
+                    shape["label_id"] = label_id
 
-        if deleted_tasks:
-            results._forget_tasks(deleted_tasks)
+                immutable_attrs = track["attributes"]
+
+                track_shape_results = self._parse_shapes_tags(
+                    "track",
+                    shapes,
+                    frame_id_map[task_id],
+                    label_type,
+                    _id_map,
+                    server_id_map.get("tracks", {}),
+                    class_map,
+                    attr_id_map,
+                    frames,
+                    ignore_types,
+                    frame_stop,
+                    frame_step,
+                    assigned_scalar_attrs=scalar_attrs,
+                    track_index=track_index,
+                    track_group_id=track_group_id,
+                    immutable_attrs=immutable_attrs,
+                    occluded_attrs=_occluded_attrs,
+                    group_id_attrs=_group_id_attrs,
+                )
+                label_field_results = self._merge_results(
+                    label_field_results, track_shape_results
+                )
+
+            frames_metadata = {}
+            for cvat_frame_id, frame_data in frame_id_map[task_id].items():
+                sample_id = frame_data["sample_id"]
+                if "frame_id" in frame_data and len(frames) == 1:
+                    frames_metadata[sample_id] = frames[0]
+                    break
+
+                if len(frames) > cvat_frame_id:
+                    frame_metadata = frames[cvat_frame_id]
+                else:
+                    frame_metadata = None
+
+                frames_metadata[sample_id] = frame_metadata
+
+            # Polyline(s) corresponding to instance/semantic masks need to
+            # be converted to their final format
+            self._convert_polylines_to_masks(
+                label_field_results, label_info, frames_metadata
+            )
+
+            annotations = self._merge_results(
+                annotations, {label_field: label_field_results}
+            )
 
         return annotations
 
@@ -5268,6 +5399,51 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
 
         return min(task_size, num_samples)
 
+    def _upload_task(
+        self,
+        config,
+        idx,
+        task_name,
+        cvat_schema,
+        project_id,
+        samples_batch,
+        anno_shapes,
+        anno_tags,
+        anno_tracks,
+        frame_start,
+        frame_stop,
+        frame_step,
+    ):
+        task_ids = []
+        job_ids = {}
+        frame_id_map = {}
+
+        task_id, class_id_map, attr_id_map = self._create_task_upload_data(
+            config,
+            idx,
+            task_name,
+            cvat_schema,
+            project_id,
+            samples_batch,
+            task_ids,
+            job_ids,
+            frame_id_map,
+            frame_start,
+            frame_stop,
+            frame_step,
+        )
+
+        server_id_map = self._upload_annotations(
+            anno_shapes,
+            anno_tags,
+            anno_tracks,
+            class_id_map,
+            attr_id_map,
+            task_id,
+        )
+
+        return task_id, job_ids, frame_id_map, server_id_map
+
     def _create_task_upload_data(
         self,
         config,
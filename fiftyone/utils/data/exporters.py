@@ -5,9 +5,10 @@ Dataset exporters.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
+from collections import defaultdict, deque
 import inspect
 import logging
+import multiprocessing.dummy
 import os
 import warnings
 
@@ -58,6 +59,7 @@ def export_samples(
     label_field=None,
     frame_labels_field=None,
     num_samples=None,
+    num_workers=None,
     **kwargs,
 ):
     """Exports the given samples to disk.
@@ -194,6 +196,11 @@ def export_samples(
             ``dataset_exporter`` is a :class:`LabeledVideoDatasetExporter`
         num_samples (None): the number of samples in ``samples``. If omitted,
             this is computed (if possible) via ``len(samples)``
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            Only applicable to dataset exporters that support this parameter,
+            which includes all builtin exporters that export media. By
+            default, media files are transferred synchronously
         **kwargs: optional keyword arguments to pass to the dataset exporter's
             constructor. If you are exporting image patches, this can also
             contain keyword arguments for
@@ -214,6 +221,7 @@ def export_samples(
             labels_path=labels_path,
             export_media=export_media,
             rel_dir=rel_dir,
+            num_workers=num_workers,
             **kwargs,
         )
     else:
@@ -224,6 +232,7 @@ def export_samples(
                 labels_path=labels_path,
                 export_media=export_media,
                 rel_dir=rel_dir,
+                num_workers=num_workers,
             )
         )
 
@@ -1089,6 +1098,11 @@ class MediaExporter(object):
             output paths
         ignore_exts (False): whether to omit file extensions when generating
             UUIDs for files
+        num_workers (None): a number of worker threads to use to copy, move,
+            or symlink media files in the background. By default, media files
+            are transferred synchronously by :meth:`export`. When workers are
+            used, all transfers are completed by :meth:`close`, which raises
+            an error if any transfers failed
     """
 
     def __init__(
@@ -1099,6 +1113,7 @@ class MediaExporter(object):
         supported_modes=None,
         default_ext=None,
         ignore_exts=False,
+        num_workers=None,
     ):
         if supported_modes is None:
             supported_modes = (True, False, "move", "symlink", "manifest")
@@ -1121,10 +1136,15 @@ class MediaExporter(object):
         self.supported_modes = supported_modes
         self.default_ext = default_ext
         self.ignore_exts = ignore_exts
+        self.num_workers = num_workers
 
         self._filename_maker = None
         self._manifest = None
         self._manifest_path = None
+        self._pool = None
+        self._pending = None
+        self._transferred = None
+        self._errors = None
 
     def _write_media(self, media, outpath):
         raise NotImplementedError("subclass must implement _write_media()")
@@ -1173,6 +1193,16 @@ class MediaExporter(object):
         self._manifest_path = manifest_path
         self._manifest = manifest
 
+        if (
+            self.export_mode in (True, "move", "symlink")
+            and self.num_workers is not None
+            and self.num_workers > 1
+        ):
+            self._pool = multiprocessing.dummy.Pool(processes=self.num_workers)
+            self._pending = deque()
+            self._transferred = set()
+            self._errors = []
+
     def export(self, media_or_path, outpath=None):
         """Exports the given media.
 
@@ -1203,12 +1233,8 @@ class MediaExporter(object):
                 outpath = self._filename_maker.get_output_path(media_path)
                 uuid = self._get_uuid(outpath)
 
-            if self.export_mode == True:
-                etau.copy_file(media_path, outpath)
-            elif self.export_mode == "move":
-                etau.move_file(media_path, outpath)
-            elif self.export_mode == "symlink":
-                etau.symlink_file(media_path, outpath)
+            if self.export_mode in (True, "move", "symlink"):
+                self._transfer_media(media_path, outpath)
             elif self.export_mode == "manifest":
                 self._manifest[uuid] = media_path
         else:
@@ -1235,6 +1261,58 @@ class MediaExporter(object):
         if self.export_mode == "manifest":
             etas.write_json(self._manifest, self._manifest_path)
 
+        if self._pool is not None:
+            self._wait_for_transfers(0)
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+            errors = self._errors
+            self._pending = None
+            self._transferred = None
+            self._errors = None
+
+            if errors:
+                media_path, e = errors[0]
+                raise ValueError(
+                    "Failed to export %d media file(s). The first failure "
+                    "was '%s': %s" % (len(errors), media_path, e)
+                ) from e
+
+    def _transfer_media(self, media_path, outpath):
+        if self.export_mode == True:
+            transfer_fcn = etau.copy_file
+        elif self.export_mode == "move":
+            transfer_fcn = etau.move_file
+        else:
+            transfer_fcn = etau.symlink_file
+
+        if self._pool is None:
+            transfer_fcn(media_path, outpath)
+            return
+
+        # The same media may be exported multiple times, which we must only
+        # transfer once to avoid concurrent writes to the same output path
+        key = (media_path, outpath)
+        if key in self._transferred:
+            return
+
+        self._transferred.add(key)
+
+        # Bound the number of in-flight transfers
+        self._wait_for_transfers(4 * self.num_workers)
+
+        result = self._pool.apply_async(transfer_fcn, (media_path, outpath))
+        self._pending.append((media_path, result))
+
+    def _wait_for_transfers(self, max_pending):
+        while len(self._pending) > max_pending:
+            media_path, result = self._pending.popleft()
+            try:
+                result.get()
+            except Exception as e:
+                self._errors.append((media_path, e))
+
 
 class ImageExporter(MediaExporter):
     """Utility class for :class:`DatasetExporter` instances that export images.
@@ -1695,6 +1773,9 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
             runs in the export. Only applicable when exporting full datasets
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -1706,6 +1787,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
         export_saved_views=True,
         export_runs=True,
         pretty_print=False,
+        num_workers=None,
     ):
         if export_media is None:
             export_media = True
@@ -1718,6 +1800,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
         self.export_saved_views = export_saved_views
         self.export_runs = export_runs
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._data_dir = None
         self._fields_dir = None
@@ -1750,6 +1833,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
             export_path=self._data_dir,
             rel_dir=self.rel_dir,
             supported_modes=(True, False, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -1929,6 +2013,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
             export_path=field_dir,
             rel_dir=self.rel_dir,
             supported_modes=(True, False, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         media_exporter.setup()
         self._media_field_exporters[field_name] = media_exporter
@@ -1968,6 +2053,20 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             sample/frame files
         ordered (True): whether to preserve the order of the exported
             collections
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
+        shard_size (None): an optional maximum number of samples/frames per
+            file. If provided, samples/frames are exported into directories of
+            shard files described by a ``manifest.json`` file, which can be
+            imported in parallel. Cannot be used with ``use_dirs=True``
+        shard_format ("bson"): the format of each shard file when
+            ``shard_size`` is provided. Supported values are
+            ``("bson", "ndjson")``
+        compression (None): an optional compression to apply to each shard
+            file when ``shard_size`` is provided. Supported values are
+            ``(None, "gzip", "zstd")``. The ``zstd`` option requires the
+            ``zstandard`` package
     """
 
     def __init__(
@@ -1979,10 +2078,17 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         export_runs=True,
         use_dirs=False,
         ordered=True,
+        num_workers=None,
+        shard_size=None,
+        shard_format="bson",
+        compression=None,
     ):
         if export_media is None:
             export_media = True
 
+        if use_dirs and shard_size is not None:
+            raise ValueError("Cannot use both `use_dirs` and `shard_size`")
+
         if rel_dir is not None:
             rel_dir = fos.normalize_path(rel_dir)
 
@@ -1994,6 +2100,10 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self.export_runs = export_runs
         self.use_dirs = use_dirs
         self.ordered = ordered
+        self.num_workers = num_workers
+        self.shard_size = shard_size
+        self.shard_format = shard_format
+        self.compression = compression
 
         self._data_dir = None
         self._fields_dir = None
@@ -2015,7 +2125,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self._eval_dir = os.path.join(self.export_dir, "evaluations")
         self._metadata_path = os.path.join(self.export_dir, "metadata.json")
 
-        if self.use_dirs:
+        if self.use_dirs or self.shard_size is not None:
             self._samples_path = os.path.join(self.export_dir, "samples")
             self._frames_path = os.path.join(self.export_dir, "frames")
         else:
@@ -2027,6 +2137,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             export_path=self._data_dir,
             rel_dir=self.rel_dir,
             supported_modes=(True, False, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2075,7 +2186,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         else:
             patt = None
 
-        foo.export_collection(
+        self._export_collection(
             map(_prep_sample, _samples),
             self._samples_path,
             key="samples",
@@ -2101,7 +2212,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             frames = foo.aggregate(coll, pipeline)
 
             # @todo export segmentation/heatmap masks stored as paths
-            foo.export_collection(
+            self._export_collection(
                 frames,
                 self._frames_path,
                 key="frames",
@@ -2164,6 +2275,23 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         for media_exporter in self._media_field_exporters.values():
             media_exporter.close()
 
+    def _export_collection(
+        self, docs, path, key=None, patt=None, num_docs=None
+    ):
+        if self.shard_size is not None:
+            foo.export_collection_shards(
+                docs,
+                path,
+                shard_size=self.shard_size,
+                shard_format=self.shard_format,
+                compression=self.compression,
+                num_docs=num_docs,
+            )
+        else:
+            foo.export_collection(
+                docs, path, key=key, patt=patt, num_docs=num_docs
+            )
+
     def _export_media_fields(self, sd):
         for field_name, key in self._media_fields.items():
             value = sd.get(field_name, None)
@@ -2205,6 +2333,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             export_path=field_dir,
             rel_dir=self.rel_dir,
             supported_modes=(True, False, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         media_exporter.setup()
         self._media_field_exporters[field_name] = media_exporter
@@ -2265,10 +2394,18 @@ class ImageDirectoryExporter(UnlabeledImageDatasetExporter):
         image_format (None): the image format to use when writing in-memory
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
-        self, export_dir, export_media=None, rel_dir=None, image_format=None
+        self,
+        export_dir,
+        export_media=None,
+        rel_dir=None,
+        image_format=None,
+        num_workers=None,
     ):
         if export_media is None:
             export_media = True
@@ -2278,6 +2415,7 @@ class ImageDirectoryExporter(UnlabeledImageDatasetExporter):
         self.export_media = export_media
         self.rel_dir = rel_dir
         self.image_format = image_format
+        self.num_workers = num_workers
 
         self._media_exporter = None
 
@@ -2292,6 +2430,7 @@ class ImageDirectoryExporter(UnlabeledImageDatasetExporter):
             rel_dir=self.rel_dir,
             supported_modes=(True, "move", "symlink"),
             default_ext=self.image_format,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2328,9 +2467,14 @@ class VideoDirectoryExporter(UnlabeledVideoDatasetExporter):
             allows for populating nested subdirectories that match the shape of
             the input paths. The path is converted to an absolute path (if
             necessary) via :func:`fiftyone.core.storage.normalize_path`
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
-    def __init__(self, export_dir, export_media=None, rel_dir=None):
+    def __init__(
+        self, export_dir, export_media=None, rel_dir=None, num_workers=None
+    ):
         if export_media is None:
             export_media = True
 
@@ -2338,6 +2482,7 @@ class VideoDirectoryExporter(UnlabeledVideoDatasetExporter):
 
         self.export_media = export_media
         self.rel_dir = rel_dir
+        self.num_workers = num_workers
 
         self._media_exporter = None
 
@@ -2351,6 +2496,7 @@ class VideoDirectoryExporter(UnlabeledVideoDatasetExporter):
             export_path=self.export_dir,
             rel_dir=self.rel_dir,
             supported_modes=(True, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2388,9 +2534,14 @@ class MediaDirectoryExporter(UnlabeledMediaDatasetExporter):
             subdirectories that match the shape of the input paths. The path is
             converted to an absolute path (if necessary) via
             :func:`fiftyone.core.storage.normalize_path`
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
-    def __init__(self, export_dir, export_media=None, rel_dir=None):
+    def __init__(
+        self, export_dir, export_media=None, rel_dir=None, num_workers=None
+    ):
         if export_media is None:
             export_media = True
 
@@ -2398,6 +2549,7 @@ class MediaDirectoryExporter(UnlabeledMediaDatasetExporter):
 
         self.export_media = export_media
         self.rel_dir = rel_dir
+        self.num_workers = num_workers
 
         self._media_exporter = None
 
@@ -2411,6 +2563,7 @@ class MediaDirectoryExporter(UnlabeledMediaDatasetExporter):
             export_path=self.export_dir,
             rel_dir=self.rel_dir,
             supported_modes=(True, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2510,6 +2663,9 @@ class FiftyOneImageClassificationDatasetExporter(
             is used
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -2525,6 +2681,7 @@ class FiftyOneImageClassificationDatasetExporter(
         classes=None,
         image_format=None,
         pretty_print=False,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -2551,6 +2708,7 @@ class FiftyOneImageClassificationDatasetExporter(
         self.classes = classes
         self.image_format = image_format
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._labels_dict = None
         self._labels_map_rev = None
@@ -2574,6 +2732,7 @@ class FiftyOneImageClassificationDatasetExporter(
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2637,10 +2796,18 @@ class ImageClassificationDirectoryTreeExporter(LabeledImageDatasetExporter):
         image_format (None): the image format to use when writing in-memory
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
-        self, export_dir, export_media=None, rel_dir=None, image_format=None
+        self,
+        export_dir,
+        export_media=None,
+        rel_dir=None,
+        image_format=None,
+        num_workers=None,
     ):
         if export_media is None:
             export_media = True
@@ -2656,6 +2823,7 @@ class ImageClassificationDirectoryTreeExporter(LabeledImageDatasetExporter):
         self.export_media = export_media
         self.rel_dir = rel_dir
         self.image_format = image_format
+        self.num_workers = num_workers
 
         self._class_counts = None
         self._filename_counts = None
@@ -2678,6 +2846,7 @@ class ImageClassificationDirectoryTreeExporter(LabeledImageDatasetExporter):
         self._media_exporter = ImageExporter(
             self.export_media,
             supported_modes=(True, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2749,9 +2918,14 @@ class VideoClassificationDirectoryTreeExporter(LabeledVideoDatasetExporter):
             allows for populating nested subdirectories that match the shape of
             the input paths. The path is converted to an absolute path (if
             necessary) via :func:`fiftyone.core.storage.normalize_path`
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
-    def __init__(self, export_dir, export_media=None, rel_dir=None):
+    def __init__(
+        self, export_dir, export_media=None, rel_dir=None, num_workers=None
+    ):
         if export_media is None:
             export_media = True
 
@@ -2762,6 +2936,7 @@ class VideoClassificationDirectoryTreeExporter(LabeledVideoDatasetExporter):
 
         self.export_media = export_media
         self.rel_dir = rel_dir
+        self.num_workers = num_workers
 
         self._class_counts = None
         self._filename_counts = None
@@ -2785,6 +2960,7 @@ class VideoClassificationDirectoryTreeExporter(LabeledVideoDatasetExporter):
         self._media_exporter = VideoExporter(
             self.export_media,
             supported_modes=(True, "move", "symlink"),
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -2910,6 +3086,9 @@ class FiftyOneImageDetectionDatasetExporter(
             is used
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -2925,6 +3104,7 @@ class FiftyOneImageDetectionDatasetExporter(
         include_attributes=None,
         image_format=None,
         pretty_print=False,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -2951,6 +3131,7 @@ class FiftyOneImageDetectionDatasetExporter(
         self.include_attributes = include_attributes
         self.image_format = image_format
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._labels_dict = None
         self._labels_map_rev = None
@@ -2974,6 +3155,7 @@ class FiftyOneImageDetectionDatasetExporter(
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -3094,6 +3276,9 @@ class FiftyOneTemporalDetectionDatasetExporter(
             -   a name or iterable of names of specific attributes to include
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -3109,6 +3294,7 @@ class FiftyOneTemporalDetectionDatasetExporter(
         include_confidence=None,
         include_attributes=None,
         pretty_print=False,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -3135,6 +3321,7 @@ class FiftyOneTemporalDetectionDatasetExporter(
         self.include_confidence = include_confidence
         self.include_attributes = include_attributes
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._labels_dict = None
         self._labels_map_rev = None
@@ -3161,6 +3348,7 @@ class FiftyOneTemporalDetectionDatasetExporter(
             export_path=self.data_path,
             rel_dir=self.rel_dir,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -3279,6 +3467,9 @@ class ImageSegmentationDirectoryExporter(
             all objects are rendered with pixel value 255
         thickness (1): the thickness, in pixels, at which to render
             (non-filled) polylines
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -3293,6 +3484,7 @@ class ImageSegmentationDirectoryExporter(
         mask_size=None,
         mask_targets=None,
         thickness=1,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -3318,6 +3510,7 @@ class ImageSegmentationDirectoryExporter(
         self.mask_size = mask_size
         self.mask_targets = mask_targets
         self.thickness = thickness
+        self.num_workers = num_workers
 
         self._media_exporter = None
 
@@ -3336,6 +3529,7 @@ class ImageSegmentationDirectoryExporter(
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -3408,6 +3602,9 @@ class FiftyOneImageLabelsDatasetExporter(LabeledImageDatasetExporter):
             is used
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -3417,6 +3614,7 @@ class FiftyOneImageLabelsDatasetExporter(LabeledImageDatasetExporter):
         rel_dir=None,
         image_format=None,
         pretty_print=False,
+        num_workers=None,
     ):
         if export_media is None:
             export_media = True
@@ -3427,6 +3625,7 @@ class FiftyOneImageLabelsDatasetExporter(LabeledImageDatasetExporter):
         self.rel_dir = rel_dir
         self.image_format = image_format
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._dataset_index = None
         self._manifest_path = None
@@ -3463,6 +3662,7 @@ class FiftyOneImageLabelsDatasetExporter(LabeledImageDatasetExporter):
             supported_modes=(True, "move", "symlink"),
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -3524,10 +3724,18 @@ class FiftyOneVideoLabelsDatasetExporter(LabeledVideoDatasetExporter):
             necessary) via :func:`fiftyone.core.storage.normalize_path`
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
-        self, export_dir, export_media=None, rel_dir=None, pretty_print=False
+        self,
+        export_dir,
+        export_media=None,
+        rel_dir=None,
+        pretty_print=False,
+        num_workers=None,
     ):
         if export_media is None:
             export_media = True
@@ -3537,6 +3745,7 @@ class FiftyOneVideoLabelsDatasetExporter(LabeledVideoDatasetExporter):
         self.export_media = export_media
         self.rel_dir = rel_dir
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._dataset_index = None
         self._manifest_path = None
@@ -3576,6 +3785,7 @@ class FiftyOneVideoLabelsDatasetExporter(LabeledVideoDatasetExporter):
             rel_dir=self.rel_dir,
             supported_modes=(True, "move", "symlink"),
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -1681,6 +1681,15 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         seed (None): a random seed to use when shuffling
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
+        num_workers (None): a number of worker threads to use to load and
+            insert samples/frames that were exported in shards via the
+            ``shard_size`` parameter of
+            :class:`fiftyone.utils.data.exporters.FiftyOneDatasetExporter`.
+            By default, ``multiprocessing.cpu_count()`` is used
+        resume (False): whether to resume a previous partial import of this
+            directory into the same dataset, in which case samples/frames
+            that already exist are skipped. Only applicable to datasets that
+            were exported in shards
     """
 
     def __init__(
@@ -1693,6 +1702,8 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         shuffle=False,
         seed=None,
         max_samples=None,
+        num_workers=None,
+        resume=False,
     ):
         super().__init__(
             dataset_dir=dataset_dir,
@@ -1705,6 +1716,8 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         self.import_saved_views = import_saved_views
         self.import_runs = import_runs
         self.ordered = ordered
+        self.num_workers = num_workers
+        self.resume = resume
 
         self._data_dir = None
         self._fields_dir = None
@@ -1747,8 +1760,10 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
     def import_samples(self, dataset, tags=None):
         dataset_dict = foo.import_document(self._metadata_path)
 
-        if len(dataset) > 0 and fomi.needs_migration(
-            head=dataset_dict["version"]
+        if (
+            not self.resume
+            and len(dataset) > 0
+            and fomi.needs_migration(head=dataset_dict["version"])
         ):
             # A migration is required in order to load this dataset, and the
             # dataset we're loading into is non-empty, so we must first load
@@ -1770,7 +1785,10 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
 
     def _import_samples(self, dataset, dataset_dict, tags=None):
         name = dataset.name
-        empty_import = not bool(dataset)
+
+        # When resuming a partial import, `dataset` is non-empty but still
+        # only contains the contents of this import
+        empty_import = not bool(dataset) or self.resume
 
         #
         # Import DatasetDocument
@@ -1794,6 +1812,9 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
             # Note that we must work with dicts instead of `DatasetDocument`s
             # here because the import may need migration
             #
+            # Revisions must never decrease, so we keep the current revision
+            # rather than the exported one, and then increment it after the
+            # samples are imported
             doc = dataset._doc
             dataset_dict.update(
                 dict(
@@ -1803,6 +1824,7 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
                     persistent=doc.persistent,
                     created_at=doc.created_at,
                     last_loaded_at=doc.last_loaded_at,
+                    revision=foo.get_dataset_revision(name) or 0,
                     sample_collection_name=doc.sample_collection_name,
                     frame_collection_name=doc.frame_collection_name,
                 )
@@ -1826,14 +1848,6 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         #
 
         logger.info("Importing samples...")
-        samples, num_samples = foo.import_collection(
-            self._samples_path, key="samples"
-        )
-
-        samples = self._preprocess_list(samples)
-
-        if self.max_samples is not None:
-            num_samples = self.max_samples
 
         if self.rel_dir is not None:
             # Prepend `rel_dir` to all relative paths
@@ -1858,41 +1872,85 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
             sd["_dataset_id"] = dataset_id
             return sd
 
-        sample_ids = foo.insert_documents(
-            map(_parse_sample, samples),
-            dataset._sample_collection,
-            ordered=self.ordered,
-            progress=True,
-            num_docs=num_samples,
+        use_shards = (
+            foo.is_sharded_collection(self._samples_path)
+            and not self.shuffle
+            and self.max_samples is None
         )
 
+        if use_shards:
+            sample_ids = foo.insert_collection_shards(
+                self._samples_path,
+                dataset._sample_collection,
+                parse_fcn=_parse_sample,
+                ordered=self.ordered,
+                skip_existing=self.resume,
+                num_workers=self.num_workers,
+                progress=True,
+            )
+        else:
+            samples, num_samples = foo.import_collection(
+                self._samples_path, key="samples"
+            )
+
+            samples = self._preprocess_list(samples)
+
+            if self.max_samples is not None:
+                num_samples = self.max_samples
+
+            sample_ids = foo.insert_documents(
+                map(_parse_sample, samples),
+                dataset._sample_collection,
+                ordered=self.ordered,
+                progress=True,
+                num_docs=num_samples,
+            )
+
         #
         # Import frames
         #
 
         if self._has_frames:
             logger.info("Importing frames...")
-            frames, num_frames = foo.import_collection(
-                self._frames_path, key="frames"
-            )
-
-            # @todo optimize by only loading these docs in the first place
-            if self.max_samples is not None:
-                _sample_ids = set(sample_ids)
-                frames = [f for f in frames if f["_sample_id"] in _sample_ids]
-                num_frames = len(frames)
 
             def _parse_frame(fd):
                 fd["_dataset_id"] = dataset_id
                 return fd
 
-            foo.insert_documents(
-                map(_parse_frame, frames),
-                dataset._frame_collection,
-                ordered=self.ordered,
-                progress=True,
-                num_docs=num_frames,
-            )
+            if use_shards and foo.is_sharded_collection(self._frames_path):
+                foo.insert_collection_shards(
+                    self._frames_path,
+                    dataset._frame_collection,
+                    parse_fcn=_parse_frame,
+                    ordered=self.ordered,
+                    skip_existing=self.resume,
+                    num_workers=self.num_workers,
+                    progress=True,
+                )
+            else:
+                frames, num_frames = foo.import_collection(
+                    self._frames_path, key="frames"
+                )
+
+                # @todo optimize by only loading these docs in the first place
+                if self.max_samples is not None:
+                    _sample_ids = set(sample_ids)
+                    frames = [
+                        f for f in frames if f["_sample_id"] in _sample_ids
+                    ]
+                    num_frames = len(frames)
+
+                foo.insert_documents(
+                    map(_parse_frame, frames),
+                    dataset._frame_collection,
+                    ordered=self.ordered,
+                    progress=True,
+                    num_docs=num_frames,
+                )
+
+        # The revision is incremented only after all samples and frames are
+        # inserted so that no caches are populated from a partial import
+        dataset._update_revision()
 
         #
         # Import saved views
@@ -1961,6 +2019,11 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
     @staticmethod
     def _get_num_samples(dataset_dir):
         # Used only by dataset zoo
+        samples_path = os.path.join(dataset_dir, "samples")
+        if foo.is_sharded_collection(samples_path):
+            _, num_samples = foo.import_collection(samples_path)
+            return num_samples
+
         samples_path = os.path.join(dataset_dir, "samples.json")
         samples = etas.read_json(samples_path).get("samples", [])
         return len(samples)
@@ -10,11 +10,15 @@ import logging
 
 import numpy as np
 
+import fiftyone.core.dataset as fod
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.odm as foo
+import fiftyone.core.stages as fost
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
+import fiftyone.core.view as fovi
 
 from .base import BaseEvaluationResults
 
@@ -22,6 +26,37 @@ from .base import BaseEvaluationResults
 logger = logging.getLogger(__name__)
 
 
+# View stages that process each sample independently of the others, so
+# restricting a view to a range of sample IDs commutes with them
+_ID_RANGE_SAFE_STAGES = (
+    fost.Exclude,
+    fost.ExcludeBy,
+    fost.ExcludeFields,
+    fost.ExcludeFrames,
+    fost.ExcludeGroups,
+    fost.ExcludeLabels,
+    fost.Exists,
+    fost.FilterField,
+    fost.FilterKeypoints,
+    fost.FilterLabels,
+    fost.GeoWithin,
+    fost.LimitLabels,
+    fost.MapLabels,
+    fost.Match,
+    fost.MatchFrames,
+    fost.MatchLabels,
+    fost.MatchTags,
+    fost.Select,
+    fost.SelectBy,
+    fost.SelectFields,
+    fost.SelectFrames,
+    fost.SelectGroups,
+    fost.SelectLabels,
+    fost.SetField,
+    fost.SortBy,
+)
+
+
 def evaluate_detections(
     samples,
     pred_field,
@@ -35,6 +70,8 @@ def evaluate_detections(
     use_boxes=False,
     classwise=True,
     dynamic=True,
+    num_workers=None,
+    batch_size=None,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -127,6 +164,17 @@ def evaluate_detections(
             label (True) or allow matches between classes (False)
         dynamic (True): whether to declare the dynamic object-level attributes
             that are populated on the dataset's schema
+        num_workers (None): an optional number of worker processes to use.
+            If more than one worker is requested, the collection is split into
+            shards of contiguous sample IDs that are evaluated in parallel.
+            In this case, the ``ytrue`` and ``ypred`` of the results are
+            ordered by sample ID range rather than by the order of the
+            samples in the collection. By default, evaluation is performed in
+            the main process
+        batch_size (None): a batch size to use when saving evaluation results
+            to the database. Can either be an integer specifying the number of
+            samples to save in a batch, or a float number of seconds between
+            batched saves. Only applicable when an ``eval_key`` is provided
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
@@ -164,47 +212,38 @@ def evaluate_detections(
     eval_method.register_run(samples, eval_key)
     eval_method.register_samples(samples, eval_key, dynamic=dynamic)
 
-    processing_frames = samples._is_frame_field(pred_field)
-
-    if eval_key is not None:
-        tp_field = "%s_tp" % eval_key
-        fp_field = "%s_fp" % eval_key
-        fn_field = "%s_fn" % eval_key
-
     if config.requires_additional_fields:
         _samples = samples
     else:
         _samples = samples.select_fields([gt_field, pred_field])
 
-    matches = []
-    logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            docs = sample.frames.values()
-        else:
-            docs = [sample]
+    if num_workers is None:
+        num_workers = 1
 
-        sample_tp = 0
-        sample_fp = 0
-        sample_fn = 0
-        for doc in docs:
-            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
-            matches.extend(doc_matches)
-            tp, fp, fn = _tally_matches(doc_matches)
-            sample_tp += tp
-            sample_fp += fp
-            sample_fn += fn
-
-            if processing_frames and eval_key is not None:
-                doc[tp_field] = tp
-                doc[fp_field] = fp
-                doc[fn_field] = fn
+    if num_workers > 1 and samples._is_generated:
+        logger.warning(
+            "Parallel evaluation is not supported for generated views; "
+            "evaluating in the main process"
+        )
+        num_workers = 1
 
-        if eval_key is not None:
-            sample[tp_field] = sample_tp
-            sample[fp_field] = sample_fp
-            sample[fn_field] = sample_fn
-            sample.save()
+    logger.info("Evaluating detections...")
+    if num_workers > 1:
+        matches = _evaluate_samples_multi(
+            _samples,
+            config,
+            eval_key,
+            num_workers,
+            batch_size=batch_size,
+        )
+    else:
+        matches = _evaluate_samples(
+            _samples,
+            eval_method,
+            eval_key,
+            batch_size=batch_size,
+            progress=True,
+        )
 
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
@@ -600,6 +639,171 @@ def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
+def _evaluate_samples(
+    samples, eval_method, eval_key, batch_size=None, progress=False
+):
+    processing_frames = samples._is_frame_field(eval_method.config.pred_field)
+
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+
+    matches = []
+    for sample in samples.iter_samples(
+        progress=progress, autosave=eval_key is not None, batch_size=batch_size
+    ):
+        if processing_frames:
+            docs = sample.frames.values()
+        else:
+            docs = [sample]
+
+        sample_tp = 0
+        sample_fp = 0
+        sample_fn = 0
+        for doc in docs:
+            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+            matches.extend(doc_matches)
+            tp, fp, fn = _tally_matches(doc_matches)
+            sample_tp += tp
+            sample_fp += fp
+            sample_fn += fn
+
+            if processing_frames and eval_key is not None:
+                doc[tp_field] = tp
+                doc[fp_field] = fp
+                doc[fn_field] = fn
+
+        if eval_key is not None:
+            sample[tp_field] = sample_tp
+            sample[fp_field] = sample_fp
+            sample[fn_field] = sample_fn
+
+    return matches
+
+
+def _evaluate_samples_multi(
+    samples, config, eval_key, num_workers, batch_size=None
+):
+    shards = _get_id_shards(samples, num_workers)
+    if not shards:
+        return []
+
+    if isinstance(samples, fovi.DatasetView):
+        dataset_name = samples._root_dataset.name
+        view_stages = samples._serialize()
+    else:
+        dataset_name = samples.name
+        view_stages = None
+
+    group_slice = samples.group_slice
+
+    inputs = [
+        (
+            dataset_name,
+            view_stages,
+            group_slice,
+            first_id,
+            last_id,
+            config,
+            eval_key,
+            batch_size,
+        )
+        for first_id, last_id, _ in shards
+    ]
+
+    # Shards are merged in ID order, regardless of which worker finishes first
+    shard_matches = [None] * len(shards)
+
+    with fou.ProgressBar(total=sum(s[2] for s in shards)) as pb:
+        with fou.get_multiprocessing_context().Pool(
+            processes=min(num_workers, len(shards)),
+            initializer=_init_worker,
+        ) as pool:
+            for idx, matches in pool.imap_unordered(
+                _do_evaluate_shard, enumerate(inputs)
+            ):
+                shard_matches[idx] = matches
+                pb.update(count=shards[idx][2])
+
+    # Workers wrote directly to the database, so refresh in-memory samples
+    samples._dataset._reload_docs()
+
+    return list(itertools.chain.from_iterable(shard_matches))
+
+
+def _get_id_shards(samples, num_workers):
+    # Use several shards per worker so that workers stay busy even if some
+    # shards are more expensive to evaluate than others
+    ids = sorted(samples.values("_id"))
+    num_samples = len(ids)
+    if num_samples == 0:
+        return []
+
+    num_shards = min(4 * num_workers, num_samples)
+    bounds = np.linspace(0, num_samples, num_shards + 1).astype(int)
+
+    shards = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if stop > start:
+            shards.append((ids[start], ids[stop - 1], stop - start))
+
+    return shards
+
+
+def _init_worker():
+    # Don't share database connections with the parent process
+    foo.reset_db_conn()
+
+
+def _do_evaluate_shard(args):
+    idx, (
+        dataset_name,
+        view_stages,
+        group_slice,
+        first_id,
+        last_id,
+        config,
+        eval_key,
+        batch_size,
+    ) = args
+
+    dataset = fod.load_dataset(dataset_name)
+    if view_stages:
+        view = fovi.DatasetView._build(dataset, view_stages)
+    else:
+        view = dataset.view()
+
+    view = _make_shard_view(view, first_id, last_id)
+
+    if group_slice is not None:
+        view.group_slice = group_slice
+
+    eval_method = config.build()
+    eval_method.register_samples(view, None)
+
+    matches = _evaluate_samples(
+        view, eval_method, eval_key, batch_size=batch_size
+    )
+
+    return idx, matches
+
+
+def _make_shard_view(view, first_id, last_id):
+    id_range = [{"$match": {"_id": {"$gte": first_id, "$lte": last_id}}}]
+
+    if not all(isinstance(s, _ID_RANGE_SAFE_STAGES) for s in view._stages):
+        return view.mongo(id_range)
+
+    # Restrict the collection to the shard before applying the view's stages
+    # so that each shard only processes its own samples
+    shard_view = view._dataset.mongo(id_range)
+    for stage in view._stages:
+        shard_view = shard_view._add_view_stage(stage, validate=False)
+
+    return shard_view
+
+
 def _tally_matches(matches):
     tp = 0
     fp = 0
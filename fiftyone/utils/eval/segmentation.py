@@ -5,11 +5,12 @@ Segmentation evaluation.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
 import logging
+import multiprocessing.dummy
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import eta.core.image as etai
 
@@ -24,6 +25,8 @@ from .base import BaseEvaluationResults
 
 logger = logging.getLogger(__name__)
 
+_MAX_LUT_SIZE = 65536
+
 
 def evaluate_segmentations(
     samples,
@@ -32,6 +35,7 @@ def evaluate_segmentations(
     eval_key=None,
     mask_targets=None,
     method="simple",
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the specified semantic segmentation masks in the given
@@ -80,6 +84,9 @@ def evaluate_segmentations(
             labels. If not provided, the observed values are used as labels
         method ("simple"): a string specifying the evaluation method to use.
             Supported values are ``("simple")``
+        num_workers (None): the number of worker threads to use to load and
+            evaluate masks. By default, ``multiprocessing.cpu_count()`` is
+            used
         **kwargs: optional keyword arguments for the constructor of the
             :class:`SegmentationEvaluationConfig` being used
 
@@ -98,7 +105,10 @@ def evaluate_segmentations(
     eval_method.register_samples(samples, eval_key)
 
     results = eval_method.evaluate_samples(
-        samples, eval_key=eval_key, mask_targets=mask_targets
+        samples,
+        eval_key=eval_key,
+        mask_targets=mask_targets,
+        num_workers=num_workers,
     )
     eval_method.save_run_results(samples, eval_key, results)
 
@@ -167,7 +177,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
             if processing_frames:
                 dataset.add_frame_field(dice_field, fof.FloatField)
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         """Evaluates the predicted segmentation masks in the given samples with
         respect to the specified ground truth masks.
 
@@ -178,6 +190,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
                 contain a subset of the possible classes if you wish to
                 evaluate a subset of the semantic classes. By default, the
                 observed pixel values are used as labels
+            num_workers (None): the number of worker threads to use to load
+                and evaluate masks. By default,
+                ``multiprocessing.cpu_count()`` is used
 
         Returns:
             a :class:`SegmentationResults` instance
@@ -301,7 +316,9 @@ class SimpleEvaluation(SegmentationEvaluation):
         config: a :class:`SimpleEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         pred_field = self.config.pred_field
         gt_field = self.config.gt_field
 
@@ -313,81 +330,77 @@ class SimpleEvaluation(SegmentationEvaluation):
 
             values, classes = zip(*sorted(mask_targets.items()))
         else:
-            logger.info("Computing possible mask values...")
-            values, classes = _get_mask_values(samples, pred_field, gt_field)
+            # The possible mask values are computed from the same pass over
+            # the masks that performs the evaluation
+            values, classes = None, None
 
         _samples = samples.select_fields([gt_field, pred_field])
         pred_field, processing_frames = samples._handle_frame_field(pred_field)
         gt_field, _ = samples._handle_frame_field(gt_field)
 
-        nc = len(values)
-        confusion_matrix = np.zeros((nc, nc), dtype=int)
-
         bandwidth = self.config.bandwidth
         average = self.config.average
         compute_dice = self.config.compute_dice
 
-        if eval_key is not None:
-            acc_field = "%s_accuracy" % eval_key
-            pre_field = "%s_precision" % eval_key
-            rec_field = "%s_recall" % eval_key
-            if compute_dice:
-                dice_field = "%s_dice" % eval_key
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+
+        tasks = _iter_mask_tasks(
+            _samples, pred_field, gt_field, processing_frames
+        )
+        compute_stats = lambda task: _compute_sample_stats(
+            task, values, bandwidth
+        )
 
         logger.info("Evaluating segmentations...")
-        for sample in _samples.iter_samples(progress=True):
-            if processing_frames:
-                images = sample.frames.values()
-            else:
-                images = [sample]
+        if values is not None:
+            stats = _map_tasks(compute_stats, tasks, num_workers)
+        else:
+            stats = list(_map_tasks(compute_stats, tasks, num_workers))
+            values, classes, stats = _densify_stats(stats)
+
+        nc = len(values)
+        confusion_matrix = np.zeros((nc, nc), dtype=int)
 
+        sample_metrics = []
+        frame_metrics = []
+        for sample_id, image_stats in stats:
             sample_conf_mat = np.zeros((nc, nc), dtype=int)
-            for image in images:
-                gt_seg = image[gt_field]
-                if gt_seg is None or not gt_seg.has_mask:
-                    msg = "Skipping sample with missing ground truth mask"
-                    warnings.warn(msg)
-                    continue
-
-                pred_seg = image[pred_field]
-                if pred_seg is None or not pred_seg.has_mask:
-                    msg = "Skipping sample with missing prediction mask"
-                    warnings.warn(msg)
-                    continue
-
-                image_conf_mat = _compute_pixel_confusion_matrix(
-                    pred_seg.get_mask(),
-                    gt_seg.get_mask(),
-                    values,
-                    bandwidth=bandwidth,
-                )
+            for frame_number, image_conf_mat in image_stats:
                 sample_conf_mat += image_conf_mat
 
                 # Record frame stats, if requested
                 if processing_frames and eval_key is not None:
-                    facc, fpre, frec = _compute_accuracy_precision_recall(
+                    metrics = _compute_accuracy_precision_recall(
                         image_conf_mat, values, average
                     )
-                    image[acc_field] = facc
-                    image[pre_field] = fpre
-                    image[rec_field] = frec
                     if compute_dice:
-                        image[dice_field] = _compute_dice_score(image_conf_mat)
+                        metrics += (_compute_dice_score(image_conf_mat),)
+
+                    frame_metrics.append((sample_id, frame_number, metrics))
 
             confusion_matrix += sample_conf_mat
 
             # Record sample stats, if requested
             if eval_key is not None:
-                sacc, spre, srec = _compute_accuracy_precision_recall(
+                metrics = _compute_accuracy_precision_recall(
                     sample_conf_mat, values, average
                 )
-                sample[acc_field] = sacc
-                sample[pre_field] = spre
-                sample[rec_field] = srec
                 if compute_dice:
-                    sample[dice_field] = _compute_dice_score(confusion_matrix)
+                    metrics += (_compute_dice_score(confusion_matrix),)
+
+                sample_metrics.append((sample_id, metrics))
 
-                sample.save()
+        if eval_key is not None:
+            fields = [
+                "%s_accuracy" % eval_key,
+                "%s_precision" % eval_key,
+                "%s_recall" % eval_key,
+            ]
+            if compute_dice:
+                fields.append("%s_dice" % eval_key)
+
+            _save_metrics(samples, fields, sample_metrics, frame_metrics)
 
         if nc > 0:
             missing = classes[0] if values[0] in (0, "#000000") else None
@@ -500,6 +513,11 @@ def _parse_config(pred_field, gt_field, method, **kwargs):
 def _compute_pixel_confusion_matrix(
     pred_mask, gt_mask, values, bandwidth=None
 ):
+    pred_mask, gt_mask = _prepare_masks(pred_mask, gt_mask, bandwidth)
+    return _bincount_confusion_matrix(pred_mask, gt_mask, values)
+
+
+def _prepare_masks(pred_mask, gt_mask, bandwidth):
     if pred_mask.ndim == 3:
         pred_mask = _rgb_array_to_int(pred_mask)
 
@@ -520,15 +538,211 @@ def _compute_pixel_confusion_matrix(
             pred_mask, gt_mask, bandwidth
         )
 
-    try:
-        return skm.confusion_matrix(
-            gt_mask.ravel(), pred_mask.ravel(), labels=values
+    return pred_mask.ravel(), gt_mask.ravel()
+
+
+def _bincount_confusion_matrix(pred_mask, gt_mask, values):
+    # Pixels whose values are not in `values` are mapped to an extra index
+    # that is dropped from the confusion matrix
+    num_classes = len(values)
+    gt_inds = _index_mask(gt_mask, values)
+    pred_inds = _index_mask(pred_mask, values)
+
+    n = num_classes + 1
+    counts = np.bincount(gt_inds * n + pred_inds, minlength=n * n)
+    return counts.reshape(n, n)[:num_classes, :num_classes]
+
+
+def _index_mask(mask, values):
+    values = np.asarray(values)
+    num_classes = len(values)
+
+    if num_classes == 0:
+        return np.zeros(mask.size, dtype=np.intp)
+
+    # Small non-negative integer values can be mapped via a lookup table
+    if (
+        np.issubdtype(mask.dtype, np.integer)
+        and np.issubdtype(values.dtype, np.integer)
+        and values.min() >= 0
+        and values.max() < _MAX_LUT_SIZE
+        and (mask.size == 0 or mask.min() >= 0)
+    ):
+        lut = np.full(values.max() + 2, num_classes, dtype=np.intp)
+        lut[values] = np.arange(num_classes)
+        return lut[np.minimum(mask, values.max() + 1)]
+
+    inds = np.searchsorted(values, mask)
+    found = values[np.minimum(inds, num_classes - 1)] == mask
+    return np.where(found, inds, num_classes)
+
+
+def _compute_pair_counts(pred_mask, gt_mask):
+    # A sparse confusion matrix over the values observed in the masks
+    gt_values, gt_inds = np.unique(gt_mask, return_inverse=True)
+    pred_values, pred_inds = np.unique(pred_mask, return_inverse=True)
+
+    n = len(pred_values)
+    counts = np.bincount(
+        gt_inds.ravel() * n + pred_inds.ravel(), minlength=len(gt_values) * n
+    )
+    return gt_values, pred_values, counts.reshape(len(gt_values), n)
+
+
+def _iter_mask_tasks(samples, pred_field, gt_field, processing_frames):
+    for sample in samples.iter_samples(progress=True):
+        if processing_frames:
+            images = sample.frames.items()
+        else:
+            images = [(None, sample)]
+
+        segs = [
+            (frame_number, image[pred_field], image[gt_field])
+            for frame_number, image in images
+        ]
+
+        yield sample.id, segs
+
+
+def _compute_sample_stats(task, values, bandwidth):
+    # Each mask is decoded exactly once. When `values` is None, a sparse
+    # confusion matrix over the observed values is returned for each image
+    sample_id, segs = task
+
+    image_stats = []
+    for frame_number, pred_seg, gt_seg in segs:
+        has_gt = gt_seg is not None and gt_seg.has_mask
+        has_pred = pred_seg is not None and pred_seg.has_mask
+
+        if not has_gt or not has_pred:
+            if not has_gt:
+                msg = "Skipping sample with missing ground truth mask"
+            else:
+                msg = "Skipping sample with missing prediction mask"
+
+            warnings.warn(msg)
+
+            # Masks without a counterpart still contribute possible values
+            if values is None:
+                seg = gt_seg if has_gt else pred_seg if has_pred else None
+                if seg is not None:
+                    mask = seg.get_mask()
+                    image_stats.append(
+                        (None, None, _get_values(mask), mask.ndim == 3)
+                    )
+
+            continue
+
+        pred_mask = pred_seg.get_mask()
+        gt_mask = gt_seg.get_mask()
+
+        if values is None:
+            is_rgb = pred_mask.ndim == 3 or gt_mask.ndim == 3
+
+            # Values outside of the contour band must still be observed
+            if bandwidth is not None:
+                _values = np.union1d(
+                    _get_values(pred_mask), _get_values(gt_mask)
+                )
+            else:
+                _values = None
+
+        pred_mask, gt_mask = _prepare_masks(pred_mask, gt_mask, bandwidth)
+
+        if values is not None:
+            conf_mat = _bincount_confusion_matrix(pred_mask, gt_mask, values)
+            image_stats.append((frame_number, conf_mat))
+        else:
+            pair_counts = _compute_pair_counts(pred_mask, gt_mask)
+            image_stats.append((frame_number, pair_counts, _values, is_rgb))
+
+    return sample_id, image_stats
+
+
+def _get_values(mask):
+    if mask.ndim == 3:
+        mask = _rgb_array_to_int(mask)
+
+    return np.unique(mask)
+
+
+def _densify_stats(stats):
+    all_values = set()
+    is_rgb = False
+    for _, image_stats in stats:
+        for _, pair_counts, _values, _is_rgb in image_stats:
+            is_rgb |= _is_rgb
+            if pair_counts is not None:
+                gt_values, pred_values, _ = pair_counts
+                all_values.update(gt_values.tolist())
+                all_values.update(pred_values.tolist())
+
+            if _values is not None:
+                all_values.update(_values.tolist())
+
+    values = sorted(all_values)
+
+    if is_rgb:
+        classes = [_int_to_hex(v) for v in values]
+    else:
+        classes = [str(v) for v in values]
+
+    dense_stats = []
+    for sample_id, image_stats in stats:
+        image_conf_mats = []
+        for frame_number, pair_counts, _, _ in image_stats:
+            if pair_counts is None:
+                continue
+
+            gt_values, pred_values, counts = pair_counts
+            conf_mat = np.zeros((len(values), len(values)), dtype=int)
+            rows = np.searchsorted(values, gt_values)
+            cols = np.searchsorted(values, pred_values)
+            conf_mat[np.ix_(rows, cols)] = counts
+            image_conf_mats.append((frame_number, conf_mat))
+
+        dense_stats.append((sample_id, image_conf_mats))
+
+    return values, classes, dense_stats
+
+
+def _map_tasks(fcn, tasks, num_workers):
+    if num_workers <= 1:
+        yield from map(fcn, tasks)
+        return
+
+    # Bound the number of tasks in flight, since each task may hold masks in
+    # memory
+    with multiprocessing.dummy.Pool(processes=num_workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(fcn, (task,)))
+            if len(pending) >= 4 * num_workers:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+
+def _save_metrics(samples, fields, sample_metrics, frame_metrics):
+    if not sample_metrics:
+        return
+
+    for idx, field in enumerate(fields):
+        values = {_id: metrics[idx] for _id, metrics in sample_metrics}
+        samples.set_values(field, values, key_field="id")
+
+    if not frame_metrics:
+        return
+
+    for idx, field in enumerate(fields):
+        values = {}
+        for _id, frame_number, metrics in frame_metrics:
+            values.setdefault(_id, {})[frame_number] = metrics[idx]
+
+        samples.set_values(
+            samples._FRAMES_PREFIX + field, values, key_field="id"
         )
-    except ValueError:
-        # Assume that no `values` appear in `gt_mask`, which causes
-        # `skm.confusion_matrix` to raise an error
-        num_classes = len(values)
-        return np.zeros((num_classes, num_classes), dtype=int)
 
 
 def _compute_dice_score(confusion_matrix):
@@ -556,41 +770,6 @@ def _compute_accuracy_precision_recall(confusion_matrix, values, average):
     return metrics["accuracy"], metrics["precision"], metrics["recall"]
 
 
-def _get_mask_values(samples, pred_field, gt_field):
-    _samples = samples.select_fields([gt_field, pred_field])
-    pred_field, processing_frames = samples._handle_frame_field(pred_field)
-    gt_field, _ = samples._handle_frame_field(gt_field)
-
-    values = set()
-    is_rgb = False
-
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
-
-        for image in images:
-            for field in (pred_field, gt_field):
-                seg = image[field]
-                if seg is not None and seg.has_mask:
-                    mask = seg.get_mask()
-                    if mask.ndim == 3:
-                        is_rgb = True
-                        mask = _rgb_array_to_int(mask)
-
-                    values.update(mask.ravel())
-
-    values = sorted(values)
-
-    if is_rgb:
-        classes = [_int_to_hex(v) for v in values]
-    else:
-        classes = [str(v) for v in values]
-
-    return values, classes
-
-
 def _rgb_array_to_int(mask):
     return (
         np.left_shift(mask[:, :, 0], 16, dtype=int)
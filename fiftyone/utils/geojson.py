@@ -577,6 +577,9 @@ class GeoJSONDatasetExporter(
             from the output properties
         pretty_print (False): whether to render the JSON in human readable
             format with newlines and indentations
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -592,6 +595,7 @@ class GeoJSONDatasetExporter(
         property_makers=None,
         omit_none_fields=True,
         pretty_print=False,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -618,6 +622,7 @@ class GeoJSONDatasetExporter(
         self.property_makers = property_makers
         self.omit_none_fields = omit_none_fields
         self.pretty_print = pretty_print
+        self.num_workers = num_workers
 
         self._features = []
         self._location_field = None
@@ -629,6 +634,7 @@ class GeoJSONDatasetExporter(
             export_path=self.data_path,
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
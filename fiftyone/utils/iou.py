@@ -85,7 +85,8 @@ def compute_ious(
         return np.zeros((len(preds), len(gts)))
 
     if etau.is_str(iscrowd):
-        iscrowd = lambda l: bool(l.get_attribute_value(iscrowd, False))
+        crowd_attr = iscrowd
+        iscrowd = lambda l: bool(l.get_attribute_value(crowd_attr, False))
 
     if isinstance(preds[0], fol.Polyline):
         if use_boxes:
@@ -473,14 +474,77 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             gts = _polylines_to_detections(gts)
 
     if _get_bbox_dim(gts[0]) == 3:
-        bbox_iou_fcn = _compute_cuboid_iou
+        return _compute_cuboid_ious(
+            preds, gts, gt_crowds, is_symmetric, classwise=classwise
+        )
+
+    pred_boxes = _get_bboxes(preds)
+
+    if is_symmetric:
+        gt_boxes = pred_boxes
     else:
-        bbox_iou_fcn = _compute_bbox_iou
+        gt_boxes = _get_bboxes(gts)
+
+    ious = _compute_bbox_iou_matrix(
+        pred_boxes, gt_boxes, np.array(gt_crowds, dtype=bool)
+    )
+
+    if classwise:
+        pred_labels = np.array([pred.label for pred in preds], dtype=object)
+
+        if is_symmetric:
+            gt_labels = pred_labels
+        else:
+            gt_labels = np.array([gt.label for gt in gts], dtype=object)
+
+        ious[pred_labels[:, None] != gt_labels[None, :]] = 0
+
+    if is_symmetric:
+        # Mirror the lower triangle so that ious[i, j] == ious[j, i]
+        ious = np.tril(ious, k=-1)
+        ious = ious + ious.T
+        np.fill_diagonal(ious, 1)
+
+    return ious
+
 
+def _get_bboxes(detections):
+    return np.array(
+        [detection.bounding_box for detection in detections], dtype=float
+    ).reshape(-1, 4)
+
+
+def _compute_bbox_iou_matrix(pred_boxes, gt_boxes, gt_crowds):
+    # Vectorized version of `_compute_bbox_iou()` that computes all pairwise
+    # IoUs at once. Operations are performed in the same order so that
+    # results are identical to the scalar implementation
+    px, py, pw, ph = (pred_boxes[:, k, None] for k in range(4))
+    gx, gy, gw, gh = (gt_boxes[None, :, k] for k in range(4))
+
+    gt_area = gh * gw
+    pred_area = ph * pw
+
+    # Width and height of intersection
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+
+    overlap = (w > 0) & (h > 0)
+    inter = np.where(overlap, h * w, 0.0)
+
+    union = np.where(
+        gt_crowds[None, :], pred_area, pred_area + gt_area - inter
+    )
+
+    ious = np.zeros(inter.shape)
+    np.divide(inter, union, out=ious, where=overlap & (union != 0))
+
+    return np.minimum(ious, 1)
+
+
+def _compute_cuboid_ious(preds, gts, gt_crowds, is_symmetric, classwise=False):
     ious = np.zeros((len(preds), len(gts)))
 
     for j, (gt, gt_crowd) in enumerate(zip(gts, gt_crowds)):
-
         for i, pred in enumerate(preds):
             if is_symmetric and i < j:
                 iou = ious[j, i]
@@ -489,7 +553,7 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             elif classwise and pred.label != gt.label:
                 continue
             else:
-                iou = bbox_iou_fcn(gt, pred, gt_crowd=gt_crowd)
+                iou = _compute_cuboid_iou(gt, pred, gt_crowd=gt_crowd)
 
             ious[i, j] = iou
 
@@ -269,6 +269,9 @@ class KITTIDetectionDatasetExporter(
         image_format (None): the image format to use when writing in-memory
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -279,6 +282,7 @@ class KITTIDetectionDatasetExporter(
         export_media=None,
         rel_dir=None,
         image_format=None,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -300,6 +304,7 @@ class KITTIDetectionDatasetExporter(
         self.export_media = export_media
         self.rel_dir = rel_dir
         self.image_format = image_format
+        self.num_workers = num_workers
 
         self._writer = None
         self._media_exporter = None
@@ -320,6 +325,7 @@ class KITTIDetectionDatasetExporter(
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
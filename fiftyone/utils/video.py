@@ -8,6 +8,7 @@ Video utilities.
 import itertools
 import json
 import logging
+import multiprocessing
 import os
 
 import eta.core.frameutils as etaf
@@ -97,6 +98,7 @@ def reencode_videos(
     delete_originals=False,
     skip_failures=False,
     verbose=False,
+    num_workers=None,
     **kwargs,
 ):
     """Re-encodes the videos in the sample collection as H.264 MP4s that can be
@@ -152,6 +154,10 @@ def reencode_videos(
             an error if a video cannot be re-encoded
         verbose (False): whether to log the ``ffmpeg`` commands that are
             executed
+        num_workers (None): the number of worker threads to use to run
+            ``ffmpeg`` jobs concurrently. When multiple workers are used, the
+            threads of each ``ffmpeg`` job are limited so that the jobs share
+            the available CPUs. By default, videos are processed serially
         **kwargs: keyword arguments for ``eta.core.video.FFmpeg(**kwargs)``
     """
     fov.validate_video_collection(sample_collection)
@@ -168,6 +174,7 @@ def reencode_videos(
         delete_originals=delete_originals,
         skip_failures=skip_failures,
         verbose=verbose,
+        num_workers=num_workers,
         **kwargs,
     )
 
@@ -190,6 +197,7 @@ def transform_videos(
     delete_originals=False,
     skip_failures=False,
     verbose=False,
+    num_workers=None,
     **kwargs,
 ):
     """Transforms the videos in the sample collection according to the provided
@@ -258,6 +266,10 @@ def transform_videos(
             an error if a video cannot be transformed
         verbose (False): whether to log the ``ffmpeg`` commands that are
             executed
+        num_workers (None): the number of worker threads to use to run
+            ``ffmpeg`` jobs concurrently. When multiple workers are used, the
+            threads of each ``ffmpeg`` job are limited so that the jobs share
+            the available CPUs. By default, videos are processed serially
         **kwargs: keyword arguments for ``eta.core.video.FFmpeg(**kwargs)``
     """
     fov.validate_video_collection(sample_collection)
@@ -280,6 +292,7 @@ def transform_videos(
         delete_originals=delete_originals,
         skip_failures=skip_failures,
         verbose=verbose,
+        num_workers=num_workers,
         **kwargs,
     )
 
@@ -303,6 +316,7 @@ def sample_videos(
     delete_originals=False,
     skip_failures=False,
     verbose=False,
+    num_workers=None,
     **kwargs,
 ):
     """Samples the videos in the sample collection into directories of
@@ -404,6 +418,10 @@ def sample_videos(
             an error if a video cannot be sampled
         verbose (False): whether to log the ``ffmpeg`` commands that are
             executed
+        num_workers (None): the number of worker threads to use to run
+            ``ffmpeg`` jobs concurrently. When multiple workers are used, the
+            threads of each ``ffmpeg`` job are limited so that the jobs share
+            the available CPUs. By default, videos are processed serially
         **kwargs: keyword arguments for ``eta.core.video.FFmpeg(**kwargs)``
     """
     fov.validate_video_collection(sample_collection)
@@ -428,6 +446,7 @@ def sample_videos(
         delete_originals=delete_originals,
         skip_failures=skip_failures,
         verbose=verbose,
+        num_workers=num_workers,
         **kwargs,
     )
 
@@ -725,6 +744,7 @@ def _transform_videos(
     delete_originals=False,
     skip_failures=False,
     verbose=False,
+    num_workers=None,
     **kwargs,
 ):
     if output_field is None:
@@ -741,85 +761,184 @@ def _transform_videos(
 
     view = sample_collection.select_fields(media_field)
 
+    _save_frames = save_filepaths and sample_frames
+    if _save_frames:
+        sample_ids, inpaths, metadatas = view.values(
+            ["id", media_field, "metadata"]
+        )
+    else:
+        sample_ids, inpaths = view.values(["id", media_field])
+        metadatas = itertools.repeat(None)
+
     if frames is None:
         frames = itertools.repeat(None)
 
-    with fou.ProgressBar(total=len(view)) as pb:
-        for sample, _frames in pb(zip(view, frames)):
-            inpath = sample[media_field]
+    tasks = []
+    for sample_id, inpath, metadata, _frames in zip(
+        sample_ids, inpaths, metadatas, frames
+    ):
+        _outpath = _get_outpath(inpath, output_dir=output_dir, rel_dir=rel_dir)
+
+        if sample_frames:
+            outpath = os.path.join(os.path.splitext(_outpath)[0], frames_patt)
+
+            # If sampling was not forced and the first frame exists, assume
+            # that all frames exist
+            fn = _frames[0] if _frames else 1
+            if not force_reencode and os.path.isfile(outpath % fn):
+                continue
+        elif reencode:
+            root, ext = os.path.splitext(_outpath)
+            if ext.lower() != ".mp4":
+                outpath = root + ".mp4"
+            else:
+                outpath = _outpath
+        else:
+            outpath = _outpath
+
+        tasks.append((sample_id, inpath, outpath, _frames, metadata))
+
+    # Videos may be shared by multiple samples, so each video is transformed
+    # only once, which also prevents concurrent jobs from writing or deleting
+    # the same files
+    jobs = {}
+    for sample_id, inpath, outpath, _frames, metadata in tasks:
+        job = jobs.get(inpath, None)
+        if job is None:
+            jobs[inpath] = [outpath, _frames, metadata, [(sample_id, _frames)]]
+        else:
+            job[1] = _merge_frames(job[1], _frames)
+            job[3].append((sample_id, _frames))
+
+    if num_workers is None:
+        num_workers = 1
+
+    if num_workers > 1:
+        threads = max(1, multiprocessing.cpu_count() // num_workers)
+    else:
+        threads = None
+
+    transform_kwargs = dict(
+        fps=fps,
+        min_fps=min_fps,
+        max_fps=max_fps,
+        size=size,
+        min_size=min_size,
+        max_size=max_size,
+        original_frame_numbers=original_frame_numbers,
+        reencode=reencode,
+        force_reencode=force_reencode,
+        delete_original=delete_originals,
+        skip_failures=skip_failures,
+        verbose=verbose,
+        threads=threads,
+        **kwargs,
+    )
+
+    tasks = [
+        (inpath, outpath, _frames, metadata, _save_frames, transform_kwargs)
+        for inpath, (outpath, _frames, metadata, _) in jobs.items()
+    ]
+    job_results = fos.run(
+        _do_transform_video, tasks, num_workers=num_workers, progress=True
+    )
 
-            _outpath = _get_outpath(
-                inpath, output_dir=output_dir, rel_dir=rel_dir
+    results = []
+    for (inpath, job), job_result in zip(jobs.items(), job_results):
+        outpath, frame_numbers, metadata = job_result
+        for sample_id, _frames in job[3]:
+            if _frames is None:
+                _frames = frame_numbers
+
+            results.append((sample_id, inpath, outpath, _frames, metadata))
+
+    #
+    # Write results to the database in batches
+    #
+
+    if _save_frames:
+        frame_paths = {}
+        new_metadata = {}
+        for sample_id, _, outpath, frame_numbers, metadata in results:
+            if metadata is not None:
+                new_metadata[sample_id] = metadata
+
+            _frame_paths = {}
+            for fn in frame_numbers:
+                frame_path = outpath % fn
+                if os.path.isfile(frame_path):
+                    _frame_paths[fn] = frame_path
+
+            if _frame_paths:
+                frame_paths[sample_id] = _frame_paths
+
+        if new_metadata:
+            sample_collection.set_values(
+                "metadata", new_metadata, key_field="id"
             )
 
-            if sample_frames:
-                outpath = os.path.join(
-                    os.path.splitext(_outpath)[0], frames_patt
-                )
-
-                # If sampling was not forced and the first frame exists, assume
-                # that all frames exist
-                fn = _frames[0] if _frames else 1
-                if not force_reencode and os.path.isfile(outpath % fn):
-                    continue
-            elif reencode:
-                root, ext = os.path.splitext(_outpath)
-                if ext.lower() != ".mp4":
-                    outpath = root + ".mp4"
-                else:
-                    outpath = _outpath
-            else:
-                outpath = _outpath
+        if frame_paths:
+            sample_collection.set_values(
+                sample_collection._FRAMES_PREFIX + output_field,
+                frame_paths,
+                key_field="id",
+            )
 
-            _transform_video(
-                inpath,
-                outpath,
-                frames=_frames,
-                fps=fps,
-                min_fps=min_fps,
-                max_fps=max_fps,
-                size=size,
-                min_size=min_size,
-                max_size=max_size,
-                original_frame_numbers=original_frame_numbers,
-                reencode=reencode,
-                force_reencode=force_reencode,
-                delete_original=delete_originals,
-                skip_failures=skip_failures,
-                verbose=verbose,
-                **kwargs,
+    if update_filepaths and not sample_frames:
+        outpaths = {
+            sample_id: outpath
+            for sample_id, inpath, outpath, _, _ in results
+            if diff_field or outpath != inpath
+        }
+
+        if outpaths:
+            sample_collection.set_values(
+                output_field, outpaths, key_field="id"
             )
 
-            if save_filepaths and sample_frames:
-                if _frames is None:
-                    try:
-                        if sample.metadata is None:
-                            sample.compute_metadata()
 
-                        _frames = range(
-                            1, sample.metadata.total_frame_count + 1
-                        )
-                    except BaseException as e:
-                        if not skip_failures:
-                            raise
+def _merge_frames(frames1, frames2):
+    # `None` means all frames
+    if frames1 is None or frames2 is None:
+        return None
+
+    return sorted(set(frames1) | set(frames2))
+
 
-                        _frames = []
-                        logger.warning(e)
+def _do_transform_video(task):
+    (
+        inpath,
+        outpath,
+        frames,
+        metadata,
+        save_frames,
+        transform_kwargs,
+    ) = task
 
-                for fn in _frames:
-                    frame_path = outpath % fn
-                    if os.path.isfile(frame_path):
-                        sample.frames[fn][output_field] = frame_path
+    frame_numbers = None
+    new_metadata = None
 
-                sample.save()
+    # The frames to record must be determined before transforming, since the
+    # original video may be deleted
+    if save_frames and frames is None:
+        try:
+            if metadata is None:
+                metadata = fom.VideoMetadata.build_for(inpath)
+                new_metadata = metadata
+
+            frame_numbers = range(1, metadata.total_frame_count + 1)
+        except BaseException as e:
+            if not transform_kwargs["skip_failures"]:
+                raise
+
+            frame_numbers = []
+            logger.warning(e)
+    elif save_frames:
+        frame_numbers = frames
 
-            if (
-                update_filepaths
-                and not sample_frames
-                and (diff_field or outpath != inpath)
-            ):
-                sample[output_field] = outpath
-                sample.save()
+    _transform_video(inpath, outpath, frames=frames, **transform_kwargs)
+
+    return outpath, frame_numbers, new_metadata
 
 
 def _transform_video(
@@ -839,6 +958,7 @@ def _transform_video(
     delete_original=False,
     skip_failures=False,
     verbose=False,
+    threads=None,
     **kwargs,
 ):
     inpath = fos.normalize_path(inpath)
@@ -896,6 +1016,22 @@ def _transform_video(
             if "out_opts" not in kwargs:
                 kwargs["out_opts"] = []
 
+        if threads is not None:
+            # Limit the threads of each ffmpeg process when multiple processes
+            # are running concurrently
+            in_opts = kwargs["in_opts"]
+            if in_opts is None:
+                in_opts = etav.FFmpeg.DEFAULT_IN_OPTS
+
+            out_opts = kwargs["out_opts"]
+            if out_opts is None and etav.is_video_mime_type(outpath):
+                out_opts = etav.FFmpeg.DEFAULT_VIDEO_OUT_OPTS
+            elif out_opts is None:
+                out_opts = etav.FFmpeg.DEFAULT_IMAGES_OUT_OPTS
+
+            kwargs["in_opts"] = list(in_opts) + ["-threads", str(threads)]
+            kwargs["out_opts"] = list(out_opts) + ["-threads", str(threads)]
+
         should_reencode = (
             force_reencode
             or fps is not None
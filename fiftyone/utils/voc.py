@@ -282,6 +282,9 @@ class VOCDetectionDatasetExporter(
             -   ``True``: export all extra attributes found
             -   ``False``: do not export extra attributes
             -   a name or list of names of specific attributes to export
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -294,6 +297,7 @@ class VOCDetectionDatasetExporter(
         include_paths=True,
         image_format=None,
         extra_attrs=True,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -317,6 +321,7 @@ class VOCDetectionDatasetExporter(
         self.include_paths = include_paths
         self.image_format = image_format
         self.extra_attrs = extra_attrs
+        self.num_workers = num_workers
 
         self._writer = None
         self._media_exporter = None
@@ -336,6 +341,7 @@ class VOCDetectionDatasetExporter(
             export_path=self.data_path,
             rel_dir=self.rel_dir,
             default_ext=self.image_format,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -616,6 +616,9 @@ class YOLOv4DatasetExporter(
         image_format (None): the image format to use when writing in-memory
             images to disk. By default, ``fiftyone.config.default_image_ext``
             is used
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -630,6 +633,7 @@ class YOLOv4DatasetExporter(
         classes=None,
         include_confidence=False,
         image_format=None,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -665,6 +669,7 @@ class YOLOv4DatasetExporter(
         self.classes = classes
         self.include_confidence = include_confidence
         self.image_format = image_format
+        self.num_workers = num_workers
 
         self._classes = None
         self._dynamic_classes = classes is None
@@ -699,6 +704,7 @@ class YOLOv4DatasetExporter(
             supported_modes=(True, False, "move", "symlink"),
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
@@ -817,6 +823,9 @@ class YOLOv5DatasetExporter(
             is used
         include_path (True): whether to include the directory name containing
             the YAML file in the ``path`` key of the exported YAML
+        num_workers (None): a number of worker threads to use to transfer
+            media files in the background while labels are being exported.
+            By default, media files are transferred synchronously
     """
 
     def __init__(
@@ -832,6 +841,7 @@ class YOLOv5DatasetExporter(
         include_confidence=False,
         image_format=None,
         include_path=True,
+        num_workers=None,
     ):
         data_path, export_media = self._parse_data_path(
             export_dir=export_dir,
@@ -864,6 +874,7 @@ class YOLOv5DatasetExporter(
         self.include_confidence = include_confidence
         self.image_format = image_format
         self.include_path = include_path
+        self.num_workers = num_workers
 
         self._classes = None
         self._dynamic_classes = classes is None
@@ -896,6 +907,7 @@ class YOLOv5DatasetExporter(
             supported_modes=(True, False, "move", "symlink"),
             default_ext=self.image_format,
             ignore_exts=True,
+            num_workers=self.num_workers,
         )
         self._media_exporter.setup()
 
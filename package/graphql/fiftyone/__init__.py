@@ -18,3 +18,18 @@ from pkgutil import extend_path
 __path__ = extend_path(__path__, __name__)
 
 from fiftyone.__public__ import *
+import fiftyone.__public__ as _fop
+
+
+def __getattr__(name):
+    # Expensive public attributes are imported lazily on first access
+    if name in _fop._LAZY_ATTRS:
+        value = getattr(_fop, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_fop._LAZY_ATTRS))
@@ -0,0 +1,77 @@
+"""
+Benchmarking for ``import fiftyone``.
+
+Results are written to `import_benchmark.log`.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import subprocess
+import sys
+
+import eta.core.logging as etal
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+NUM_RUNS = 5
+
+_SCRIPT = """
+import timeit
+
+start = timeit.default_timer()
+import fiftyone as fo
+import_time = timeit.default_timer() - start
+
+start = timeit.default_timer()
+%s
+use_time = timeit.default_timer() - start
+
+print("%%f %%f" %% (import_time, use_time))
+"""
+
+CASES = [
+    ("import only", "pass"),
+    ("list datasets", "fo.list_datasets()"),
+    ("access plots", "fo.plot_confusion_matrix"),
+]
+
+
+def _run(code):
+    out = subprocess.check_output(
+        [sys.executable, "-c", _SCRIPT % code],
+        env=dict(os.environ, FIFTYONE_DO_NOT_TRACK="true"),
+    )
+    import_time, use_time = out.decode().split()[-2:]
+    return float(import_time), float(use_time)
+
+
+#
+# Import benchmark
+#
+
+logger.info("\nStarting test")
+for name, code in CASES:
+    logger.info("\nCase: %s" % name)
+    for idx in range(NUM_RUNS):
+        import_time, use_time = _run(code)
+        logger.info(
+            "Run %d: import %.3fs, first use %.3fs"
+            % (idx + 1, import_time, use_time)
+        )
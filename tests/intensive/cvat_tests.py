@@ -1253,6 +1253,40 @@ class CVATTests(unittest.TestCase):
 
         dataset.load_annotations(anno_key, cleanup=True)
 
+    def test_num_workers(self):
+        dataset = (
+            foz.load_zoo_dataset("quickstart", max_samples=10)
+            .select_fields("ground_truth")
+            .clone()
+        )
+
+        anno_key = "num_workers"
+        results = dataset.annotate(
+            anno_key,
+            label_field="ground_truth",
+            backend="cvat",
+            task_size=2,
+            num_workers=4,
+        )
+
+        self.assertEqual(len(results.task_ids), 5)
+        self.assertListEqual(
+            [
+                results.frame_id_map[t][0]["sample_id"]
+                for t in results.task_ids
+            ],
+            dataset.values("id")[::2],
+        )
+
+        dataset.load_annotations(
+            anno_key, dest_field="new_ground_truth", cleanup=True
+        )
+
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.label"),
+            dataset.values("new_ground_truth.detections.label"),
+        )
+
     def test_project_exists(self):
         dataset = (
             foz.load_zoo_dataset("quickstart", max_samples=1)
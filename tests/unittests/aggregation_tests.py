@@ -7,11 +7,14 @@ FiftyOne aggregation-related unit tests.
 """
 from datetime import date, datetime, timedelta
 import math
+import os
 
 from bson import ObjectId
 import numpy as np
 import unittest
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.core.fields as fof
 from fiftyone import ViewField as F
@@ -591,6 +594,72 @@ class DatasetTests(unittest.TestCase):
             ["found", "found", "found", "found", "found", "found", "missing"],
         )
 
+    @drop_datasets
+    def test_values_as_array(self):
+        d = fo.Dataset()
+        d.add_sample_field("vector", fo.VectorField, codec="raw")
+        d.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpg",
+                    int=1,
+                    float=1.5,
+                    vector=np.arange(4, dtype=np.float32),
+                    array=np.ones((2, 3)),
+                    labels=["a"],
+                ),
+                fo.Sample(
+                    filepath="image2.jpg",
+                    int=2,
+                    float=2.5,
+                    vector=np.arange(4, 8, dtype=np.float32),
+                    array=np.zeros((2, 3)),
+                    labels=["b"],
+                ),
+                fo.Sample(filepath="image3.jpg", labels=["c"]),
+            ]
+        )
+
+        values = d.values("int", as_array=True)
+        self.assertIsInstance(values, np.ma.MaskedArray)
+        self.assertListEqual(values.mask.tolist(), [False, False, True])
+        self.assertListEqual(values[:2].tolist(), [1, 2])
+
+        values = d.values("float", missing_value=-1, as_array=True)
+        self.assertNotIsInstance(values, np.ma.MaskedArray)
+        self.assertEqual(values.dtype, np.float64)
+        self.assertListEqual(values.tolist(), [1.5, 2.5, -1.0])
+
+        values = d.values("vector", as_array=True)
+        self.assertEqual(values.shape, (3, 4))
+        self.assertEqual(values.dtype, np.float32)
+        self.assertTrue(np.array_equal(values[1], np.arange(4, 8)))
+        self.assertListEqual(values.mask.any(axis=1).tolist(), [0, 0, 1])
+
+        values = d.exists("array").values("array", as_array=True)
+        self.assertNotIsInstance(values, np.ma.MaskedArray)
+        self.assertEqual(values.shape, (2, 2, 3))
+        self.assertEqual(values.sum(), 6)
+
+        values = d.limit(0).values("vector", as_array=True)
+        self.assertEqual(values.shape, (0,))
+
+        with etau.TempDir() as tmp_dir:
+            mmap_path = os.path.join(tmp_dir, "vectors.npy")
+            d.exists("vector").values(
+                "vector", as_array=True, mmap_path=mmap_path
+            )
+
+            values = np.load(mmap_path, mmap_mode="r")
+            self.assertEqual(values.shape, (2, 4))
+            self.assertTrue(np.array_equal(values[0], np.arange(4)))
+
+        with self.assertRaises(ValueError):
+            d.values("filepath", as_array=True)
+
+        with self.assertRaises(ValueError):
+            d.values("labels", as_array=True)
+
     @drop_datasets
     def test_values_unwind(self):
         sample1 = fo.Sample(filepath="video1.mp4")
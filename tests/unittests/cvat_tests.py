@@ -0,0 +1,317 @@
+"""
+FiftyOne CVAT unit tests.
+
+These tests run against a minimal in-memory CVAT server, so they do not
+require a CVAT instance.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import unittest
+
+import numpy as np
+
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.utils.image as foui
+
+from decorators import drop_datasets
+
+
+class _MockCVATServer(object):
+    """A minimal in-memory CVAT v2.3 server.
+
+    Args:
+        upload_delays (None): an optional dict mapping task name suffixes to
+            the number of seconds to delay the media uploads of those tasks
+        download_labels (None): an optional dict mapping task name suffixes
+            to the class that all tags of those tasks are changed to when
+            their annotations are downloaded
+    """
+
+    def __init__(self, upload_delays=None, download_labels=None):
+        self.upload_delays = upload_delays or {}
+        self.download_labels = download_labels or {}
+
+        self.tasks = {}
+        self.failures = []
+
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._failed = set()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+            def do_PUT(self):
+                server._handle(self, "PUT")
+
+            def do_PATCH(self):
+                server._handle(self, "PATCH")
+
+            def do_DELETE(self):
+                server._handle(self, "DELETE")
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self._httpd.server_port
+
+    def get_task_name(self, task_id):
+        return self.tasks[task_id]["name"]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handle(self, handler, method):
+        path = handler.path.split("?", 1)[0]
+        length = int(handler.headers.get("Content-Length", 0))
+        body = handler.rfile.read(length) if length else b""
+
+        # The first request for each task's metadata and annotations fails
+        # with a transient error
+        key = (method, path)
+        if method == "GET" and re.search(r"/(meta|annotations)$", path):
+            with self._lock:
+                if key not in self._failed:
+                    self._failed.add(key)
+                    self.failures.append(key)
+                    self._respond(handler, 503, {})
+                    return
+
+        status, response = self._route(method, path, body)
+        self._respond(handler, status, response)
+
+    def _respond(self, handler, status, response):
+        content = json.dumps(response).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _route(self, method, path, body):
+        if path == "/api/auth/login":
+            return 200, {"key": "key"}
+
+        if path == "/api/server/about":
+            return 200, {"version": "2.3.0"}
+
+        if path == "/api/tasks" and method == "POST":
+            return 201, self._create_task(json.loads(body))
+
+        m = re.match(r"^/api/tasks/(\d+)(/.*)?$", path)
+        if m is None:
+            return 404, {}
+
+        task = self.tasks.get(int(m.group(1)), None)
+        if task is None:
+            return 404, {}
+
+        route = m.group(2) or ""
+
+        if route == "" and method == "GET":
+            return 200, {"id": task["id"], "labels": task["labels"]}
+
+        if route == "" and method == "DELETE":
+            del self.tasks[task["id"]]
+            return 204, {}
+
+        if route == "/status":
+            return 200, {"state": "Finished"}
+
+        if route == "/data" and method == "POST":
+            time.sleep(self.upload_delays.get(self._get_suffix(task), 0))
+            task["size"] = body.count(b'name="client_files[')
+            return 202, {}
+
+        if route == "/jobs":
+            return 200, [{"id": task["id"]}]
+
+        if route == "/data/meta":
+            return 200, self._get_meta(task)
+
+        if route == "/annotations" and method == "PUT":
+            return 200, self._put_annotations(task, json.loads(body))
+
+        if route == "/annotations" and method == "GET":
+            return 200, self._get_annotations(task)
+
+        return 404, {}
+
+    def _get_suffix(self, task):
+        return int(task["name"].rsplit("_", 1)[1])
+
+    def _create_task(self, task_json):
+        with self._lock:
+            task_id = next(self._ids)
+            labels = []
+            for label in task_json["labels"]:
+                attrs = [
+                    dict(attr, id=next(self._ids))
+                    for attr in label["attributes"]
+                ]
+                labels.append(
+                    {
+                        "id": next(self._ids),
+                        "name": label["name"],
+                        "attributes": attrs,
+                    }
+                )
+
+            task = {
+                "id": task_id,
+                "name": task_json["name"],
+                "labels": labels,
+                "size": 0,
+                "annotations": {"shapes": [], "tags": [], "tracks": []},
+            }
+            self.tasks[task_id] = task
+
+        return {"id": task_id, "labels": labels}
+
+    def _get_meta(self, task):
+        size = task["size"]
+        return {
+            "size": size,
+            "start_frame": 0,
+            "stop_frame": size - 1,
+            "frame_filter": "",
+            "frames": [
+                {"width": 2, "height": 2, "name": "%06d.png" % i}
+                for i in range(size)
+            ],
+        }
+
+    def _put_annotations(self, task, anno_json):
+        with self._lock:
+            for anno_type in ("shapes", "tags", "tracks"):
+                for anno in anno_json[anno_type]:
+                    anno["id"] = next(self._ids)
+
+        task["annotations"] = anno_json
+        return anno_json
+
+    def _get_annotations(self, task):
+        annotations = task["annotations"]
+
+        name = self.download_labels.get(self._get_suffix(task), None)
+        if name is not None:
+            labels = {l["id"]: l for l in task["labels"]}
+            label = next(l for l in labels.values() if l["name"] == name)
+            attr_ids = {a["name"]: a["id"] for a in label["attributes"]}
+            for tag in annotations["tags"]:
+                # Attributes are remapped to those of the new class
+                attr_names = {
+                    a["id"]: a["name"]
+                    for a in labels[tag["label_id"]]["attributes"]
+                }
+                tag["label_id"] = label["id"]
+                for attr in tag["attributes"]:
+                    attr["spec_id"] = attr_ids[attr_names[attr["spec_id"]]]
+
+        return annotations
+
+
+class CVATTests(unittest.TestCase):
+    @drop_datasets
+    def test_num_workers(self):
+        with etau.TempDir() as tmp_dir:
+            samples = []
+            for i in range(6):
+                filepath = os.path.join(tmp_dir, "image%d.png" % i)
+                foui.write(np.zeros((2, 2, 3), dtype=np.uint8), filepath)
+                samples.append(
+                    fo.Sample(
+                        filepath=filepath,
+                        ground_truth=fo.Classification(label="other"),
+                    )
+                )
+
+            dataset = fo.Dataset()
+            dataset.add_samples(samples)
+            sample_ids = dataset.values("id")
+
+            # Earlier tasks finish uploading last, and each task's labels are
+            # changed to a different class when they are downloaded
+            mock_server = _MockCVATServer(
+                upload_delays={1: 0.6, 2: 0.3},
+                download_labels={1: "a", 2: "b", 3: "c"},
+            )
+
+            with mock_server:
+                results = dataset.annotate(
+                    "test",
+                    backend="cvat",
+                    label_field="ground_truth",
+                    classes=["a", "b", "c", "other"],
+                    url=mock_server.url,
+                    username="user",
+                    password="password",
+                    task_size=2,
+                    num_workers=3,
+                )
+
+                # Tasks are recorded in the order of their batches, even
+                # though they finished uploading in reverse order
+                self.assertListEqual(
+                    [
+                        mock_server.get_task_name(task_id)
+                        for task_id in results.task_ids
+                    ],
+                    ["FiftyOne_%s_%d" % (dataset.name, i) for i in (1, 2, 3)],
+                )
+                self.assertListEqual(
+                    [
+                        [
+                            d["sample_id"]
+                            for d in results.frame_id_map[t].values()
+                        ]
+                        for t in results.task_ids
+                    ],
+                    [sample_ids[0:2], sample_ids[2:4], sample_ids[4:6]],
+                )
+
+                dataset.load_annotations("test", cleanup=True)
+
+            self.assertListEqual(
+                dataset.values("ground_truth.label"),
+                ["a", "a", "b", "b", "c", "c"],
+            )
+
+            # The first metadata and annotations requests for each task
+            # failed with transient errors and were retried
+            self.assertEqual(len(mock_server.failures), 6)
+            self.assertEqual(len(mock_server.tasks), 0)
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
@@ -11,9 +11,11 @@ import gc
 import os
 import random
 import string
+import time
 import unittest
+from unittest.mock import patch
 
-from bson import ObjectId
+from bson import json_util, ObjectId
 from mongoengine import ValidationError
 import numpy as np
 import pytz
@@ -21,9 +23,11 @@ import pytz
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.odm as foo
 import fiftyone.utils.data as foud
+import fiftyone.utils.image as foui
 from fiftyone import ViewField as F
 
 from decorators import drop_datasets, skip_windows
@@ -160,6 +164,139 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTrue(last_loaded_at3 > last_loaded_at2)
 
+    @drop_datasets
+    def test_revision(self):
+        dataset = fo.Dataset()
+        get_revision = lambda: foo.get_dataset_revision(dataset.name)
+
+        revision = get_revision()
+
+        def assert_modified():
+            nonlocal revision
+            new_revision = get_revision()
+            self.assertGreater(new_revision, revision)
+            revision = new_revision
+
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i) for i in range(3)]
+        )
+        assert_modified()
+
+        fo.load_dataset(dataset.name)
+        dataset.reload()
+        self.assertEqual(get_revision(), revision)
+
+        sample = dataset.first()
+        sample["field"] = 1
+        sample.save()
+        assert_modified()
+
+        # Saves that write nothing do not increment the revision
+        sample.save()
+        self.assertEqual(get_revision(), revision)
+
+        dataset.set_values("field", [1, 2, 3])
+        assert_modified()
+
+        dataset.set_field("field", F("field") + 1).save()
+        assert_modified()
+
+        dataset.set_field("field", F("field") - 1).save(fields="field")
+        assert_modified()
+
+        dataset.take(1).tag_samples("test")
+        assert_modified()
+
+        with dataset.save_context() as context:
+            for sample in dataset:
+                sample["field"] = 4
+                context.save(sample)
+
+        assert_modified()
+
+        # Saves within save contexts increment the revision once per batch
+        with dataset.save_context(batch_size=100):
+            for sample in dataset:
+                sample["field"] = 5
+                sample.save()
+
+            self.assertEqual(get_revision(), revision)
+
+        self.assertEqual(get_revision(), revision + 1)
+        revision += 1
+
+        for sample in dataset.iter_samples(autosave=True, batch_size=100):
+            sample["field"] = 6
+
+        self.assertEqual(get_revision(), revision + 1)
+        revision += 1
+
+        dataset.clear_sample_field("field")
+        assert_modified()
+
+        dataset.rename_sample_field("field", "new_field")
+        assert_modified()
+
+        dataset.info["key"] = "value"
+        dataset.save()
+        assert_modified()
+
+        dataset.delete_samples(dataset.first())
+        assert_modified()
+
+        # Importing into an empty dataset must not restore an older revision
+        with etau.TempDir() as tmp_dir:
+            dataset.export(
+                export_dir=tmp_dir,
+                dataset_type=fo.types.FiftyOneDataset,
+                export_media=False,
+            )
+
+            dataset.clear()
+            assert_modified()
+
+            num_samples = []
+            increment_dataset_revision = foo.increment_dataset_revision
+
+            def _increment_dataset_revision(name):
+                num_samples.append(len(dataset))
+                increment_dataset_revision(name)
+
+            # The revision is incremented after the samples are imported
+            with patch.object(
+                foo, "increment_dataset_revision", _increment_dataset_revision
+            ):
+                dataset.add_dir(tmp_dir, fo.types.FiftyOneDataset)
+
+            assert_modified()
+            self.assertNotIn(0, num_samples)
+
+        self.assertIsNone(foo.get_dataset_revision("does-not-exist"))
+
+    @drop_datasets
+    def test_revision_debounce(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i) for i in range(10)]
+        )
+        dataset.add_sample_field("field", fo.IntField)
+        get_revision = lambda: foo.get_dataset_revision(dataset.name)
+
+        revision = get_revision()
+
+        # The first save increments the revision immediately and the rest are
+        # coalesced into one increment at the end of the debounce interval
+        with patch.object(fod, "_REVISION_DEBOUNCE_SECS", 1):
+            for idx, sample in enumerate(dataset):
+                sample["field"] = idx
+                sample.save()
+
+            self.assertEqual(get_revision(), revision + 1)
+
+            time.sleep(1.5)
+            self.assertEqual(get_revision(), revision + 2)
+            self.assertListEqual(dataset.values("field"), list(range(10)))
+
     @drop_datasets
     def test_dataset_tags(self):
         dataset_name = self.test_dataset_tags.__name__
@@ -529,6 +666,13 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
 
+        with dataset.save_context(batch_size=7, async_writes=True) as context:
+            for idx, sample in enumerate(dataset):
+                sample["int"] = idx + 5
+                context.save(sample)
+
+        self.assertTupleEqual(dataset.bounds("int"), (5, 54))
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
@@ -2898,6 +3042,75 @@ class DatasetExtrasTests(unittest.TestCase):
         self.assertEqual(len(list(db.runs.find({"_id": run_id}))), 0)
         self.assertEqual(len(list(db.fs.files.find({"_id": result_id}))), 0)
 
+    def test_run_results_format(self):
+        dataset = self.dataset
+
+        results = dataset.evaluate_classifications(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval",
+        )
+
+        # Results with numeric arrays are stored in binary format
+        run_doc = dataset._doc.evaluations["eval"]
+        self.assertEqual(
+            run_doc.results.content_type, "application/x-fiftyone-results"
+        )
+
+        results2 = dataset.load_evaluation_results("eval", cache=False)
+
+        self.assertListEqual(results.ytrue.tolist(), results2.ytrue.tolist())
+        self.assertListEqual(results.ypred.tolist(), results2.ypred.tolist())
+        self.assertEqual(results.confs.dtype, results2.confs.dtype)
+        self.assertTrue(np.array_equal(results.confs, results2.confs))
+        self.assertDictEqual(results.serialize(), results2.serialize())
+
+        # Clones preserve the binary format
+        dataset2 = dataset.clone()
+        results3 = dataset2.load_evaluation_results("eval")
+        self.assertDictEqual(results.serialize(), results3.serialize())
+
+        # Legacy JSON results can still be loaded
+        run_doc = dataset._doc.evaluations["eval"]
+        run_doc.results.delete()
+        run_doc.results.put(
+            json_util.dumps(results.serialize()).encode(),
+            content_type="application/json",
+        )
+        run_doc.save()
+
+        results4 = dataset.load_evaluation_results("eval", cache=False)
+        self.assertDictEqual(results.serialize(), results4.serialize())
+
+    def test_compute_metadata(self):
+        with etau.TempDir() as tmp_dir:
+            filepaths = []
+            for idx in range(4):
+                filepath = os.path.join(tmp_dir, "image%d.png" % idx)
+                foui.write(np.zeros((2 + idx, 3, 3), dtype=np.uint8), filepath)
+                filepaths.append(filepath)
+
+            filepaths.append(os.path.join(tmp_dir, "missing.png"))
+
+            for num_workers in (1, 2):
+                dataset = fo.Dataset()
+                dataset.add_samples([fo.Sample(filepath=f) for f in filepaths])
+                sample = dataset.first()
+                revision = foo.get_dataset_revision(dataset.name)
+
+                dataset.compute_metadata(num_workers=num_workers)
+
+                self.assertGreater(
+                    foo.get_dataset_revision(dataset.name), revision
+                )
+                self.assertListEqual(
+                    dataset.values("metadata.height"), [2, 3, 4, 5, None]
+                )
+                self.assertListEqual(
+                    dataset.values("metadata.width"), [3, 3, 3, 3, None]
+                )
+                self.assertEqual(sample.metadata.height, 2)
+
 
 class DatasetSerializationTests(unittest.TestCase):
     @drop_datasets
@@ -5,6 +5,7 @@ FiftyOne delegated operator related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import threading
 import time
 import unittest
 from unittest.mock import patch
@@ -650,3 +651,118 @@ class DelegatedOperationServiceTests(unittest.TestCase):
             filters={"operator": f"@voxelfiftyone/operator/test_0"},
         )
         self.assertEqual(docs, 25)
+
+    def test_claim_operation(self, mock_get_operator, mock_operator_exists):
+        delegation_target = f"test_target_{ObjectId()}"
+        for _ in range(2):
+            doc = self.svc.queue_operation(
+                operator="@voxelfiftyone/operator/foo",
+                delegation_target=delegation_target,
+                context=ExecutionContext(request_params={"foo": "bar"}),
+            )
+            self.docs_to_delete.append(doc)
+            time.sleep(0.01)  # ensure that the queued_at times are different
+
+        # Operations are claimed in the order they were queued
+        doc = self.svc.claim_operation(delegation_target=delegation_target)
+        self.assertEqual(doc.id, self.docs_to_delete[0].id)
+        self.assertEqual(doc.run_state, ExecutionRunState.RUNNING)
+        self.assertIsNotNone(doc.started_at)
+        self.assertIsNotNone(doc.heartbeat_at)
+        self.assertIsNotNone(doc.worker_id)
+
+        doc = self.svc.claim_operation(delegation_target=delegation_target)
+        self.assertEqual(doc.id, self.docs_to_delete[1].id)
+
+        doc = self.svc.claim_operation(delegation_target=delegation_target)
+        self.assertIsNone(doc)
+
+    def test_claim_operation_concurrent(
+        self, mock_get_operator, mock_operator_exists
+    ):
+        delegation_target = f"test_target_{ObjectId()}"
+        for _ in range(20):
+            doc = self.svc.queue_operation(
+                operator="@voxelfiftyone/operator/foo",
+                delegation_target=delegation_target,
+                context=ExecutionContext(request_params={"foo": "bar"}),
+            )
+            self.docs_to_delete.append(doc)
+
+        def _claim_all(claimed):
+            svc = DelegatedOperationService()
+            while True:
+                doc = svc.claim_operation(delegation_target=delegation_target)
+                if doc is None:
+                    break
+
+                claimed.append(doc.id)
+
+        claimed = [[] for _ in range(4)]
+        threads = [
+            threading.Thread(target=_claim_all, args=(c,)) for c in claimed
+        ]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # Each operation was claimed exactly once
+        all_claimed = [_id for c in claimed for _id in c]
+        self.assertEqual(len(all_claimed), 20)
+        self.assertSetEqual(
+            set(all_claimed), set(doc.id for doc in self.docs_to_delete)
+        )
+
+    def test_requeue_stale_operations(
+        self, mock_get_operator, mock_operator_exists
+    ):
+        delegation_target = f"test_target_{ObjectId()}"
+        doc = self.svc.queue_operation(
+            operator="@voxelfiftyone/operator/foo",
+            delegation_target=delegation_target,
+            context=ExecutionContext(request_params={"foo": "bar"}),
+        )
+        self.docs_to_delete.append(doc)
+
+        doc = self.svc.claim_operation(delegation_target=delegation_target)
+        self.assertEqual(doc.run_state, ExecutionRunState.RUNNING)
+
+        self.svc.requeue_stale_operations(60)
+        doc = self.svc.get(doc_id=doc.id)
+        self.assertEqual(doc.run_state, ExecutionRunState.RUNNING)
+
+        time.sleep(0.1)
+        self.svc.requeue_stale_operations(0.05)
+        doc = self.svc.get(doc_id=doc.id)
+        self.assertEqual(doc.run_state, ExecutionRunState.QUEUED)
+        self.assertIsNone(doc.started_at)
+
+        doc = self.svc.claim_operation(delegation_target=delegation_target)
+        self.assertIsNotNone(doc)
+
+    def test_full_run_parallel(self, mock_get_operator, mock_operator_exists):
+        delegation_target = f"test_target_{ObjectId()}"
+        for _ in range(4):
+            doc = self.svc.queue_operation(
+                operator="@voxelfiftyone/operator/foo",
+                delegation_target=delegation_target,
+                context=ExecutionContext(request_params={"foo": "bar"}),
+            )
+            self.docs_to_delete.append(doc)
+
+        self.svc.execute_queued_operations(
+            delegation_target=delegation_target, num_workers=2
+        )
+
+        for doc in self.docs_to_delete:
+            doc = self.svc.get(doc_id=doc.id)
+            self.assertEqual(doc.run_state, ExecutionRunState.COMPLETED)
+            self.assertEqual(doc.result.result, {"executed": True})
+
+        stats = self.svc.get_stats()
+        self.assertEqual(stats["completed"], 4)
+        self.assertEqual(stats["failed"], 0)
+        self.assertIsNotNone(stats["throughput"])
+        self.assertIsNotNone(stats["avg_queue_latency"])
@@ -16,6 +16,7 @@ import numpy as np
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.utils.eval.detection as foued
 import fiftyone.utils.labels as foul
 import fiftyone.utils.iou as foui
 
@@ -1594,6 +1595,101 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_open_images(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_batch_size(self):
+        dataset = self._make_detections_dataset()
+
+        for batch_size in (2, 0.1):
+            dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval",
+                batch_size=batch_size,
+            )
+
+            self.assertListEqual(
+                dataset.values("ground_truth.detections.eval"),
+                [None, ["fn"], None, ["tp"], ["fn"]],
+            )
+            self.assertListEqual(
+                dataset.values("predictions.detections.eval"),
+                [None, None, ["fp"], ["tp"], ["fp"]],
+            )
+            self.assertListEqual(dataset.values("eval_tp"), [0, 0, 0, 1, 0])
+            self.assertListEqual(dataset.values("eval_fp"), [0, 0, 1, 0, 1])
+            self.assertListEqual(dataset.values("eval_fn"), [0, 1, 0, 0, 1])
+
+            dataset.delete_evaluation("eval")
+
+    @drop_datasets
+    def test_evaluate_detections_num_workers(self):
+        dataset = self._make_detections_dataset()
+        view = dataset.skip(1)
+
+        results1 = view.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval1"
+        )
+        results2 = view.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            num_workers=2,
+        )
+
+        self.assertListEqual(results1.ytrue.tolist(), results2.ytrue.tolist())
+        self.assertListEqual(results1.ypred.tolist(), results2.ypred.tolist())
+        self.assertEqual(results1.metrics(), results2.metrics())
+
+        self.assertListEqual(dataset.values("eval2_tp"), [None, 0, 0, 1, 0])
+        self.assertListEqual(dataset.values("eval2_fp"), [None, 0, 1, 0, 1])
+        self.assertListEqual(dataset.values("eval2_fn"), [None, 1, 0, 0, 1])
+        self.assertListEqual(
+            dataset.values("predictions.detections.eval2"),
+            dataset.values("predictions.detections.eval1"),
+        )
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.eval2_id"),
+            dataset.values("ground_truth.detections.eval1_id"),
+        )
+
+        # In-memory samples are refreshed
+        sample = dataset.last()
+        self.assertEqual(sample["eval2_fn"], 1)
+
+    @drop_datasets
+    def test_evaluate_detections_shards(self):
+        dataset = self._make_detections_dataset()
+        ids = sorted(dataset.values("_id"))
+        first_id, last_id = ids[1], ids[3]
+        id_range = {"$match": {"_id": {"$gte": first_id, "$lte": last_id}}}
+
+        def _ids_in_range(view):
+            return [i for i in view.values("_id") if first_id <= i <= last_id]
+
+        # The ID range is applied first when the view's stages allow it
+        view = dataset.exists("predictions").sort_by("filepath", reverse=True)
+        shard_view = foued._make_shard_view(view, first_id, last_id)
+
+        match = shard_view._pipeline()[0]["$match"]
+        self.assertIn(id_range["$match"], match.get("$and", [match]))
+        self.assertListEqual(shard_view.values("_id"), _ids_in_range(view))
+
+        # Otherwise, it is applied after the view's stages
+        view = dataset.sort_by("filepath", reverse=True).skip(1)
+        shard_view = foued._make_shard_view(view, first_id, last_id)
+
+        self.assertDictEqual(shard_view._pipeline()[-1], id_range)
+        self.assertListEqual(shard_view.values("_id"), _ids_in_range(view))
+
+        view = dataset.exists("predictions").sort_by("filepath", reverse=True)
+        results1 = view.evaluate_detections(
+            "predictions", gt_field="ground_truth"
+        )
+        results2 = view.evaluate_detections(
+            "predictions", gt_field="ground_truth", num_workers=2
+        )
+        self.assertEqual(results1.metrics(), results2.metrics())
+
     @drop_datasets
     def test_load_evaluation_view_select_fields(self):
         dataset = self._make_detections_dataset()
@@ -1641,6 +1737,66 @@ class DetectionsTests(unittest.TestCase):
             detection["eval2"]
 
 
+class BoxIoUTests(unittest.TestCase):
+    def _make_detections(self):
+        return [
+            fo.Detection(label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4]),
+            fo.Detection(label="dog", bounding_box=[0.3, 0.3, 0.4, 0.4]),
+            fo.Detection(
+                label="cat", bounding_box=[0.2, 0.2, 0.2, 0.2], iscrowd=True
+            ),
+            fo.Detection(label="cat", bounding_box=[0.6, 0.6, 0.1, 0.1]),
+        ]
+
+    def _compute_ious(self, preds, gts, iscrowd=None, classwise=False):
+        # Reference implementation that computes each IoU individually
+        ious = np.zeros((len(preds), len(gts)))
+        for j, gt in enumerate(gts):
+            gt_crowd = iscrowd(gt) if iscrowd is not None else False
+            for i, pred in enumerate(preds):
+                if classwise and pred.label != gt.label:
+                    continue
+
+                ious[i, j] = foui._compute_bbox_iou(
+                    gt, pred, gt_crowd=gt_crowd
+                )
+
+        return ious
+
+    def test_compute_ious(self):
+        dets = self._make_detections()
+        preds = dets[:2]
+        gts = dets[2:]
+
+        ious = foui.compute_ious(preds, gts)
+        self.assertEqual(ious.shape, (2, 2))
+        self.assertTrue(np.array_equal(ious, self._compute_ious(preds, gts)))
+
+        iscrowd = lambda l: bool(l.get_attribute_value("iscrowd", False))
+        ious = foui.compute_ious(preds, gts, iscrowd="iscrowd")
+        expected = self._compute_ious(preds, gts, iscrowd=iscrowd)
+        self.assertTrue(np.array_equal(ious, expected))
+        self.assertAlmostEqual(ious[0, 0], 0.25)
+
+        ious = foui.compute_ious(preds, gts, classwise=True)
+        expected = self._compute_ious(preds, gts, classwise=True)
+        self.assertTrue(np.array_equal(ious, expected))
+        self.assertEqual(ious[1, 0], 0)
+
+        ious = foui.compute_ious(preds, [])
+        self.assertEqual(ious.shape, (2, 0))
+
+    def test_compute_ious_symmetric(self):
+        dets = self._make_detections()
+
+        ious = foui.compute_ious(dets, dets, classwise=True)
+        expected = self._compute_ious(dets, dets, classwise=True)
+        np.fill_diagonal(expected, 1)
+
+        self.assertTrue(np.array_equal(ious, expected))
+        self.assertTrue(np.array_equal(ious, ious.T))
+
+
 class CuboidTests(unittest.TestCase):
     def _make_dataset(self):
         group = fo.Group()
@@ -2441,6 +2597,67 @@ class SegmentationTests(unittest.TestCase):
         self.assertNotIn("eval2_precision", dataset.get_field_schema())
         self.assertNotIn("eval2_recall", dataset.get_field_schema())
 
+    @drop_datasets
+    def test_evaluate_segmentations_num_workers(self):
+        dataset = self._make_segmentation_dataset()
+        sample = fo.Sample(
+            filepath="image6.jpg",
+            ground_truth=fo.Segmentation(mask=np.array([[0, 3], [1, 2]])),
+            predictions=fo.Segmentation(mask=np.array([[0, 3], [3, 2]])),
+        )
+        dataset.add_sample(sample)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # suppress missing masks warning
+
+            results1 = dataset.evaluate_segmentations(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval1",
+                num_workers=1,
+            )
+
+            results2 = dataset.evaluate_segmentations(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval2",
+                num_workers=4,
+            )
+
+            results3 = dataset.evaluate_segmentations(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval3",
+                mask_targets={0: "0", 1: "1", 2: "2", 3: "3"},
+                compute_dice=True,
+                num_workers=4,
+            )
+
+        # Mask values discovered in the evaluation pass
+        self.assertListEqual(list(results1.classes), ["0", "1", "2", "3"])
+        self.assertListEqual(list(results2.classes), ["0", "1", "2", "3"])
+
+        expected = np.array(
+            [[3, 1, 1, 0], [1, 1, 0, 1], [1, 0, 2, 0], [0, 0, 0, 1]],
+            dtype=int,
+        )
+        for results in (results1, results2, results3):
+            actual = results.pixel_confusion_matrix
+            self.assertTrue((actual == expected).all())
+
+        acc1 = dataset.values("eval1_accuracy")
+        self.assertListEqual(acc1, [None, None, None, 1.0, 0.0, 2.0 / 3.0])
+        self.assertListEqual(dataset.values("eval2_accuracy"), acc1)
+        self.assertListEqual(dataset.values("eval3_accuracy"), acc1)
+        self.assertListEqual(
+            dataset.values("eval1_precision"),
+            dataset.values("eval2_precision"),
+        )
+        self.assertListEqual(
+            dataset.values("eval1_precision"),
+            dataset.values("eval3_precision"),
+        )
+
     @drop_datasets
     def test_evaluate_segmentations_on_disk_simple(self):
         dataset = self._make_segmentation_dataset()
@@ -8,7 +8,9 @@ FiftyOne import/export-related unit tests.
 import os
 import random
 import string
+import threading
 import unittest
+from unittest.mock import patch
 
 import cv2
 import numpy as np
@@ -18,7 +20,9 @@ import eta.core.utils as etau
 import eta.core.video as etav
 
 import fiftyone as fo
+import fiftyone.core.odm as foo
 import fiftyone.utils.coco as fouc
+import fiftyone.utils.data as foud
 import fiftyone.utils.image as foui
 import fiftyone.utils.labels as foul
 import fiftyone.utils.yolo as fouy
@@ -442,6 +446,63 @@ class UnlabeledImageDatasetTests(ImageDatasetTests):
         # _images/<filename>
         self.assertEqual(len(relpath.split(os.path.sep)), 2)
 
+    @drop_datasets
+    def test_export_num_workers(self):
+        dataset = self._make_dataset()
+
+        # Copy media
+
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.ImageDirectory,
+            num_workers=4,
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.ImageDirectory,
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+
+        # FiftyOneDataset
+
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            num_workers=4,
+        )
+
+        dataset2 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+        )
+
+        self.assertEqual(len(dataset), len(dataset2))
+        for filepath in dataset2.values("filepath"):
+            self.assertTrue(os.path.isfile(filepath))
+
+        # Failed transfers are reported on close
+
+        export_dir = self._new_dir()
+
+        media_exporter = foud.MediaExporter(
+            True, export_path=export_dir, num_workers=4
+        )
+        media_exporter.setup()
+
+        media_exporter.export(self._new_image())
+        media_exporter.export(os.path.join(self.images_dir, "missing.jpg"))
+
+        with self.assertRaises(ValueError):
+            media_exporter.close()
+
+        self.assertEqual(len(os.listdir(export_dir)), 1)
+
 
 class ImageClassificationDatasetTests(ImageDatasetTests):
     def _make_dataset(self):
@@ -861,6 +922,52 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
 
         return dataset
 
+    @drop_datasets
+    def test_export_num_workers(self):
+        dataset = self._make_dataset()
+
+        dataset_types = [
+            fo.types.COCODetectionDataset,
+            fo.types.VOCDetectionDataset,
+            fo.types.KITTIDetectionDataset,
+            fo.types.YOLOv5Dataset,
+            fo.types.CVATImageDataset,
+            fo.types.BDDDataset,
+            fo.types.CSVDataset,
+        ]
+
+        copy_file = etau.copy_file
+        threads = set()
+
+        def _copy_file(*args, **kwargs):
+            threads.add(threading.current_thread())
+            copy_file(*args, **kwargs)
+
+        for dataset_type in dataset_types:
+            export_dir = self._new_dir()
+            threads.clear()
+
+            # Media are transferred by worker threads
+            with patch.object(etau, "copy_file", _copy_file):
+                with patch.object(foud.exporters.logger, "warning") as warn:
+                    dataset.export(
+                        export_dir=export_dir,
+                        dataset_type=dataset_type,
+                        label_field="predictions",
+                        num_workers=4,
+                    )
+
+            warn.assert_not_called()
+            self.assertTrue(threads)
+            self.assertNotIn(threading.main_thread(), threads)
+
+            filenames = [
+                f
+                for f in etau.list_files(export_dir, recursive=True)
+                if f.endswith(".jpg")
+            ]
+            self.assertEqual(len(filenames), len(dataset))
+
     @drop_datasets
     def test_fiftyone_image_detection_dataset(self):
         dataset = self._make_dataset()
@@ -2818,6 +2925,86 @@ class MultitaskImageDatasetTests(ImageDatasetTests):
         # data/_images/<filename>
         self.assertEqual(len(relpath.split(os.path.sep)), 3)
 
+    @drop_datasets
+    def test_fiftyone_dataset_shards(self):
+        dataset = self._make_dataset()
+
+        for shard_format, compression in (
+            ("bson", None),
+            ("ndjson", None),
+            ("bson", "gzip"),
+        ):
+            export_dir = self._new_dir()
+
+            dataset.export(
+                export_dir=export_dir,
+                dataset_type=fo.types.FiftyOneDataset,
+                shard_size=2,
+                shard_format=shard_format,
+                compression=compression,
+            )
+
+            samples_dir = os.path.join(export_dir, "samples")
+            self.assertTrue(foo.is_sharded_collection(samples_dir))
+            self.assertEqual(len(etau.list_files(samples_dir)), 3)
+
+            dataset2 = fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=fo.types.FiftyOneDataset,
+                num_workers=2,
+            )
+
+            self.assertEqual(len(dataset), len(dataset2))
+            self.assertListEqual(
+                [os.path.basename(f) for f in dataset.values("filepath")],
+                [os.path.basename(f) for f in dataset2.values("filepath")],
+            )
+            self.assertListEqual(
+                dataset.values("weather.label"),
+                dataset2.values("weather.label"),
+            )
+            self.assertEqual(
+                dataset.count("predictions.detections"),
+                dataset2.count("predictions.detections"),
+            )
+            self.assertListEqual(
+                dataset2.distinct("_dataset_id"), [dataset2._doc.id]
+            )
+
+        # Non-parallel import
+
+        dataset3 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            max_samples=2,
+        )
+
+        self.assertEqual(len(dataset3), 2)
+
+        # Resume a partial import
+
+        dataset2.delete_samples(dataset2.skip(1))
+        self.assertEqual(len(dataset2), 1)
+
+        dataset2.add_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            resume=True,
+        )
+
+        self.assertEqual(len(dataset2), len(dataset))
+        self.assertListEqual(
+            dataset.values("weather.label"), dataset2.values("weather.label")
+        )
+
+        with self.assertRaises(ValueError):
+            dataset.export(
+                export_dir=self._new_dir(),
+                dataset_type=fo.types.FiftyOneDataset,
+                shard_size=2,
+                use_dirs=True,
+            )
+
     @skipwindows
     @drop_datasets
     def test_fiftyone_dataset(self):
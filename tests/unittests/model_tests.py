@@ -0,0 +1,218 @@
+"""
+FiftyOne model inference unit tests.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import random
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.models as fom
+import fiftyone.utils.image as foui
+
+from decorators import drop_datasets
+
+
+class _ImageHeightModel(fom.Model):
+    """Model that classifies images by their height."""
+
+    @property
+    def media_type(self):
+        return "image"
+
+    @property
+    def ragged_batches(self):
+        return False
+
+    @property
+    def transforms(self):
+        return None
+
+    @property
+    def preprocess(self):
+        return False
+
+    @preprocess.setter
+    def preprocess(self, value):
+        pass
+
+    def predict(self, arg):
+        return fo.Classification(label=str(arg.shape[0]))
+
+    def predict_all(self, args):
+        return [self.predict(arg) for arg in args]
+
+
+def _make_dataset(tmp_dir, num_samples, missing_idx=None):
+    samples = []
+    for idx in range(num_samples):
+        filepath = os.path.join(tmp_dir, "image%d.png" % idx)
+        if idx != missing_idx:
+            foui.write(np.zeros((1 + idx, 2, 3), dtype=np.uint8), filepath)
+
+        samples.append(fo.Sample(filepath=filepath))
+
+    dataset = fo.Dataset()
+    dataset.add_samples(samples)
+
+    return dataset
+
+
+def _read_with_random_delay(filepath, *args, **kwargs):
+    time.sleep(0.02 * random.random())
+    return foui.read(filepath, *args, **kwargs)
+
+
+class ImageLoaderTests(unittest.TestCase):
+    @drop_datasets
+    def test_image_loader_order(self):
+        with etau.TempDir() as tmp_dir:
+            dataset = _make_dataset(tmp_dir, 11)
+            ids = dataset.values("id")
+            heights = list(range(1, 12))
+
+            # Randomize read latency so that reads finish out of order
+            with patch.object(fom.foui, "read", _read_with_random_delay):
+                for num_workers in (1, 4):
+                    loader = fom._make_image_loader(dataset, None, num_workers)
+
+                    _ids = []
+                    _heights = []
+                    for sample, img in loader:
+                        _ids.append(sample.id)
+                        _heights.append(img.shape[0])
+
+                    self.assertListEqual(_ids, ids)
+                    self.assertListEqual(_heights, heights)
+
+                    loader = fom._make_image_loader(dataset, 3, num_workers)
+
+                    _ids = []
+                    _heights = []
+                    for sample_batch, imgs in loader:
+                        self.assertEqual(len(sample_batch), len(imgs))
+                        _ids.extend(s.id for s in sample_batch)
+                        _heights.extend(img.shape[0] for img in imgs)
+
+                    self.assertListEqual(_ids, ids)
+                    self.assertListEqual(_heights, heights)
+
+    @drop_datasets
+    def test_image_loader_failures(self):
+        with etau.TempDir() as tmp_dir:
+            dataset = _make_dataset(tmp_dir, 5, missing_idx=2)
+
+            results = list(fom._make_image_loader(dataset, None, 2))
+
+            self.assertEqual(len(results), 5)
+            for idx, (_, img) in enumerate(results):
+                if idx == 2:
+                    self.assertIsInstance(img, Exception)
+                else:
+                    self.assertEqual(img.shape[0], 1 + idx)
+
+            results = list(fom._make_image_loader(dataset, 2, 2))
+
+            self.assertEqual(len(results), 3)
+            self.assertIsInstance(results[0][1], list)
+            self.assertIsInstance(results[1][1], Exception)
+            self.assertIsInstance(results[2][1], list)
+
+    @drop_datasets
+    def test_image_loader_drain(self):
+        with etau.TempDir() as tmp_dir:
+            dataset = _make_dataset(tmp_dir, 7)
+            ids = dataset.values("id")
+
+            # Fewer, as many as, and more batches than the prefetch window
+            for batch_size in (4, 3, 2, 1):
+                loader = fom._make_image_loader(
+                    dataset, batch_size, 2, num_prefetch=2
+                )
+
+                _ids = []
+                for sample_batch, imgs in loader:
+                    self.assertEqual(len(sample_batch), len(imgs))
+                    _ids.extend(s.id for s in sample_batch)
+
+                self.assertListEqual(_ids, ids)
+
+            # At most `num_prefetch` batches are loaded ahead of the current
+            # batch
+            filepaths = []
+
+            def _read(filepath, *args, **kwargs):
+                filepaths.append(filepath)
+                return foui.read(filepath, *args, **kwargs)
+
+            with patch.object(fom.foui, "read", _read):
+                loader = fom._make_image_loader(dataset, 1, 2, num_prefetch=2)
+
+                next(loader)
+                time.sleep(0.1)
+                self.assertLessEqual(len(filepaths), 4)
+
+                loader.close()
+
+    @drop_datasets
+    def test_apply_model_skip_failures(self):
+        model = _ImageHeightModel()
+
+        with etau.TempDir() as tmp_dir:
+            dataset = _make_dataset(tmp_dir, 5, missing_idx=2)
+
+            dataset.apply_model(
+                model, "predictions", num_workers=2, skip_failures=True
+            )
+
+            self.assertListEqual(
+                dataset.values("predictions.label"),
+                ["1", "2", None, "4", "5"],
+            )
+
+            dataset.apply_model(
+                model,
+                "predictions_batch",
+                batch_size=2,
+                num_workers=2,
+                skip_failures=True,
+            )
+
+            self.assertListEqual(
+                dataset.values("predictions_batch.label"),
+                ["1", "2", None, None, "5"],
+            )
+
+            with self.assertRaises(Exception):
+                dataset.apply_model(
+                    model, "predictions2", num_workers=2, skip_failures=False
+                )
+
+            with self.assertRaises(Exception):
+                dataset.apply_model(
+                    model,
+                    "predictions2",
+                    batch_size=2,
+                    num_workers=2,
+                    skip_failures=False,
+                )
+
+            # Samples before the failure were still processed
+            self.assertListEqual(
+                dataset.values("predictions2.label"),
+                ["1", "2", None, None, None],
+            )
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
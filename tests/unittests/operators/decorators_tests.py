@@ -6,57 +6,134 @@ Unit tests for operators/decorators.
 |
 """
 import os
+import tempfile
+import time
 import unittest
 from unittest import mock
 from unittest.mock import patch
 
-from fiftyone.operators.decorators import dir_state
-
-
-class DirStateTests(unittest.TestCase):
-    @patch("glob.glob")
-    @patch("os.path.isdir")
-    def test_dir_state_non_existing_dir(self, mock_isdir, mock_glob):
-        mock_isdir.return_value = False
-        dirpath = "/non/existing/dir"
-        try:
-            result = dir_state(dirpath)
-        except Exception as e:
-            self.fail(e)
-
-        self.assertIsNone(result)
-        assert not mock_glob.called
-
-    @patch("glob.glob")
-    @patch("os.path.isdir")
-    def test_dir_state_existing_empty_dir(self, mock_isdir, mock_glob):
-        mock_isdir.return_value = True
-        mock_glob.return_value = []
-        dirpath = "/existing/empty/dir"
-
-        try:
-            result = dir_state(dirpath)
-        except Exception as e:
-            self.fail(e)
-        self.assertIsNone(result)
-        mock_isdir.assert_called_once_with(dirpath)
-        mock_glob.assert_called_once_with(os.path.join(dirpath, "*"))
-
-    @patch("os.path.isdir")
-    @patch("glob.glob")
-    @patch("os.path.getmtime")
-    def test_dir_state_with_existing_nonempty_dir(
-        self, mock_getmtime, mock_glob, mock_isdir
-    ):
-        mock_isdir.return_value = True
-        mock_glob.return_value = ["file1.txt", "file2.txt"]
-        mock_getmtime.side_effect = [1000, 2000]
-
-        result = dir_state("/my/dir/path")
-
-        self.assertEqual(result, 2000)
-        mock_isdir.assert_called_once_with("/my/dir/path")
-        mock_glob.assert_called_once_with(os.path.join("/my/dir/path", "*"))
-        mock_getmtime.assert_has_calls(
-            [unittest.mock.call("file1.txt"), unittest.mock.call("file2.txt")]
+import fiftyone as fo
+import fiftyone.operators.decorators as fopd
+from fiftyone.operators.decorators import (
+    clear_plugins_cache,
+    plugins_state,
+)
+from fiftyone.operators.registry import OperatorRegistry
+import fiftyone.plugins as fop
+
+
+_PLUGIN_YML = """name: test/plugin
+operators:
+  - test_operator
+"""
+
+_PLUGIN_INIT = """import fiftyone.operators as foo
+
+
+class TestOperator(foo.Operator):
+    @property
+    def config(self):
+        return foo.OperatorConfig(name="test_operator", label="%s")
+
+
+def register(p):
+    p.register(TestOperator)
+"""
+
+
+class PluginsCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.plugins_dir = os.path.join(self._tmp_dir.name, "plugins")
+        self.plugin_dir = os.path.join(self.plugins_dir, "test-plugin")
+        os.makedirs(self.plugin_dir)
+
+        with open(os.path.join(self.plugin_dir, "fiftyone.yml"), "w") as f:
+            f.write(_PLUGIN_YML)
+
+        self._write_plugin("Test operator")
+
+        app_config_path = os.path.join(self._tmp_dir.name, "app_config.json")
+        self._patches = [
+            patch.dict(
+                os.environ, {"FIFTYONE_APP_CONFIG_PATH": app_config_path}
+            ),
+            patch.object(fo.config, "plugins_dir", self.plugins_dir),
+            patch.object(fo.config, "plugins_cache_enabled", True),
+        ]
+        for p in self._patches:
+            p.start()
+
+        clear_plugins_cache()
+
+    def tearDown(self):
+        for p in reversed(self._patches):
+            p.stop()
+
+        clear_plugins_cache()
+        self._tmp_dir.cleanup()
+
+    def _write_plugin(self, label):
+        init_path = os.path.join(self.plugin_dir, "__init__.py")
+        with open(init_path, "w") as f:
+            f.write(_PLUGIN_INIT % label)
+
+        # Ensure that the modification is visible regardless of the
+        # resolution of the filesystem's timestamps
+        mtime_ns = time.time_ns() + len(label)
+        os.utime(init_path, ns=(mtime_ns, mtime_ns))
+
+    def test_plugins_state(self):
+        state1 = plugins_state(self.plugins_dir)
+        self.assertEqual(state1, plugins_state(self.plugins_dir))
+
+        self._write_plugin("Modified operator")
+        state2 = plugins_state(self.plugins_dir)
+        self.assertNotEqual(state1, state2)
+
+        # Bytecode caches don't affect the state
+        os.makedirs(os.path.join(self.plugin_dir, "__pycache__"))
+        self.assertEqual(state2, plugins_state(self.plugins_dir))
+
+    def test_plugins_cache(self):
+        uri = "test/plugin/test_operator"
+
+        with patch.object(
+            fopd, "plugins_state", wraps=fopd.plugins_state
+        ) as state:
+            registry1 = OperatorRegistry()
+            registry2 = OperatorRegistry()
+
+        # Plugins are scanned once per registry
+        self.assertEqual(state.call_count, 2)
+
+        # Each registry has its own operators, but plugin modules are only
+        # executed once
+        operator1 = registry1.get_operator(uri)
+        operator2 = registry2.get_operator(uri)
+        self.assertIsNot(operator1, operator2)
+        self.assertIs(type(operator1), type(operator2))
+
+        registry = OperatorRegistry(enabled="all")
+        self.assertIs(type(registry.get_operator(uri)), type(operator1))
+
+        registry = OperatorRegistry()
+        self.assertTrue(registry.operator_exists(uri))
+        self.assertEqual(
+            registry.get_operator(uri).config.label, "Test operator"
         )
+        self.assertIsNone(registry.get_operator("test/plugin/missing"))
+
+        # Modifying a plugin's source invalidates the cache
+        self._write_plugin("Modified operator")
+        registry = OperatorRegistry()
+        self.assertEqual(
+            registry.get_operator(uri).config.label, "Modified operator"
+        )
+
+        # Disabling a plugin invalidates the cache
+        fop.disable_plugin("test/plugin")
+        self.assertFalse(OperatorRegistry().operator_exists(uri))
+
+        fop.enable_plugin("test/plugin")
+        self.assertTrue(OperatorRegistry().operator_exists(uri))
@@ -6,14 +6,26 @@ FiftyOne server-related unit tests.
 |
 """
 import math
+import struct
 import unittest
 
+from bson import json_util
+from starlette.requests import Request
+
+import numpy as np
+
 import fiftyone as fo
+import fiftyone.brain as fob  # pylint: disable=import-error,no-name-in-module
 import fiftyone.core.dataset as fod
 import fiftyone.core.labels as fol
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
+import fiftyone.server.aggregate as fosa
+import fiftyone.server.routes.embeddings as fosre
+import fiftyone.server.routes.frames as fosrf
+import fiftyone.server.utils as fosu
 import fiftyone.server.view as fosv
+from fiftyone import ViewField as F
 from fiftyone.server.samples import paginate_samples
 
 from decorators import drop_datasets
@@ -803,8 +815,83 @@ class ServerViewTests(unittest.TestCase):
         )
         self.assertEqual(second_view.first().id, second.id)
 
+    @drop_datasets
+    def test_get_view_revisions(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [fos.Sample(filepath="image%d.png" % i, value=i) for i in range(5)]
+        )
+        stages = [fo.Match(F("value") > 1)._serialize()]
+
+        view1 = fosv.get_view(dataset.name, stages=stages)
+        num_views = len(fosv._views)
+        view2 = fosv.get_view(dataset.name, stages=stages)
+
+        self.assertIsNot(view1, view2)
+        self.assertEqual(view1, view2)
+        self.assertEqual(len(view2), 3)
+        self.assertEqual(len(fosv._views), num_views)
+
+        # Datasets are not reloaded unless their revision changes
+        conn = foo.get_db_conn()
+        conn.datasets.update_one(
+            {"name": dataset.name}, {"$set": {"info": {"key": "value"}}}
+        )
+
+        fosv.get_view(dataset.name, stages=stages)
+        self.assertDictEqual(dataset.info, {})
+
+        conn.datasets.update_one(
+            {"name": dataset.name}, {"$inc": {"revision": 1}}
+        )
+
+        view3 = fosv.get_view(dataset.name, stages=stages)
+        self.assertDictEqual(dataset.info, {"key": "value"})
+        self.assertEqual(len(fosv._views), num_views + 1)
+
+        dataset.set_values("value", [0, 0, 0, 0, 5])
+        self.assertEqual(len(fosv.get_view(dataset.name, stages=stages)), 1)
+        self.assertEqual(len(view3), 1)
+
+
+class RevisionCacheTests(unittest.TestCase):
+    def test_revision_cache(self):
+        cache = fosu.RevisionCache(8, getsizeof=len)
+
+        # Results without keys are not cached
+        cache.set(None, b"abc")
+        self.assertIsNone(cache.get(None))
+        self.assertNotIn(None, cache)
+
+        cache.set(("dataset", 1), b"abc")
+        self.assertIn(("dataset", 1), cache)
+        self.assertEqual(cache.get(("dataset", 1)), b"abc")
+        self.assertIsNone(cache.get(("dataset", 2)))
+
+        # Results larger than the cache are not cached
+        cache.set(("dataset", 2), b"abcdefghi")
+        self.assertNotIn(("dataset", 2), cache)
+
+        # Older results are evicted first
+        cache.set(("dataset", 3), b"abcdef")
+        self.assertNotIn(("dataset", 1), cache)
+        self.assertIn(("dataset", 3), cache)
+
+        self.assertDictEqual(
+            cache.stats(), {"hits": 1, "misses": 1, "size": 6, "max_size": 8}
+        )
+
+        cache.clear()
+        self.assertDictEqual(
+            cache.stats(), {"hits": 0, "misses": 0, "size": 0, "max_size": 8}
+        )
+
 
 class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        # Async database clients are bound to the event loop of each test
+        foo.reset_db_conn()
+
     @drop_datasets
     async def test_disjoint_groups(self):
         dataset, first, second = make_disjoint_groups_dataset()
@@ -838,3 +925,351 @@ class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(len(second_samples.edges), 1)
         self.assertEqual(second_samples.edges[0].node.id, second._id)
+
+    async def test_paginate_samples(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(filepath="image%d.png" % i, value=i % 3)
+                for i in range(10)
+            ]
+        )
+        dataset.add_sample(fos.Sample(filepath="image10.png"))
+
+        ids = dataset.values("id")
+        values = dataset.values("value")
+        nones = [_id for _id, v in zip(ids, values) if v is None]
+        _sorted = lambda reverse: [
+            _id
+            for _, _id in sorted(
+                ((v, _id) for _id, v in zip(ids, values) if v is not None),
+                key=lambda x: (-x[0], x[1]) if reverse else x,
+            )
+        ]
+
+        tests = [
+            ([], ids, True),
+            ([fo.SortBy("value")], nones + _sorted(False), True),
+            ([fo.SortBy("value", reverse=True)], _sorted(True) + nones, True),
+            (
+                [fo.Shuffle(seed=51)],
+                dataset.shuffle(seed=51).values("id"),
+                False,
+            ),
+        ]
+
+        for stages, expected, keyset in tests:
+            stages = [stage._serialize() for stage in stages]
+            for use_end_cursor in (True, False):
+                results = []
+                after = None
+                while True:
+                    samples = await paginate_samples(
+                        dataset.name,
+                        stages,
+                        {},
+                        first=3,
+                        after=after,
+                        pagination_data=True,
+                    )
+                    results.extend(samples.edges)
+                    if not samples.page_info.has_next_page:
+                        break
+
+                    if use_end_cursor:
+                        after = samples.page_info.end_cursor
+                        self.assertEqual(not after.isdigit(), keyset)
+                    else:
+                        after = samples.edges[-1].cursor
+
+                self.assertListEqual(
+                    [str(edge.node.id) for edge in results], expected
+                )
+                self.assertListEqual(
+                    [edge.cursor for edge in results],
+                    [str(i) for i in range(len(expected))],
+                )
+
+    async def test_paginate_samples_natural_order(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [fos.Sample(filepath="image%d.png" % i) for i in range(5)]
+        )
+        ids = dataset.values("id")
+
+        # Reinsert the samples so that their natural order does not follow
+        # their IDs
+        docs = list(dataset._sample_collection.find())
+        dataset._sample_collection.delete_many({})
+        dataset._sample_collection.insert_many(docs[::-1])
+
+        # Unsorted views are paginated via keysets in `_id` order, while views
+        # whose order is defined by their stages fall back to offsets
+        tests = [
+            ([fo.Exists("filepath")], ids, True),
+            ([fo.Limit(5)], dataset.limit(5).values("id"), False),
+        ]
+        for stages, expected, keyset in tests:
+            stages = [stage._serialize() for stage in stages]
+            results = []
+            after = None
+            while True:
+                samples = await paginate_samples(
+                    dataset.name,
+                    stages,
+                    {},
+                    first=2,
+                    after=after,
+                    pagination_data=True,
+                )
+                results.extend(str(edge.node.id) for edge in samples.edges)
+                if not samples.page_info.has_next_page:
+                    break
+
+                after = samples.page_info.end_cursor
+                self.assertEqual(not after.isdigit(), keyset)
+
+            self.assertListEqual(results, expected)
+
+    async def test_paginate_samples_cache(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [fos.Sample(filepath="image%d.png" % i, value=i) for i in range(6)]
+        )
+
+        stages = [fo.SortBy("value")._serialize()]
+
+        async def paginate(after):
+            samples = await paginate_samples(
+                dataset.name,
+                stages,
+                {},
+                first=2,
+                after=after,
+                pagination_data=True,
+            )
+            return [str(edge.node.id) for edge in samples.edges]
+
+        await paginate(None)
+
+        # Offset cursors must not resolve to positions cached before the
+        # dataset was modified
+        dataset.delete_samples(dataset.sort_by("value").first())
+
+        results = await paginate("1")
+        self.assertListEqual(
+            results, dataset.sort_by("value").values("id")[2:4]
+        )
+
+    async def test_aggregate_cache(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [fos.Sample(filepath="image%d.png" % i, value=i) for i in range(5)]
+        )
+
+        aggregations = [
+            fosa.Aggregate(count=fosa.Count(field="value")),
+            fosa.Aggregate(
+                histogram_values=fosa.HistogramValues(field="value")
+            ),
+        ]
+
+        async def aggregate():
+            return await fosa.AggregateQuery().aggregate(
+                dataset_name=dataset.name,
+                view=[],
+                aggregations=aggregations,
+            )
+
+        fosa.clear_cache()
+
+        count, histogram = await aggregate()
+        self.assertEqual(count.count, 5)
+        self.assertEqual(sum(histogram.counts), 5)
+        self.assertDictEqual(
+            fosa.get_cache_stats(),
+            {"hits": 0, "misses": 2, "size": 2, "max_size": 4096},
+        )
+
+        count, histogram = await aggregate()
+        self.assertEqual(count.count, 5)
+        self.assertEqual(fosa.get_cache_stats()["hits"], 2)
+
+        # Modifying the dataset invalidates the cache
+        dataset.set_values("value", [0, 0, 0, None, None])
+
+        count, histogram = await aggregate()
+        self.assertEqual(count.count, 3)
+        self.assertListEqual(histogram.counts, [3])
+        self.assertEqual(fosa.get_cache_stats()["misses"], 4)
+
+        sample = dataset.first()
+        sample["value"] = None
+        sample.save()
+
+        count, _ = await aggregate()
+        self.assertEqual(count.count, 2)
+
+        dataset.delete()
+
+    async def test_frames_cache(self):
+        dataset = fod.Dataset()
+        sample = fos.Sample(filepath="video.mp4")
+        for frame_number in range(1, 11):
+            sample.frames[frame_number] = fo.Frame(value=frame_number)
+
+        dataset.add_sample(sample)
+
+        async def get_frames(frame_number):
+            request = _make_request(
+                {
+                    "frameNumber": frame_number,
+                    "numFrames": 3,
+                    "frameCount": 10,
+                    "sampleId": sample.id,
+                    "dataset": dataset.name,
+                    "view": [],
+                }
+            )
+            response = await fosrf.Frames.post(None, request)
+            return json_util.loads(response.body)
+
+        fosrf.clear_cache()
+
+        result = await get_frames(1)
+        self.assertListEqual(result["range"], [1, 4])
+        self.assertListEqual(
+            [f["value"] for f in result["frames"]], [1, 2, 3, 4]
+        )
+
+        stats = fosrf.get_cache_stats()
+        self.assertEqual(stats["hits"], 0)
+        self.assertEqual(stats["misses"], 1)
+
+        # The next chunk was prefetched
+        result = await get_frames(5)
+        self.assertListEqual(result["range"], [5, 8])
+        self.assertListEqual(
+            [f["value"] for f in result["frames"]], [5, 6, 7, 8]
+        )
+        self.assertEqual(fosrf.get_cache_stats()["hits"], 1)
+
+        result = await get_frames(1)
+        self.assertListEqual(result["range"], [1, 4])
+        self.assertEqual(fosrf.get_cache_stats()["hits"], 2)
+
+        # Writing frames invalidates the cache
+        sample.frames[1]["value"] = 100
+        sample.save()
+
+        result = await get_frames(1)
+        self.assertEqual(result["frames"][0]["value"], 100)
+        self.assertEqual(fosrf.get_cache_stats()["misses"], 2)
+
+        dataset.delete()
+
+    @drop_datasets
+    async def test_embeddings_plot(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(filepath="image%d.png" % i, label=str(i % 3))
+                for i in range(9)
+            ]
+        )
+
+        points = np.random.randn(9, 2)
+        fob.compute_visualization(dataset, points=points, brain_key="viz")
+
+        ids = dataset.values("id")
+        labels = dataset.values("label")
+
+        async def load_plot(label_field, format=None):
+            request = _make_request(
+                {
+                    "datasetName": dataset.name,
+                    "brainKey": "viz",
+                    "view": [],
+                    "labelField": label_field,
+                    "slices": None,
+                    "format": format,
+                }
+            )
+            return await fosre.OnPlotLoad.post(None, request)
+
+        # Categorical plot
+        response = await load_plot("label")
+        plot = json_util.loads(response.body)
+
+        self.assertEqual(plot["style"], "categorical")
+        self.assertListEqual(list(plot["traces"].keys()), ["0", "1", "2"])
+        for key, trace in plot["traces"].items():
+            inds = [i for i, l in enumerate(labels) if l == key]
+            self.assertListEqual(
+                [d["id"] for d in trace], [ids[i] for i in inds]
+            )
+            self.assertListEqual(
+                [d["sample_id"] for d in trace], [ids[i] for i in inds]
+            )
+            self.assertListEqual(
+                [d["label"] for d in trace], [key] * len(inds)
+            )
+            np.testing.assert_allclose(
+                [d["points"] for d in trace], points[inds]
+            )
+
+        # The plot cache is bounded by the size of its plots
+        stats = fosre._plot_cache.stats()
+        self.assertGreater(stats["size"], points.nbytes)
+        self.assertEqual(stats["max_size"], fosre._PLOT_CACHE_MAX_BYTES)
+
+        # Binary plot
+        response = await load_plot("label", format="binary")
+        self.assertEqual(response.media_type, "application/octet-stream")
+
+        body = response.body
+        (header_len,) = struct.unpack("<I", body[:4])
+        header = json_util.loads(body[4 : 4 + header_len])
+        self.assertEqual(header["style"], "categorical")
+        self.assertFalse(header["has_sample_ids"])
+        self.assertListEqual(
+            [(t["key"], t["count"], t["label"]) for t in header["traces"]],
+            [("0", 3, "0"), ("1", 3, "1"), ("2", 3, "2")],
+        )
+
+        offset = 4 + header_len
+        _points = np.frombuffer(body, dtype="<f4", count=18, offset=offset)
+        _ids = body[offset + 72 :].hex()
+        order = [0, 3, 6, 1, 4, 7, 2, 5, 8]
+
+        np.testing.assert_allclose(
+            _points.reshape(-1, 2), points[order], rtol=1e-6
+        )
+        self.assertListEqual(
+            [_ids[24 * i : 24 * (i + 1)] for i in range(9)],
+            [ids[i] for i in order],
+        )
+
+        # Uncolored plot
+        response = await load_plot(None)
+        plot = json_util.loads(response.body)
+
+        self.assertEqual(plot["style"], "uncolored")
+        self.assertListEqual(list(plot["traces"].keys()), ["points"])
+        self.assertListEqual([d["id"] for d in plot["traces"]["points"]], ids)
+
+        # Modifying the dataset invalidates the cached plot
+        dataset.set_values("label", ["0"] * 9)
+
+        response = await load_plot("label")
+        plot = json_util.loads(response.body)
+        self.assertListEqual(list(plot["traces"].keys()), ["0"])
+
+
+def _make_request(data):
+    body = json_util.dumps(data).encode()
+
+    async def receive():
+        return {"type": "http.request", "body": body}
+
+    return Request({"type": "http", "method": "POST"}, receive)
@@ -5,6 +5,9 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+import subprocess
+import sys
 import time
 import unittest
 
@@ -213,6 +216,105 @@ class SerializationTests(unittest.TestCase):
 
         self.assertDictEqual(s1.to_dict(), s2.to_dict())
 
+    def test_numpy_array_codecs(self):
+        arrays = [
+            np.arange(5),
+            np.random.randn(3, 4).astype(np.float32),
+            np.asfortranarray(np.random.randn(2, 3)),
+            np.zeros((0, 3), dtype=np.uint8),
+            np.array(3.5),
+            np.array([1, 2, 3], dtype=">i4"),
+        ]
+
+        for codec in (None, "zlib", "raw"):
+            for array in arrays:
+                b = fou.serialize_numpy_array(array, codec=codec)
+                a = fou.deserialize_numpy_array(b)
+                self.assertEqual(a.shape, array.shape)
+                self.assertTrue(np.array_equal(a, array))
+
+                s = fou.serialize_numpy_array(array, ascii=True, codec=codec)
+                a = fou.deserialize_numpy_array(s, ascii=True)
+                self.assertTrue(np.array_equal(a, array))
+
+        with self.assertRaises(ValueError):
+            fou.serialize_numpy_array(np.arange(5), codec="unsupported")
+
+    @drop_datasets
+    def test_array_field_codecs(self):
+        dataset = fo.Dataset()
+        dataset.add_sample_field("vector", fo.VectorField, codec="raw")
+        dataset.add_sample_field("array", fo.ArrayField, codec="raw")
+        dataset.add_sample_field("legacy", fo.VectorField)
+
+        vector = np.random.randn(16).astype(np.float32)
+        array = np.random.randn(2, 3)
+
+        sample = fo.Sample(
+            filepath="image.jpg", vector=vector, array=array, legacy=vector
+        )
+        dataset.add_sample(sample)
+
+        schema = dataset.get_field_schema()
+        self.assertEqual(schema["vector"].codec, "raw")
+        self.assertEqual(schema["array"].codec, "raw")
+        self.assertIsNone(schema["legacy"].codec)
+
+        d = dataset._sample_collection.find_one({"_id": sample._id})
+        self.assertTrue(d["vector"].startswith(fou._RAW_ARRAY_MAGIC))
+        self.assertFalse(d["legacy"].startswith(fou._RAW_ARRAY_MAGIC))
+
+        dataset.reload()
+        sample.reload(hard=True)
+
+        schema = dataset.get_field_schema()
+        self.assertEqual(schema["vector"].codec, "raw")
+        self.assertEqual(schema["array"].codec, "raw")
+
+        self.assertTrue(np.array_equal(sample.vector, vector))
+        self.assertTrue(np.array_equal(sample.array, array))
+        self.assertTrue(np.array_equal(sample.legacy, vector))
+        self.assertTrue(np.array_equal(dataset.values("vector")[0], vector))
+
+        with self.assertRaises(ValueError):
+            dataset.add_sample_field("bad", fo.VectorField, codec="bad")
+
+        # Codecs are preserved when samples are added to other datasets
+        dataset2 = fo.Dataset()
+        dataset2.add_samples(dataset)
+
+        schema = dataset2.get_field_schema()
+        self.assertEqual(schema["vector"].codec, "raw")
+        self.assertEqual(schema["array"].codec, "raw")
+        self.assertIsNone(schema["legacy"].codec)
+
+        d = dataset2._sample_collection.find_one()
+        self.assertTrue(d["vector"].startswith(fou._RAW_ARRAY_MAGIC))
+        self.assertTrue(np.array_equal(dataset2.first().vector, vector))
+
+    @drop_datasets
+    def test_frame_array_field_codecs(self):
+        dataset = fo.Dataset()
+        dataset.media_type = "video"
+        dataset.add_frame_field("vector", fo.VectorField, codec="raw")
+
+        vector = np.random.randn(16).astype(np.float32)
+
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(vector=vector)
+        dataset.add_sample(sample)
+
+        dataset2 = fo.Dataset()
+        dataset2.add_samples(dataset)
+
+        schema = dataset2.get_frame_field_schema()
+        self.assertEqual(schema["vector"].codec, "raw")
+
+        d = dataset2._frame_collection.find_one()
+        self.assertTrue(d["vector"].startswith(fou._RAW_ARRAY_MAGIC))
+        frame = dataset2.first().frames.first()
+        self.assertTrue(np.array_equal(frame.vector, vector))
+
 
 class MediaTypeTests(unittest.TestCase):
     @drop_datasets
@@ -306,6 +408,78 @@ class UIDTests(unittest.TestCase):
         self.assertTrue(foui._import_logged)
 
 
+class ImportTests(unittest.TestCase):
+    def test_lazy_import(self):
+        code = "\n".join(
+            [
+                "import sys",
+                "import fiftyone as fo",
+                "import fiftyone.core.odm.database as fodb",
+                "assert fodb._client is None",
+                "assert 'fiftyone.core.plots' not in sys.modules",
+                "assert 'fiftyone.core.models' not in sys.modules",
+                "assert 'fiftyone.core.session' not in sys.modules",
+                "assert 'evaluate_detections' in dir(fo)",
+                "fo.evaluate_detections",
+                "assert 'fiftyone.core.plots' in sys.modules",
+                "fo.list_datasets()",
+                "assert fodb._client is not None",
+            ]
+        )
+
+        env = dict(os.environ, FIFTYONE_DO_NOT_TRACK="true")
+        subprocess.check_call([sys.executable, "-c", code], env=env)
+
+        with self.assertRaises(AttributeError):
+            fo.not_a_fiftyone_attribute
+
+    def test_lazy_subpackages(self):
+        code = "\n".join(
+            [
+                "import fiftyone as fo",
+                "assert fo.types.FiftyOneDataset is not None",
+                "assert fo.utils.__name__ == 'fiftyone.utils'",
+                "assert fo.zoo.load_zoo_dataset is not None",
+                "assert 'evaluate_detections' in fo.__all__",
+                "assert 'launch_app' in fo.__all__",
+                "assert 'Dataset' in fo.__all__",
+                "from fiftyone import *",
+                "assert types.FiftyOneDataset is not None",
+                "assert utils.__name__ == 'fiftyone.utils'",
+                "assert zoo.load_zoo_dataset is not None",
+            ]
+        )
+
+        env = dict(os.environ, FIFTYONE_DO_NOT_TRACK="true")
+        subprocess.check_call([sys.executable, "-c", code], env=env)
+
+    @drop_datasets
+    def test_non_persistent_cleanup_at_exit(self):
+        # Automatic cleanup only happens when no other clients (like this
+        # one) are connected, so we run the same cleanup at exit explicitly
+        code = "\n".join(
+            [
+                "import atexit",
+                "import fiftyone as fo",
+                "import fiftyone.core.dataset as fod",
+                "dataset = fo.Dataset()",
+                "dataset.add_sample(fo.Sample(filepath='image.jpg'))",
+                "atexit.register(fod.delete_non_persistent_datasets)",
+                "print(dataset.name)",
+            ]
+        )
+
+        env = dict(os.environ, FIFTYONE_DO_NOT_TRACK="true")
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True
+        )
+        name = out.stdout.decode().strip().splitlines()[-1]
+
+        self.assertEqual(out.returncode, 0)
+        self.assertNotIn("Traceback", out.stderr.decode())
+        self.assertNotIn(name, fo.list_datasets())
+
+
 class ConfigTests(unittest.TestCase):
     def test_multiple_config_cleanup(self):
         db = foo.get_db_conn()
@@ -7,13 +7,18 @@ FiftyOne video-related unit tests.
 """
 from copy import deepcopy
 from datetime import date, datetime
+import os
 
 from bson import ObjectId
 import numpy as np
 import unittest
+from unittest.mock import patch
+
+import eta.core.utils as etau
 
 import fiftyone as fo
 import fiftyone.core.odm as foo
+import fiftyone.utils.video as fouv
 from fiftyone import ViewField as F
 
 from decorators import drop_datasets
@@ -3224,6 +3229,99 @@ class VideoTests(unittest.TestCase):
         schema = trajectories.get_frame_field_schema()
         self.assertIn("detections", schema)
 
+    @drop_datasets
+    def test_transform_videos_num_workers(self):
+        with etau.TempDir() as tmp_dir:
+            input_dir = os.path.join(tmp_dir, "input")
+            output_dir = os.path.join(tmp_dir, "output")
+
+            samples = []
+            for i in range(5):
+                filepath = os.path.join(input_dir, "video%d.mp4" % i)
+                etau.write_file(b"", filepath)
+                samples.append(fo.Sample(filepath=filepath, index=i))
+
+            dataset = fo.Dataset()
+            dataset.add_samples(samples)
+
+            # Videos are copied, since no transformations are required
+            fouv.transform_videos(
+                dataset,
+                output_field="output_filepath",
+                output_dir=output_dir,
+                num_workers=3,
+            )
+
+            self.assertListEqual(
+                dataset.values("output_filepath"),
+                [
+                    os.path.join(output_dir, "video%d.mp4" % i)
+                    for i in range(5)
+                ],
+            )
+            for filepath in dataset.values("output_filepath"):
+                self.assertTrue(os.path.isfile(filepath))
+
+    @drop_datasets
+    def test_transform_videos_shared_inputs(self):
+        with etau.TempDir() as tmp_dir:
+            input_dir = os.path.join(tmp_dir, "input")
+            output_dir = os.path.join(tmp_dir, "output")
+
+            samples = []
+            for i in range(6):
+                filepath = os.path.join(input_dir, "video%d.mp4" % (i % 2))
+                etau.write_file(b"", filepath)
+                samples.append(fo.Sample(filepath=filepath, index=i))
+
+            dataset = fo.Dataset()
+            dataset.add_samples(samples)
+
+            calls = []
+            _transform_video = fouv._transform_video
+
+            def _record(inpath, outpath, **kwargs):
+                calls.append((inpath, kwargs["threads"]))
+                _transform_video(inpath, outpath, **kwargs)
+
+            # Videos are processed serially by default
+            with patch.object(fouv, "_transform_video", _record):
+                fouv.transform_videos(
+                    dataset.limit(1),
+                    output_field="output_filepath",
+                    output_dir=os.path.join(tmp_dir, "serial"),
+                )
+
+            self.assertEqual(len(calls), 1)
+            self.assertIsNone(calls[0][1])
+
+            calls.clear()
+
+            # Each video is only transformed once, so deleting the originals
+            # does not break the other samples that share them
+            with patch.object(fouv, "_transform_video", _record):
+                fouv.transform_videos(
+                    dataset,
+                    output_field="output_filepath",
+                    output_dir=output_dir,
+                    delete_originals=True,
+                    num_workers=2,
+                )
+
+            self.assertEqual(len(calls), 2)
+            for _, threads in calls:
+                self.assertGreaterEqual(threads, 1)
+
+            self.assertListEqual(
+                dataset.values("output_filepath"),
+                [
+                    os.path.join(output_dir, "video%d.mp4" % (i % 2))
+                    for i in range(6)
+                ],
+            )
+            for filepath in dataset.values("output_filepath"):
+                self.assertTrue(os.path.isfile(filepath))
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
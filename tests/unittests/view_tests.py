@@ -5,7 +5,7 @@ FiftyOne view-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import date, datetime, timedelta
 import math
 
@@ -85,6 +85,14 @@ class DatasetViewTests(unittest.TestCase):
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
         self.assertEqual(first_sample.int, 4)
 
+        with view.save_context(batch_size=7, async_writes=True) as context:
+            for idx, sample in enumerate(view):
+                sample["int"] = idx + 5
+                context.save(sample)
+
+        self.assertTupleEqual(dataset.bounds("int"), (5, 54))
+        self.assertEqual(first_sample.int, 5)
+
     @drop_datasets
     def test_view(self):
         dataset = fo.Dataset()
@@ -312,6 +320,124 @@ class DatasetViewTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             view.reload()
 
+    @drop_datasets
+    def test_pipeline_cache(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpg",
+                    ground_truth=fo.Classification(label="cat"),
+                ),
+                fo.Sample(
+                    filepath="image2.jpg",
+                    ground_truth=fo.Classification(label="dog"),
+                ),
+            ]
+        )
+
+        view = dataset.match(F("ground_truth.label") == "cat")
+
+        pipeline = view._pipeline()
+        stage_pipelines = view._get_stage_pipelines()
+        self.assertIs(view._get_stage_pipelines(), stage_pipelines)
+        self.assertListEqual(view._pipeline(), pipeline)
+
+        # Copies regenerate their pipelines
+        for view_copy in (copy(view), deepcopy(view)):
+            self.assertIsNone(view_copy._stage_pipelines_cache)
+            self.assertListEqual(view_copy._pipeline(), pipeline)
+
+        # Schema changes must invalidate cached pipelines
+        revision = dataset._doc.revision
+        dataset.add_sample_field("ground_truth_copy", fo.StringField)
+        self.assertGreater(dataset._doc.revision, revision)
+        self.assertIsNot(view._get_stage_pipelines(), stage_pipelines)
+
+        view2 = dataset.exclude_fields("ground_truth_copy")
+        self.assertEqual(view2.count(), 2)
+
+        dataset.delete_sample_field("ground_truth_copy")
+        self.assertNotIn("ground_truth_copy", view.get_field_schema())
+        self.assertEqual(view.count(), 1)
+
+    @drop_datasets
+    def test_optimize_pipeline(self):
+        pipeline = [
+            {"$addFields": {"foo": "$bar"}},
+            {"$match": {"spam": {"$gt": 1}}},
+            {"$match": {"$expr": {"$lt": ["$eggs", 2]}}},
+            {"$match": {"foo": 1}},
+            {"$project": {"a": False}},
+            {"$project": {"b": False}},
+            {"$project": {"c": True}},
+            {"$project": {"c": True}},
+            {"$lookup": {"from": "frames", "as": "frames"}},
+            {"$limit": 5},
+        ]
+
+        optimized = fov.optimize_pipeline(pipeline)
+
+        self.assertListEqual(
+            optimized,
+            [
+                {
+                    "$match": {
+                        "$and": [
+                            {"spam": {"$gt": 1}},
+                            {"$expr": {"$lt": ["$eggs", 2]}},
+                        ]
+                    }
+                },
+                {"$addFields": {"foo": "$bar"}},
+                {"$match": {"foo": 1}},
+                {"$limit": 5},
+                {"$project": {"a": False, "b": False}},
+                {"$project": {"c": True}},
+                {"$lookup": {"from": "frames", "as": "frames"}},
+            ],
+        )
+
+        # The input pipeline is not modified
+        self.assertEqual(len(pipeline), 10)
+        self.assertDictEqual(pipeline[1], {"$match": {"spam": {"$gt": 1}}})
+
+        # Matches whose dependencies can't be determined are not moved
+        pipeline = [
+            {"$addFields": {"foo": "$bar"}},
+            {"$match": {"$expr": {"$gt": [{"$size": "$$ROOT"}, 1]}}},
+            {"$project": {"a": False}},
+            {"$project": {"a.b": False}},
+        ]
+        self.assertListEqual(fov.optimize_pipeline(pipeline), pipeline)
+
+    @drop_datasets
+    def test_explain(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath="image%d.jpg" % i, foo=i, bar=i)
+                for i in range(10)
+            ]
+        )
+
+        view = (
+            dataset.set_field("bar", F("foo") * 2)
+            .match(F("foo") > 2)
+            .match(F("foo") < 8)
+            .limit(3)
+        )
+
+        explain = view.explain()
+
+        self.assertEqual(len(explain["pipeline"]), 4)
+        self.assertEqual(len(explain["optimized_pipeline"]), 3)
+        self.assertIn("$match", explain["optimized_pipeline"][0])
+        self.assertIn("$limit", explain["optimized_pipeline"][1])
+
+        self.assertEqual(view.count(), 3)
+        self.assertListEqual(view.values("bar"), [6, 8, 10])
+
 
 class ViewFieldTests(unittest.TestCase):
     @skip_windows  # TODO: don't skip on Windows
@@ -4114,6 +4240,55 @@ class ViewStageTests(unittest.TestCase):
         result = list(self.dataset.take(1))
         self.assertIs(len(result), 1)
 
+    def test_take_use_index(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, index=i) for i in range(20)]
+        )
+
+        view = dataset.take(5, seed=51, use_index=True)
+        values = view.values("index")
+
+        self.assertEqual(len(values), 5)
+        self.assertEqual(len(set(values)), 5)
+        self.assertIn("_rand", dataset.list_indexes())
+
+        # Results are reproducible for a given seed
+        view2 = dataset.take(5, seed=51, use_index=True)
+        self.assertListEqual(view2.values("index"), values)
+
+        view3 = fo.DatasetView._build(dataset, view._serialize())
+        self.assertListEqual(view3.values("index"), values)
+
+        # Requesting more samples than exist wraps around
+        view = dataset.take(50, seed=51, use_index=True)
+        self.assertEqual(len(view), 20)
+        self.assertEqual(len(set(view.values("index"))), 20)
+
+        # Falls back to the default implementation after other stages
+        view = dataset.match(F("index") >= 10).take(5, use_index=True)
+        values = view.values("index")
+        self.assertEqual(len(values), 5)
+        self.assertTrue(all(v >= 10 for v in values))
+
+    def test_shuffle_use_index(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, index=i) for i in range(20)]
+        )
+
+        view = dataset.shuffle(seed=51, use_index=True)
+        values = view.values("index")
+
+        self.assertEqual(len(values), 20)
+        self.assertSetEqual(set(values), set(range(20)))
+
+        view2 = dataset.shuffle(seed=51, use_index=True)
+        self.assertListEqual(view2.values("index"), values)
+
+        view = dataset.match(F("index") < 5).shuffle(use_index=True)
+        self.assertSetEqual(set(view.values("index")), set(range(5)))
+
     def test_uuids(self):
         stage = fosg.Take(1)
         stage_dict = stage._serialize()